@@ -37,6 +37,7 @@ __version__ = get_versions()["version"]
 from pyiron_workflow.workflow import Workflow
 
 # Node developer entry points
+from pyiron_workflow.cache import PersistentCache
 from pyiron_workflow.channels import NOT_DATA
 from pyiron_workflow.nodes import standard as standard_nodes
 from pyiron_workflow.nodes.composite import FailedChildError
@@ -0,0 +1,126 @@
+"""
+An on-disk, content-addressed store of node output, so that nodes can skip
+recomputation across python sessions and between freshly instantiated graphs.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import pickle
+import shutil
+from tempfile import NamedTemporaryFile
+from typing import Any, TYPE_CHECKING
+
+import cloudpickle
+
+from pyiron_workflow.fingerprint import FingerprintError, fingerprint_values
+from pyiron_workflow.logging import logger
+
+if TYPE_CHECKING:
+    from pyiron_workflow.node import Node
+
+
+class PersistentCache:
+    """
+    Stores node output values in files named for a key combining the fingerprint of
+    the node's code and the fingerprint of its input values.
+
+    Entries are written atomically, so several processes may safely share the same
+    cache directory.
+
+    Nodes opt in to using a persistent cache by setting their
+    :attr:`pyiron_workflow.node.Node.persistent_cache` attribute to an instance of this
+    class.
+
+    Warning:
+        Keys only reflect the source code of the node itself (e.g. the function of a
+        function node, or the graph creator and children of a macro), not the code of
+        anything _it_ calls. If such dependencies change, clear the cache.
+
+    Attributes:
+        directory (Path): Where to store the cache entries.
+        cloudpickle_fallback (bool): Whether to fall back on :mod:`cloudpickle` when
+            the output cannot be pickled. (Default is True.)
+    """
+
+    _SUFFIX = ".pckl"
+
+    def __init__(
+        self,
+        directory: Path | str = ".pyiron_workflow_cache",
+        cloudpickle_fallback: bool = True,
+    ):
+        self.directory = Path(directory)
+        self.cloudpickle_fallback = cloudpickle_fallback
+
+    def key(self, node: Node, input_fingerprint: str | None = None) -> str | None:
+        """
+        The cache key for a node with its current input.
+
+        Args:
+            node (Node): The node to key.
+            input_fingerprint (str | None): A fingerprint of the node's current input
+                values, if already known. (Default is None, compute it.)
+
+        Returns:
+            (str | None): The key, or None if the node's code or input cannot be
+                fingerprinted.
+        """
+        try:
+            if input_fingerprint is None:
+                input_fingerprint = fingerprint_values(node.inputs.to_value_dict())
+            return node.code_fingerprint + input_fingerprint
+        except FingerprintError as e:
+            logger.debug(f"{node.full_label} cannot use the persistent cache: {e}")
+            return None
+
+    def _path(self, key: str) -> Path:
+        return self.directory.joinpath(key[:2], key).with_suffix(self._SUFFIX)
+
+    def has(self, key: str) -> bool:
+        return self._path(key).is_file()
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        """
+        Args:
+            key (str): The entry to look for.
+
+        Returns:
+            (dict[str, Any] | None): The stored output values, or None if there is no
+                (readable) entry for this key.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                return cloudpickle.load(f)  # Reads regular pickles too
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+    def save(self, key: str, values: dict[str, Any]) -> None:
+        """
+        Args:
+            key (str): The entry to write.
+            values (dict[str, Any]): The output values to store.
+        """
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            data = pickle.dumps(values)
+        except Exception:
+            if not self.cloudpickle_fallback:
+                raise
+            data = cloudpickle.dumps(values)
+        with NamedTemporaryFile(dir=path.parent, delete=False) as f:
+            f.write(data)
+        os.replace(f.name, path)
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Remove all entries (and the cache directory)."""
+        shutil.rmtree(self.directory, ignore_errors=True)
@@ -16,8 +16,9 @@ from pyiron_snippets.singleton import Singleton
 
 from pyiron_workflow.mixin.has_interface_mixins import HasChannel, HasLabel
 from pyiron_workflow.mixin.display_state import HasStateDisplay
+from pyiron_workflow import type_hinting
 from pyiron_workflow.type_hinting import (
-    valid_value,
+    get_validator,
     type_hint_is_as_or_more_specific_than,
 )
 
@@ -144,6 +145,8 @@ class Channel(HasChannel, HasLabel, HasStateDisplay, ABC):
                 # so that connection searches run newest to oldest
                 self.connections.insert(0, other)
                 other.connections.insert(0, self)
+                self._connections_changed()
+                other._connections_changed()
             else:
                 if isinstance(other, self.connection_partner_type):
                     raise ChannelConnectionError(
@@ -178,10 +181,14 @@ class Channel(HasChannel, HasLabel, HasStateDisplay, ABC):
         for other in others:
             if other in self.connections:
                 self.connections.remove(other)
+                self._connections_changed()
                 other.disconnect(self)
                 destroyed_connections.append((self, other))
         return destroyed_connections
 
+    def _connections_changed(self) -> None:
+        """A hook called whenever a connection to this channel forms or breaks."""
+
     def disconnect_all(self) -> list[tuple[Channel, Channel]]:
         """
         Disconnect from all other channels currently in the connections list.
@@ -348,6 +355,11 @@ class DataChannel(Channel, ABC):
         super().__init__(label=label, owner=owner)
         self._value = NOT_DATA
         self._value_receiver = None
+        self._validator = None
+        self._validator_hint = None
+        self._validated_value = NOT_DATA
+        self._validated_hint = None
+        self._validated_collection_check = None
         self.type_hint = type_hint
         self.strict_hints = strict_hints
         self.default = default
@@ -366,17 +378,16 @@ class DataChannel(Channel, ABC):
         self._value = new_value
 
     def _type_check_new_value(self, new_value):
-        if (
-            self.strict_hints
-            and new_value is not NOT_DATA
-            and self._has_hint
-            and not valid_value(new_value, self.type_hint)
-        ):
-            raise TypeError(
-                f"The channel {self.full_label} cannot take the value `{new_value}` "
-                f"({type(new_value)}) because it is not compliant with the type hint "
-                f"{self.type_hint}"
-            )
+        if self.strict_hints and new_value is not NOT_DATA and self._has_hint:
+            if not self._valid_value(new_value):
+                raise TypeError(
+                    f"The channel {self.full_label} cannot take the value "
+                    f"`{new_value}` ({type(new_value)}) because it is not compliant "
+                    f"with the type hint {self.type_hint}"
+                )
+        else:
+            # Don't hang on to old values
+            self._validated_value = NOT_DATA
 
     @property
     def value_receiver(self) -> InputData | OutputData | None:
@@ -425,15 +436,37 @@ class DataChannel(Channel, ABC):
         Check if the currently stored value is data and satisfies the channel's type
         hint (if hint checking is activated).
 
+        Validity is remembered as long as neither the value nor the hint get replaced,
+        so in-place modifications of mutable values are not re-checked.
+
         Returns:
             (bool): Whether the value is data and matches the type hint.
         """
         return self._value_is_data and (
-            valid_value(self.value, self.type_hint)
+            self._valid_value(self.value)
             if self._has_hint and self.strict_hints
             else True
         )
 
+    def _valid_value(self, value) -> bool:
+        if (
+            value is self._validated_value
+            and self.type_hint is self._validated_hint
+            # Validity of items depends on how many of them get checked
+            and type_hinting.collection_check == self._validated_collection_check
+        ):
+            return True
+        if self._validator_hint is not self.type_hint:
+            # Compile (or fetch) the validator once per hint
+            self._validator = get_validator(self.type_hint)
+            self._validator_hint = self.type_hint
+        if self._validator(value):
+            self._validated_value = value
+            self._validated_hint = self.type_hint
+            self._validated_collection_check = type_hinting.collection_check
+            return True
+        return False
+
     @property
     def _value_is_data(self) -> bool:
         return self.value is not NOT_DATA
@@ -458,6 +491,13 @@ class DataChannel(Channel, ABC):
         else:
             return False
 
+    def _connections_changed(self) -> None:
+        # Data connections shape the owner's parent (e.g. which child channels a
+        # workflow exposes as its own IO), so let the parent know
+        parent = getattr(self.owner, "parent", None)
+        if parent is not None:
+            parent._child_data_connections_changed()
+
     def _both_typed(self, other: DataChannel) -> bool:
         return self._has_hint and other._has_hint
 
@@ -478,8 +518,23 @@ class DataChannel(Channel, ABC):
         state["_value_receiver"] = None
         # Value receivers live in the scope of Macros, so (re)storing them is the
         # owning macro's responsibility
+        state["_validator"] = None
+        state["_validator_hint"] = None
+        # Validators are cheap to get back, but not necessarily pickleable
+        state["_validated_value"] = NOT_DATA
+        state["_validated_hint"] = None
+        state["_validated_collection_check"] = None
         return state
 
+    def __setstate__(self, state):
+        # The validator caches are also absent from states saved before they existed
+        state["_validator"] = None
+        state["_validator_hint"] = None
+        state["_validated_value"] = NOT_DATA
+        state["_validated_hint"] = None
+        state["_validated_collection_check"] = None
+        super().__setstate__(state)
+
     def display_state(self, state=None, ignore_private=True):
         state = dict(self.__getstate__()) if state is None else state
         self._make_entry_public(state, "_value", "value")
@@ -550,6 +605,12 @@ class SignalChannel(Channel, ABC):
     def __call__(self) -> None:
         pass
 
+    def _connections_changed(self) -> None:
+        # Signal connections are the execution flow of the owner's parent
+        parent = getattr(self.owner, "parent", None)
+        if parent is not None:
+            parent._child_signal_connections_changed()
+
 
 class BadCallbackError(ValueError):
     pass
@@ -1,6 +1,18 @@
+from __future__ import annotations
+
 from concurrent.futures import Future, ProcessPoolExecutor
 from concurrent.futures.process import _global_shutdown, _WorkItem, BrokenProcessPool
+import hashlib
+from io import BytesIO
+import os
+from pathlib import Path
+import pickle
+import shutil
+import sys
 from sys import version_info
+from tempfile import mkdtemp
+from threading import Lock
+import weakref
 
 import cloudpickle
 
@@ -28,6 +40,146 @@ class _CloudPickledCallable:
         return cloudpickle.dumps(stuff)
 
 
+_Py_TPFLAGS_HEAPTYPE = 1 << 9
+
+
+def _is_importable(cls: type) -> bool:
+    """Whether the class can be pickled by reference, i.e. by its import path."""
+    if not cls.__flags__ & _Py_TPFLAGS_HEAPTYPE:
+        return True  # Statically defined (builtin or extension) types
+    if cls.__module__ == "__main__" or "<locals>" in cls.__qualname__:
+        return False
+    obj = sys.modules.get(cls.__module__)
+    for name in cls.__qualname__.split("."):
+        obj = getattr(obj, name, None)
+    return obj is cls
+
+
+class _ClassRegistry:
+    """
+    Pickles classes which can't be pickled by reference once, and saves them to a
+    directory the worker processes can load them from.
+
+    Classes are keyed by a hash of their pickled bytes.
+    """
+
+    def __init__(self):
+        self.directory = mkdtemp(prefix="pyiron_workflow_classes_")
+        self.classes: dict[str, type] = {}
+        self._keys: dict[type, str | None] = {}
+        self._lock = Lock()
+        self._finalizer = weakref.finalize(
+            self, shutil.rmtree, self.directory, ignore_errors=True
+        )
+
+    def key(self, cls: type) -> str | None:
+        """The key for the class, or None if it can be pickled by reference."""
+        try:
+            return self._keys[cls]
+        except KeyError:
+            pass
+        with self._lock:
+            if cls not in self._keys:
+                if _is_importable(cls):
+                    key = None
+                else:
+                    data = cloudpickle.dumps(cls)
+                    key = hashlib.sha256(data).hexdigest()
+                    path = Path(self.directory, key)
+                    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+                    tmp.write_bytes(data)
+                    tmp.replace(path)  # Atomic, so workers never see partial files
+                    self.classes[key] = cls
+                self._keys[cls] = key
+        return self._keys[cls]
+
+    def clean(self):
+        self._finalizer()
+
+
+class _ClassCachingPickler(cloudpickle.Pickler):
+    """Pickles keyed classes as just their key."""
+
+    def __init__(self, file, key: callable[[type], str | None]):
+        super().__init__(file)
+        self._key = key
+
+    def persistent_id(self, obj):
+        if isinstance(obj, type):
+            return self._key(obj)
+        return None
+
+    @classmethod
+    def dumps(cls, obj, key: callable[[type], str | None]) -> bytes:
+        with BytesIO() as file:
+            cls(file, key).dump(obj)
+            return file.getvalue()
+
+
+class _ClassCachingUnpickler(pickle.Unpickler):
+    """Looks up keyed classes instead of unpickling them."""
+
+    def __init__(self, file, lookup: callable[[str], type]):
+        super().__init__(file)
+        self._lookup = lookup
+
+    def persistent_load(self, pid):
+        return self._lookup(pid)
+
+    @classmethod
+    def loads(cls, data: bytes, lookup: callable[[str], type]):
+        with BytesIO(data) as file:
+            return cls(file, lookup).load()
+
+
+# The classes each worker process has already loaded, kept for the worker's lifetime
+_worker_classes: dict[str, type] = {}
+_worker_class_keys: dict[type, str] = {}
+
+
+def _load_worker_class(directory: str, key: str) -> type:
+    try:
+        return _worker_classes[key]
+    except KeyError:
+        with open(Path(directory, key), "rb") as f:
+            cls = cloudpickle.load(f)
+        _worker_classes[key] = cls
+        _worker_class_keys[cls] = key
+        return cls
+
+
+class _ClassCachingCallable:
+    """
+    Like :class:`_CloudPickledCallable`, but with all keyed classes in the call (and
+    its result) sent by key; workers load each class from the registry directory
+    only the first time they see it.
+    """
+
+    def __init__(self, registry: _ClassRegistry, fnc: callable, args, kwargs):
+        self.directory = registry.directory
+        self.call_serial = _ClassCachingPickler.dumps((fnc, args, kwargs), registry.key)
+
+    def __call__(self):
+        fnc, args, kwargs = _ClassCachingUnpickler.loads(
+            self.call_serial, lambda key: _load_worker_class(self.directory, key)
+        )
+        return _ClassCachingPickler.dumps(fnc(*args, **kwargs), _worker_class_keys.get)
+
+
+class _ClassCachingFuture(Future):
+    def __init__(self, registry: _ClassRegistry):
+        super().__init__()
+        self._registry = registry
+
+    def result(self, timeout=None):
+        result = super().result(timeout=timeout)
+        if isinstance(result, bytes):
+            result = _ClassCachingUnpickler.loads(
+                result, self._registry.classes.__getitem__
+            )
+        return result
+
+
 class CloudpickleProcessPoolExecutor(ProcessPoolExecutor):
     """
     This class wraps :class:`concurrent.futures.ProcessPoolExecutor` such that the submitted
@@ -114,9 +266,31 @@ class CloudpickleProcessPoolExecutor(ProcessPoolExecutor):
         >>> print(instance.result.result)
         This was an arg
 
+        When many tasks use the same dynamically defined classes (e.g. running lots of
+        nodes of the same type), re-pickling and re-loading those classes for each task
+        can dominate. With `cache_classes=True`, each such class is pickled only once
+        per executor, each worker process loads it only the first time it is needed,
+        and tasks (and their results) refer to it by key -- so submissions only carry
+        the instance data.
+
+        >>> executor = CloudpickleProcessPoolExecutor(cache_classes=True)
+        >>> fs = executor.submit(instance.run, arg)
+        >>> print(fs.result().__class__.__name__)
+        DynamicFoo
+
+        >>> executor.shutdown()
+
     """
 
+    def __init__(self, *args, cache_classes: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._class_registry = _ClassRegistry() if cache_classes else None
+
     def submit(self, fn, /, *args, **kwargs):
+        if self._class_registry is not None:
+            return self._submit(
+                _ClassCachingCallable(self._class_registry, fn, args, kwargs)
+            )
         return self._submit(
             _CloudPickledCallable(fn),
             _CloudPickledCallable.dumps(args),
@@ -125,6 +299,18 @@ class CloudpickleProcessPoolExecutor(ProcessPoolExecutor):
 
     submit.__doc__ = ProcessPoolExecutor.submit.__doc__
 
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        super().shutdown(wait=wait, cancel_futures=cancel_futures)
+        if wait and self._class_registry is not None:
+            self._class_registry.clean()
+
+    shutdown.__doc__ = ProcessPoolExecutor.shutdown.__doc__
+
+    def _new_future(self) -> Future:
+        if self._class_registry is not None:
+            return _ClassCachingFuture(self._class_registry)
+        return CloudLoadsFuture()
+
     def _submit(self, fn, /, *args, **kwargs):
         """
         We override the regular `concurrent.futures.ProcessPoolExecutor` to use our
@@ -161,7 +347,7 @@ class CloudpickleProcessPoolExecutor(ProcessPoolExecutor):
                     "cannot schedule new futures after " "interpreter shutdown"
                 )
 
-            f = CloudLoadsFuture()
+            f = self._new_future()
             w = _WorkItem(f, fn, args, kwargs)
 
             self._pending_work_items[self._queue_count] = w
@@ -209,7 +395,7 @@ class CloudpickleProcessPoolExecutor(ProcessPoolExecutor):
                     "cannot schedule new futures after " "interpreter shutdown"
                 )
 
-            f = CloudLoadsFuture()
+            f = self._new_future()
             w = _WorkItem(f, fn, args, kwargs)
 
             self._pending_work_items[self._queue_count] = w
@@ -0,0 +1,208 @@
+"""
+Stable, content-based fingerprints for node code and data.
+
+Unlike python's built-in :func:`hash`, these fingerprints are reproducible across
+python sessions, which makes them suitable for keying caches that outlive the process
+that populated them.
+
+Data is fingerprinted by type-aware hashers where available, and otherwise by hashing
+its pickled bytes. Additional hashers can be registered for custom types with
+:func:`fingerprint_value.register`, e.g.
+
+>>> from pyiron_workflow.fingerprint import fingerprint_value
+>>>
+>>> class Foo:
+...     def __init__(self, bar):
+...         self.bar = bar
+>>>
+>>> @fingerprint_value.register
+... def _(value: Foo) -> str:
+...     return fingerprint_value(value.bar)
+>>>
+>>> fingerprint_value(Foo(42)) == fingerprint_value(42)
+True
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from functools import singledispatch
+import hashlib
+import pickle
+from typing import Any
+
+import cloudpickle
+import numpy as np
+from pandas import DataFrame, Index, Series
+from pandas.util import hash_pandas_object
+from pint import Quantity
+
+
+class FingerprintError(ValueError):
+    """
+    Raised when a stable fingerprint cannot be generated, e.g. because the data cannot
+    be serialized or the source code cannot be found.
+    """
+
+
+def _digest(*chunks: bytes) -> str:
+    h = hashlib.sha256()
+    for chunk in chunks:
+        h.update(hashlib.sha256(chunk).digest())  # Length-safe concatenation
+    return h.hexdigest()
+
+
+def _pickled_bytes(value: Any) -> bytes:
+    try:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        try:
+            return cloudpickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            raise FingerprintError(
+                f"Could not serialize {type(value)} data for fingerprinting"
+            ) from e
+
+
+def _type_bytes(value: Any) -> bytes:
+    return f"{type(value).__module__}.{type(value).__qualname__}".encode()
+
+
+@singledispatch
+def fingerprint_value(value: Any) -> str:
+    """
+    A hex digest of the value's content.
+
+    Dispatches on the value type to specialized hashers (e.g. for :mod:`numpy` arrays,
+    :mod:`pandas` objects, :mod:`pint` quantities, and dataclasses), and falls back to
+    hashing the pickled value.
+
+    Args:
+        value: The data to fingerprint.
+
+    Returns:
+        (str): The fingerprint.
+
+    Raises:
+        (FingerprintError): If the value can be serialized by neither :mod:`pickle`
+            nor :mod:`cloudpickle`.
+    """
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return _digest(
+            _type_bytes(value),
+            *(
+                f"{field.name}:{fingerprint_value(getattr(value, field.name))}".encode()
+                for field in dataclasses.fields(value)
+            ),
+        )
+    return _digest(_pickled_bytes(value))
+
+
+@fingerprint_value.register(bool)
+@fingerprint_value.register(int)
+@fingerprint_value.register(float)
+@fingerprint_value.register(complex)
+@fingerprint_value.register(type(None))
+def _(value) -> str:
+    return _digest(_type_bytes(value), repr(value).encode())
+
+
+@fingerprint_value.register
+def _(value: str) -> str:
+    return _digest(_type_bytes(value), value.encode("utf-8", "surrogatepass"))
+
+
+@fingerprint_value.register
+def _(value: bytes) -> str:
+    return _digest(_type_bytes(value), value)
+
+
+@fingerprint_value.register
+def _(value: np.ndarray) -> str:
+    if value.dtype.hasobject:
+        return _digest(_pickled_bytes(value))
+    return _digest(
+        _type_bytes(value),
+        f"{value.dtype.str}{value.shape}".encode(),
+        memoryview(np.ascontiguousarray(value)).cast("B"),  # No copy if contiguous
+    )
+
+
+@fingerprint_value.register
+def _(value: np.ma.MaskedArray) -> str:
+    return _digest(
+        _type_bytes(value),
+        fingerprint_value(value.data).encode(),
+        fingerprint_value(np.ma.getmaskarray(value)).encode(),
+        fingerprint_value(value.fill_value).encode(),
+    )
+
+
+@fingerprint_value.register(DataFrame)
+@fingerprint_value.register(Series)
+@fingerprint_value.register(Index)
+def _(value) -> str:
+    try:
+        rows = hash_pandas_object(value, index=not isinstance(value, Index))
+    except TypeError:  # E.g. unhashable objects in the data
+        return _digest(_pickled_bytes(value))
+    dtypes = value.dtypes if isinstance(value, DataFrame) else value.dtype
+    names = list(value.columns) if isinstance(value, DataFrame) else value.name
+    return _digest(
+        _type_bytes(value),
+        repr((names, str(dtypes))).encode(),
+        memoryview(np.ascontiguousarray(rows.to_numpy())).cast("B"),
+    )
+
+
+@fingerprint_value.register
+def _(value: Quantity) -> str:
+    return _digest(
+        _type_bytes(value),
+        str(value.units).encode(),
+        fingerprint_value(value.magnitude).encode(),
+    )
+
+
+def fingerprint_values(values: dict[str, Any]) -> str:
+    """
+    A single, order-independent fingerprint for a label-keyed dictionary of values,
+    e.g. the value dictionary of a node's input.
+
+    Args:
+        values (dict[str, Any]): The labelled data to fingerprint.
+
+    Returns:
+        (str): The fingerprint.
+
+    Raises:
+        (FingerprintError): If any of the values cannot be fingerprinted.
+    """
+    return _digest(
+        *(
+            f"{label}:{fingerprint_value(value)}".encode()
+            for label, value in sorted(values.items())
+        )
+    )
+
+
+def fingerprint_code(module: str, qualname: str, source: str | None) -> str:
+    """
+    A fingerprint of where a piece of code lives and what it says.
+
+    Args:
+        module (str): The module the code is defined in.
+        qualname (str): The qualified name of the code object.
+        source (str | None): The source code itself.
+
+    Returns:
+        (str): The fingerprint.
+
+    Raises:
+        (FingerprintError): If no source code is provided.
+    """
+    if source is None:
+        raise FingerprintError(
+            f"No source code available to fingerprint {module}.{qualname}"
+        )
+    return _digest(module.encode(), qualname.encode(), source.encode())
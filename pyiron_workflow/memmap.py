@@ -0,0 +1,120 @@
+"""
+Pass large array results back from other processes by reference instead of by value.
+
+When a node runs on a process-based executor (or serializes its result to file), its
+result normally gets pickled on the way back -- and a large array gets copied every
+time. Instead, large :class:`numpy.ndarray` results can be written once to a
+memory-mapped file, and only a small :class:`MappedArray` handle to that file gets
+passed back. Loading the handle maps the file without reading it into memory; the
+mapping is copy-on-write, so the data can be modified in-place without touching the
+file.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+import numpy as np
+
+
+class MappedArray:
+    """
+    A lightweight, serializable reference to an array saved in a `.npy` file.
+
+    Attributes:
+        path (Path): The file holding the array.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def load(self) -> np.memmap:
+        """Map the array from file (copy-on-write, without reading it)."""
+        return np.load(self.path, mmap_mode="c")
+
+    def unlink(self) -> bool:
+        """
+        Remove the file, if possible.
+
+        Arrays already mapped from the file remain valid on POSIX systems; where
+        mapped files cannot be removed (Windows), the file is left in place.
+
+        Returns:
+            (bool): Whether the file is gone.
+        """
+        try:
+            self.path.unlink(missing_ok=True)
+        except OSError:
+            return False
+        return True
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({str(self.path)!r})"
+
+
+def map_large_arrays(result: Any, directory: Path, threshold: int) -> Any:
+    """
+    Replace arrays with at least :param:`threshold` bytes in the result with
+    :class:`MappedArray` handles, saving their data to new files in
+    :param:`directory`.
+
+    Tuple, list and dictionary results are searched (one level deep).
+
+    Args:
+        result: The result to look for large arrays in.
+        directory (Path): Where to save the arrays.
+        threshold (int): The minimum size (in bytes) of arrays to save.
+
+    Returns:
+        (Any): The result, with large arrays replaced by handles.
+    """
+
+    def _map(value):
+        if (
+            isinstance(value, np.ndarray)
+            and value.dtype != object
+            and value.nbytes >= threshold
+        ):
+            directory.mkdir(parents=True, exist_ok=True)
+            # Always use a new file, an old one might still be mapped somewhere
+            path = directory.joinpath(f"{uuid4().hex}.npy")
+            np.save(path, value, allow_pickle=False)
+            return MappedArray(path)
+        return value
+
+    return _apply(_map, result)
+
+
+def load_mapped_arrays(result: Any) -> tuple[Any, list[MappedArray]]:
+    """
+    Replace :class:`MappedArray` handles in the result with the arrays they map.
+
+    Args:
+        result: A result possibly holding handles, e.g. from :func:`map_large_arrays`.
+
+    Returns:
+        (Any): The result, with handles replaced by memory-mapped arrays.
+        (list[MappedArray]): The handles that were loaded.
+    """
+    handles = []
+
+    def _load(value):
+        if isinstance(value, MappedArray):
+            handles.append(value)
+            return value.load()
+        return value
+
+    return _apply(_load, result), handles
+
+
+def _apply(fnc: callable, result: Any) -> Any:
+    if isinstance(result, tuple) and not hasattr(result, "_fields"):
+        return tuple(fnc(v) for v in result)
+    elif type(result) is list:
+        return [fnc(v) for v in result]
+    elif type(result) is dict:
+        return {k: fnc(v) for k, v in result.items()}
+    else:
+        return fnc(result)
@@ -6,12 +6,20 @@ interaction, etc.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import asyncio
 from concurrent.futures import Executor as StdLibExecutor, Future, ThreadPoolExecutor
 from functools import partial
-from time import sleep
-from typing import Any, Optional
+from inspect import isawaitable
+from time import perf_counter, sleep, time
+from typing import Any, Awaitable, Optional
 
 from pyiron_workflow.mixin.has_interface_mixins import HasLabel, HasRun, UsesState
+from pyiron_workflow.profiling import (
+    ProfiledOutput,
+    RunProfile,
+    profiled_await,
+    profiled_call,
+)
 
 
 class ReadinessError(ValueError):
@@ -21,6 +29,64 @@ class ReadinessError(ValueError):
     """
 
 
+class EventLoopExecutor(StdLibExecutor):
+    """
+    Runs submitted calls as tasks on an :mod:`asyncio` event loop, awaiting whatever
+    awaitable they return. Awaitable computations thus run concurrently with each other
+    on the loop's thread, without needing any more threads.
+
+    Like other executors, submission returns a :class:`concurrent.futures.Future`;
+    its callbacks get invoked on the loop's thread.
+
+    Args:
+        loop (asyncio.AbstractEventLoop): The (running) loop to run calls on.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        return asyncio.run_coroutine_threadsafe(
+            _await_call(fn, *args, **kwargs), self.loop
+        )
+
+
+async def _await_call(fn: callable, /, *args, **kwargs):
+    result = fn(*args, **kwargs)
+    if isawaitable(result):
+        result = await result
+    return result
+
+
+def await_synchronously(awaitable: Awaitable) -> Any:
+    """
+    Block until the awaitable is done, and return its result.
+
+    If this thread is already running an event loop, the awaitable gets run on a new
+    event loop in a separate thread, since the running loop can't be blocked on.
+
+    Args:
+        awaitable (Awaitable): What to wait for.
+
+    Returns:
+        (Any): The result of the awaitable.
+    """
+
+    async def _await():
+        return await awaitable
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_await())
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, _await()).result()
+
+
+def _none_to_dict(inp):
+    return {} if inp is None else inp
+
+
 class Runnable(UsesState, HasLabel, HasRun, ABC):
     """
     An abstract class for interfacing with executors, etc.
@@ -34,6 +100,11 @@ class Runnable(UsesState, HasLabel, HasRun, ABC):
     with the returned value of :meth:`on_run`, but by default the returned value just
     passes cleanly through the function.
 
+    Runs can also be awaited with :meth:`arun`. Then, if no executor is used,
+    :meth:`on_run_async` is run on the running event loop -- child classes can
+    override it to await their computation, so that it runs concurrently with
+    whatever else is on the loop.
+
     The `run` cycle is broken down into sub-steps:
     - `_before_run`: prior to the `running` status being set to `True`
     - `_run`: after the `running` status has been set to `True`
@@ -45,6 +116,15 @@ class Runnable(UsesState, HasLabel, HasRun, ABC):
 
     Child classes can extend the behavior of these sub-steps, including introducing
     new keyword arguments.
+
+    Attributes:
+        profile (bool): Whether to record a detailed :attr:`run_profile` of each run.
+            (Default is False.)
+        run_duration (float | None): The wall-clock time (in seconds) between the start
+            of the last run that reached :meth:`_run` and its finish -- including any
+            time spent waiting on an executor. None if no run has finished yet.
+        run_profile (RunProfile | None): A breakdown of the time spent in each phase of
+            the last profiled run. None if no run has been profiled yet.
     """
 
     def __init__(self, *args, **kwargs):
@@ -57,6 +137,11 @@ class Runnable(UsesState, HasLabel, HasRun, ABC):
         # (or create) an executor process without ever trying to pickle a `_thread.lock`
         self.future: None | Future = None
         self._thread_pool_sleep_time = 1e-6
+        self.run_duration: float | None = None
+        self._run_start_time: float | None = None
+        self.profile = False
+        self.run_profile: RunProfile | None = None
+        self._run_profile_draft: RunProfile | None = None
 
     @abstractmethod
     def on_run(self, *args, **kwargs) -> Any:  # callable[..., Any | tuple]:
@@ -64,6 +149,13 @@ class Runnable(UsesState, HasLabel, HasRun, ABC):
         What the :meth:`run` method actually does!
         """
 
+    async def on_run_async(self, *args, **kwargs) -> Any:
+        """
+        An awaitable counterpart to :meth:`on_run`, used when running on an event
+        loop. By default, just calls :meth:`on_run`.
+        """
+        return self.on_run(*args, **kwargs)
+
     @property
     @abstractmethod
     def run_args(self) -> tuple[tuple, dict]:
@@ -100,6 +192,11 @@ class Runnable(UsesState, HasLabel, HasRun, ABC):
         )
         return report
 
+    @property
+    def profiling(self) -> bool:
+        """Whether the next run will be profiled."""
+        return self.profile
+
     def executor_shutdown(self, wait=True, *, cancel_futures=False):
         """Invoke shutdown on the executor (if present)."""
         try:
@@ -134,35 +231,92 @@ class Runnable(UsesState, HasLabel, HasRun, ABC):
             raise_run_exceptions (bool): Whether to raise exceptions encountered while
                 :attr:`running`. (Default is True.)
         """
+        stop_early, result, executor = self._start_run(
+            check_readiness, _none_to_dict(before_run_kwargs)
+        )
+        if stop_early:
+            return result
+        return self._run(
+            executor=executor,
+            raise_run_exceptions=raise_run_exceptions,
+            run_exception_kwargs=_none_to_dict(run_exception_kwargs),
+            run_finally_kwargs=_none_to_dict(run_finally_kwargs),
+            finish_run_kwargs=_none_to_dict(finish_run_kwargs),
+            **_none_to_dict(run_kwargs),
+        )
+
+    async def arun(
+        self,
+        check_readiness: bool = True,
+        raise_run_exceptions: bool = True,
+        before_run_kwargs: dict | None = None,
+        run_kwargs: dict | None = None,
+        run_exception_kwargs: dict | None = None,
+        run_finally_kwargs: dict | None = None,
+        finish_run_kwargs: dict | None = None,
+    ) -> Any | tuple:
+        """
+        An awaitable counterpart to :meth:`run`.
 
-        def _none_to_dict(inp):
-            return {} if inp is None else inp
+        Without an executor, :meth:`on_run_async` gets run as a task on the running
+        event loop; with an executor, the result is waited for without blocking the
+        loop. Either way, the processed result gets returned (never a future).
 
-        before_run_kwargs = _none_to_dict(before_run_kwargs)
-        run_kwargs = _none_to_dict(run_kwargs)
-        run_exception_kwargs = _none_to_dict(run_exception_kwargs)
-        run_finally_kwargs = _none_to_dict(run_finally_kwargs)
-        finish_run_kwargs = _none_to_dict(finish_run_kwargs)
+        Args:
+            check_readiness (bool): Whether to raise a `ReadinessError` if not
+                :attr:`ready`. (Default is True.)
+            raise_run_exceptions (bool): Whether to raise exceptions encountered while
+                :attr:`running`. (Default is True.)
+        """
+        stop_early, result, executor = self._start_run(
+            check_readiness, _none_to_dict(before_run_kwargs)
+        )
+        if stop_early:
+            return result
+        return await self._arun(
+            executor=executor,
+            raise_run_exceptions=raise_run_exceptions,
+            run_exception_kwargs=_none_to_dict(run_exception_kwargs),
+            run_finally_kwargs=_none_to_dict(run_finally_kwargs),
+            finish_run_kwargs=_none_to_dict(finish_run_kwargs),
+            **_none_to_dict(run_kwargs),
+        )
+
+    def _start_run(
+        self, check_readiness: bool, before_run_kwargs: dict
+    ) -> tuple[bool, Any, StdLibExecutor | None]:
+        """
+        Do everything up to the point of actually running.
 
+        Returns:
+            (bool): Whether to exit the run early.
+            (Any): What to return on an early exit.
+            (StdLibExecutor | None): The executor to run on, if any.
+        """
+        profile_start = time() if self.profiling else None
         stop_early, result = self._before_run(
             check_readiness=check_readiness, **before_run_kwargs
         )
+        if profile_start is not None:
+            profile = RunProfile(
+                self.full_label, profile_start, before_run=time() - profile_start
+            )
         if stop_early:
-            return result
+            if profile_start is not None:
+                profile.total = profile.before_run
+                profile.stopped_early = True
+                self._record_run_profile(profile)
+            return True, result, None
 
         executor = (
             None if self.executor is None else self._parse_executor(self.executor)
         )
 
         self.running = True
-        return self._run(
-            executor=executor,
-            raise_run_exceptions=raise_run_exceptions,
-            run_exception_kwargs=run_exception_kwargs,
-            run_finally_kwargs=run_finally_kwargs,
-            finish_run_kwargs=finish_run_kwargs,
-            **run_kwargs,
-        )
+        self._run_start_time = perf_counter()
+        if profile_start is not None:
+            self._run_profile_draft = profile
+        return False, None, executor
 
     def _before_run(self, /, check_readiness, **kwargs) -> tuple[bool, Any]:
         """
@@ -209,18 +363,22 @@ class Runnable(UsesState, HasLabel, HasRun, ABC):
             (Any | Future): The result of :meth:`on_run`, or a futures object from
                 the executor.
         """
-        on_run_args, on_run_kwargs = self.run_args
-        if "self" in on_run_kwargs.keys():
-            raise ValueError(
-                f"{self.label} got 'self' as a run kwarg, but self is already the "
-                f"first positional argument passed to :meth:`on_run`."
-            )
+        on_run_args, on_run_kwargs = self._checked_run_args()
 
         if executor is None:
             try:
-                run_output = self.on_run(*on_run_args, **on_run_kwargs)
+                run_output = (
+                    self.on_run(*on_run_args, **on_run_kwargs)
+                    if self._run_profile_draft is None
+                    else self._profiled_on_run(False, *on_run_args, **on_run_kwargs)
+                )
             except (Exception, KeyboardInterrupt) as e:
                 self._run_exception(**run_exception_kwargs)
+                profile, self._run_profile_draft = self._run_profile_draft, None
+                if profile is not None:
+                    profile.total = time() - profile.start
+                    profile.failed = True
+                    self._record_run_profile(profile)
                 self._run_finally(**run_finally_kwargs)
                 if raise_run_exceptions:
                     raise e
@@ -234,14 +392,7 @@ class Runnable(UsesState, HasLabel, HasRun, ABC):
                 **finish_run_kwargs,
             )
         else:
-            if isinstance(executor, ThreadPoolExecutor):
-                self.future = executor.submit(
-                    self._thread_pool_run, *on_run_args, **on_run_kwargs
-                )
-            else:
-                self.future = executor.submit(
-                    self.on_run, *on_run_args, **on_run_kwargs
-                )
+            self.future = self._submit(executor, on_run_args, on_run_kwargs)
             self.future.add_done_callback(
                 partial(
                     self._finish_run,
@@ -253,6 +404,103 @@ class Runnable(UsesState, HasLabel, HasRun, ABC):
             )
             return self.future
 
+    async def _arun(
+        self,
+        /,
+        executor: StdLibExecutor | None,
+        raise_run_exceptions: bool,
+        run_exception_kwargs: dict,
+        run_finally_kwargs: dict,
+        finish_run_kwargs: dict,
+        **kwargs,
+    ) -> Any | tuple:
+        """
+        What happens while the status is :attr:`running` for awaited runs, namely
+        submitting :meth:`on_run_async` to the running event loop (or the call to
+        :meth:`on_run` to the executor), and waiting for it without blocking the loop.
+
+        Args:
+            executor (concurrent.futures.Executor|None): Optionally, executor on which
+                to run.
+            raise_run_exceptions (bool): Whether to raise encountered exceptions.
+
+        Returns:
+            (Any | tuple): The processed result of the run.
+        """
+        on_run_args, on_run_kwargs = self._checked_run_args()
+        if executor is None:
+            executor = EventLoopExecutor(asyncio.get_running_loop())
+        self.future = self._submit(executor, on_run_args, on_run_kwargs)
+        waiting = asyncio.wrap_future(self.future)
+        await asyncio.wait([waiting])
+        if not waiting.cancelled():
+            waiting.exception()  # Mark as retrieved, we handle it on the future itself
+        return self._finish_run(
+            self.future,
+            raise_run_exceptions=raise_run_exceptions,
+            run_exception_kwargs=run_exception_kwargs,
+            run_finally_kwargs=run_finally_kwargs,
+            **finish_run_kwargs,
+        )
+
+    def _checked_run_args(self) -> tuple[tuple, dict]:
+        on_run_args, on_run_kwargs = self.run_args
+        if "self" in on_run_kwargs.keys():
+            raise ValueError(
+                f"{self.label} got 'self' as a run kwarg, but self is already the "
+                f"first positional argument passed to :meth:`on_run`."
+            )
+        return on_run_args, on_run_kwargs
+
+    def _submit(
+        self, executor: StdLibExecutor, on_run_args: tuple, on_run_kwargs: dict
+    ) -> Future:
+        """
+        Submit the run to the executor, in the way best suited to that executor.
+        """
+        submit_start = time()
+        profiled = self._run_profile_draft is not None
+        if isinstance(executor, EventLoopExecutor):
+            future = executor.submit(
+                self._profiled_on_run_async if profiled else self.on_run_async,
+                *on_run_args,
+                **on_run_kwargs,
+            )
+        elif isinstance(executor, ThreadPoolExecutor):
+            if profiled:
+                future = executor.submit(
+                    self._profiled_on_run, True, *on_run_args, **on_run_kwargs
+                )
+            else:
+                future = executor.submit(
+                    self._thread_pool_run, *on_run_args, **on_run_kwargs
+                )
+        elif profiled:
+            future = executor.submit(
+                profiled_call,
+                self._executor_on_run,
+                *on_run_args,
+                **on_run_kwargs,
+            )
+        else:
+            future = executor.submit(
+                self._executor_on_run, *on_run_args, **on_run_kwargs
+            )
+        if profiled:
+            self._run_profile_draft.submit = time() - submit_start
+        return future
+
+    @property
+    def _executor_on_run(self) -> callable:
+        """
+        What gets submitted to (non-thread) executors in place of :meth:`on_run`.
+
+        Child classes can provide something cheaper to serialize than the bound
+        :meth:`on_run` (which carries the entire runnable along with it), as long as it
+        takes the same arguments and returns the same output.
+        """
+        return self.on_run
+
     def _run_exception(self, /, **kwargs):
         """
         What to do if an exception is encountered inside :meth:`_run` or
@@ -280,17 +528,76 @@ class Runnable(UsesState, HasLabel, HasRun, ABC):
         Switch the status, then process and return the run result.
         """
         self.running = False
+        # Processing may overwrite our state
+        run_start_time = self._run_start_time
+        profile = self._run_profile_draft
         try:
             if isinstance(run_output, Future):
+                collect_start = time()
                 run_output = run_output.result()
-            return self.process_run_result(run_output)
+                if profile is not None:
+                    profile.collect = time() - collect_start
+            if isinstance(run_output, ProfiledOutput):
+                if profile is not None:
+                    profile.queue = max(
+                        0.0,
+                        run_output.start
+                        - (profile.start + profile.before_run + profile.submit),
+                    )
+                    profile.on_run = run_output.duration
+                    profile.on_run_cpu = run_output.cpu_time
+                run_output = run_output.output
+            run_output = self._receive_run_output(run_output)
+            process_start = time()
+            try:
+                return self.process_run_result(run_output)
+            finally:
+                if profile is not None:
+                    profile.process_result = time() - process_start
         except Exception as e:
             self._run_exception(**run_exception_kwargs)
             if raise_run_exceptions:
                 raise e
         finally:
+            if run_start_time is not None:
+                self.run_duration = perf_counter() - run_start_time
+            self._run_profile_draft = None
+            if profile is not None:
+                profile.total = time() - profile.start
+                profile.failed = self.failed
+                self._record_run_profile(profile)
             self._run_finally(**run_finally_kwargs)
 
+    def _receive_run_output(self, run_output):
+        """
+        Unpack what :meth:`on_run` sent back before it gets processed, e.g. if parts of
+        the result were passed back by reference instead of by value.
+        """
+        return run_output
+
+    def _record_run_profile(self, profile: RunProfile) -> None:
+        """
+        Store the profile of a finished run.
+
+        Args:
+            profile (RunProfile): The complete profile.
+        """
+        self.run_profile = profile
+
+    def _profiled_on_run(self, on_thread_pool: bool, /, *args, **kwargs):
+        """
+        Run and time :meth:`on_run` wherever it is executed.
+        """
+        return profiled_call(
+            self._thread_pool_run if on_thread_pool else self.on_run, *args, **kwargs
+        )
+
+    async def _profiled_on_run_async(self, *args, **kwargs):
+        """
+        Run and time :meth:`on_run_async`.
+        """
+        return await profiled_await(self.on_run_async(*args, **kwargs))
+
     def _thread_pool_run(self, *args, **kwargs):
         """
         A poor attempt at avoiding (probably) thread races
@@ -358,3 +665,12 @@ class Runnable(UsesState, HasLabel, HasRun, ABC):
         # we'll trust that those serialize OK (this way we can, hopefully, eventually
         # support nesting executors!)
         return state
+
+    def __setstate__(self, state):
+        # States saved before run timing and profiling existed lack these
+        state.setdefault("run_duration", None)
+        state.setdefault("_run_start_time", None)
+        state.setdefault("profile", False)
+        state.setdefault("run_profile", None)
+        state.setdefault("_run_profile_draft", None)
+        super().__setstate__(state)
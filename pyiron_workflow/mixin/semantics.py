@@ -30,6 +30,9 @@ class Semantic(UsesState, HasLabel, HasParent, ABC):
 
     The semantic parent object (if any), and the parent-most object are both easily
     accessible.
+
+    The semantic path is cached, and the cache gets cleared whenever the label or
+    parent of the object (or of any of its ancestors) changes.
     """
 
     semantic_delimiter = "/"
@@ -40,6 +43,7 @@ class Semantic(UsesState, HasLabel, HasParent, ABC):
         self._label = None
         self._parent = None
         self._detached_parent_path = None
+        self._semantic_path = None
         self.label = label
         self.parent = parent
         super().__init__(*args, **kwargs)
@@ -55,6 +59,9 @@ class Semantic(UsesState, HasLabel, HasParent, ABC):
         if self.semantic_delimiter in new_label:
             raise ValueError(f"{self.semantic_delimiter} cannot be in the label")
         self._label = new_label
+        self._invalidate_semantic_path()
+        if self._parent is not None:
+            self._parent._child_relabeled(self)
 
     @property
     def parent(self) -> SemanticParent | None:
@@ -80,6 +87,7 @@ class Semantic(UsesState, HasLabel, HasParent, ABC):
             self._parent.remove_child(self)
         self._parent = new_parent
         self._detached_parent_path = None
+        self._invalidate_semantic_path()
         if self._parent is not None and self not in self._parent.children:
             self._parent.add_child(self)
 
@@ -89,6 +97,11 @@ class Semantic(UsesState, HasLabel, HasParent, ABC):
         The path of node labels from the graph root (parent-most node) down to this
         node.
         """
+        if self._semantic_path is None:
+            self._semantic_path = self._build_semantic_path()
+        return self._semantic_path
+
+    def _build_semantic_path(self) -> str:
         if self.parent is None and self.detached_parent_path is None:
             prefix = ""
         elif self.parent is None and self.detached_parent_path is not None:
@@ -104,6 +117,10 @@ class Semantic(UsesState, HasLabel, HasParent, ABC):
             )
         return prefix + self.semantic_delimiter + self.label
 
+    def _invalidate_semantic_path(self) -> None:
+        """Clear the cached semantic path, e.g. because the label or parent changed."""
+        self._semantic_path = None
+
     @property
     def detached_parent_path(self) -> str | None:
         """
@@ -143,6 +160,7 @@ class Semantic(UsesState, HasLabel, HasParent, ABC):
         if self.parent is not None:
             state["_detached_parent_path"] = self.parent.semantic_path
         state["_parent"] = None
+        state["_semantic_path"] = None
         # Regarding removing parent from state:
         # Basically we want to avoid recursion during (de)serialization; when the
         # parent object is deserializing itself, _it_ should know who its children are
@@ -151,6 +169,11 @@ class Semantic(UsesState, HasLabel, HasParent, ABC):
         # this also avoids dragging our whole semantic parent graph along with us.
         return state
 
+    def __setstate__(self, state):
+        # The path is only a cache, and states saved before it existed lack it
+        state["_semantic_path"] = None
+        super().__setstate__(state)
+
 
 class CyclicPathError(ValueError):
     """
@@ -184,6 +207,7 @@ class SemanticParent(Semantic, ABC):
         **kwargs,
     ):
         self._children = bidict()
+        self._label_suffix_counters = {}
         self.strict_naming = strict_naming
         super().__init__(*args, label=label, parent=parent, **kwargs)
 
@@ -299,18 +323,39 @@ class SemanticParent(Semantic, ABC):
             )
 
     def _this_child_is_already_at_this_label(self, child: Semantic, label: str):
-        return (
-            label == child.label
-            and label in self.child_labels
-            and self.children[label] is child
-        )
+        return label == child.label and self.children.get(label) is child
 
     def _this_child_is_already_at_a_different_label(self, child, label):
         return child.parent is self and label != child.label
 
+    @classmethod
+    def _reserved_labels(cls) -> frozenset[str]:
+        """
+        The class attributes and methods, which children may not shadow.
+
+        Computed once per class, since :func:`dir` is expensive.
+        """
+        try:
+            return cls.__dict__["_reserved_labels_cache"]
+        except KeyError:
+            reserved = frozenset(dir(cls)) | {"_reserved_labels_cache"}
+            type.__setattr__(cls, "_reserved_labels_cache", reserved)
+            return reserved
+
+    def _label_is_taken(self, label: str) -> bool:
+        """
+        Whether the label is already used by a child or an attribute (i.e. whether
+        it would appear in :meth:`__dir__`).
+        """
+        return (
+            label in self.children
+            or label in self.__dict__
+            or label in self._reserved_labels()
+        )
+
     def _get_unique_label(self, label: str, strict_naming: bool):
-        if label in self.__dir__():
-            if label in self.child_labels:
+        if self._label_is_taken(label):
+            if label in self.children:
                 if strict_naming:
                     raise AttributeError(
                         f"{label} is already the label for a child. Please remove it "
@@ -326,13 +371,18 @@ class SemanticParent(Semantic, ABC):
         return label
 
     def _add_suffix_to_label(self, label):
-        i = 0
         new_label = label
-        while new_label in self.__dir__():
-            # We search dir and not just the child_labels for the edge case that
-            # someone has a very label-like attribute
+        if self._label_is_taken(new_label):
+            # Pick up counting where we last left off for this label, so repeatedly
+            # adding the same label doesn't re-check all the suffixes already used
+            i = self._label_suffix_counters.get(label, 0)
             new_label = f"{label}{i}"
-            i += 1
+            while self._label_is_taken(new_label):
+                # We search all attributes and not just the children for the edge
+                # case that someone has a very label-like attribute
+                i += 1
+                new_label = f"{label}{i}"
+            self._label_suffix_counters[label] = i + 1
         if new_label != label:
             logger.info(
                 f"{label} is already a node; appending an index to the "
@@ -364,6 +414,15 @@ class SemanticParent(Semantic, ABC):
         self._ensure_path_is_not_cyclic(new_parent, self)
         super(SemanticParent, type(self)).parent.__set__(self, new_parent)
 
+    def _child_relabeled(self, child: Semantic) -> None:
+        """A hook called whenever the label of one of the children changes."""
+
+    def _invalidate_semantic_path(self) -> None:
+        super()._invalidate_semantic_path()
+        # Our children's paths are built on ours
+        for child in self:
+            child._invalidate_semantic_path()
+
     def __getstate__(self):
         state = super().__getstate__()
 
@@ -387,6 +446,8 @@ class SemanticParent(Semantic, ABC):
             {label: state.pop(label) for label in state.pop("child_labels")}
         )
 
+        state.setdefault("_label_suffix_counters", {})
+
         super().__setstate__(state)
 
         self._children = bidict(self._children)
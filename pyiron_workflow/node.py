@@ -8,8 +8,11 @@ The workhorse class for the entire concept.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from concurrent.futures import Future
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from importlib import import_module
+from inspect import getsource, isawaitable
 from typing import Any, Literal, Optional, TYPE_CHECKING
 
 import cloudpickle
@@ -17,16 +20,19 @@ from pyiron_snippets.colors import SeabornColors
 from pyiron_snippets.dotdict import DotDict
 
 from pyiron_workflow.draw import Node as GraphvizNode
+from pyiron_workflow.fingerprint import (
+    FingerprintError,
+    fingerprint_code,
+    fingerprint_values,
+)
 from pyiron_workflow.logging import logger
+from pyiron_workflow.memmap import MappedArray, load_mapped_arrays, map_large_arrays
 from pyiron_workflow.mixin.injection import HasIOWithInjection
-from pyiron_workflow.mixin.run import Runnable, ReadinessError
+from pyiron_workflow.mixin.run import Runnable, ReadinessError, await_synchronously
 from pyiron_workflow.mixin.semantics import Semantic
 from pyiron_workflow.mixin.single_output import ExploitsSingleOutput
 from pyiron_workflow.storage import StorageInterface, available_backends
-from pyiron_workflow.topology import (
-    get_nodes_in_data_tree,
-    set_run_connections_according_to_linear_dag,
-)
+from pyiron_workflow.topology import data_tree_dependencies
 
 if TYPE_CHECKING:
     from concurrent.futures import Executor
@@ -34,8 +40,10 @@ if TYPE_CHECKING:
 
     import graphviz
 
+    from pyiron_workflow.cache import PersistentCache
     from pyiron_workflow.channels import OutputSignal
     from pyiron_workflow.nodes.composite import Composite
+    from pyiron_workflow.profiling import RunProfile
 
 
 class Node(
@@ -134,6 +142,9 @@ class Node(
     - Nodes can optionally cache their input to skip running altogether and use
         existing output when their current input matches (`==`) the cached input (this
         is the default behavior).
+        - Nodes can additionally opt in to a persistent, on-disk cache, keyed on a
+            fingerprint of their code and input values, so that output can be re-used
+            across python sessions and freshly built graphs.
     - Nodes can be saved to and loaded from file.
         - All storage operations can specify a storage backend interface, but only
             the interface for saving and loading via `(cloud)pickle` dumping and
@@ -195,6 +206,23 @@ class Node(
             node. Must be specified in child classes.
         running (bool): Whether the node has called :meth:`run` and has not yet
             received output from this call. (Default is False.)
+        persistent_cache (PersistentCache | None): An on-disk cache to check for
+            output matching the node code and current input before running, and to
+            write output to after running. Only used when :attr:`use_cache` is also
+            True. (Default is None, don't use a persistent cache.)
+        memmap_threshold (int | None): When the node runs on a process-based executor
+            or serializes its result, :mod:`numpy` array results of at least this many
+            bytes are written once to memory-mapped files in the node's directory and
+            passed back by reference, instead of being pickled (and thus copied) on the
+            way back. The arrays that end up in the output are mapped from these files
+            (copy-on-write). Files from the previous run are removed when new ones
+            arrive. (Default is None, always pass results back by value.)
+        profile (bool): Whether to record a :attr:`run_profile` of each run. Children
+            of a composite that is being profiled get profiled too. (Default is False.)
+        run_profile (pyiron_workflow.profiling.RunProfile | None): A breakdown of where
+            the time went during the last profiled run, e.g. to tell whether the run
+            was dominated by the computation itself or by fetching input, type
+            checking, executor hand-off, etc.
         checkpoint (Literal["pickle"] | StorageInterface | None): Whether to trigger a
             save of the entire graph after each run of the node, and if so what storage
             back end to use. (Default is None, don't do any checkpoint saving.)
@@ -215,13 +243,18 @@ class Node(
             Additional signal channels in derived classes can be added to
             :attr:`signals.inputs` and  :attr:`signals.outputs` after this mixin class
             is initialized.
-        use_cache (bool): Whether or not to cache the inputs and, when the current
-            inputs match the cached input (by `==` comparison), to bypass running the
-            node and simply continue using the existing outputs. Note that you may be
+        use_cache (bool): Whether or not to cache a fingerprint of the inputs and, when
+            the fingerprint of the current inputs matches the cached one, to bypass
+            running the node and simply continue using the existing outputs. Inputs
+            are fingerprinted by content (see :mod:`pyiron_workflow.fingerprint`), so
+            in-place modifications of mutable input data are also detected. Input
+            which cannot be fingerprinted never hits the cache. Note that you may be
             able to trigger a false cache hit in some special case of non-idempotent
-            nodes working on mutable data.
+            nodes.
 
     Methods:
+        code_fingerprint: A stable fingerprint of the code defining the node's
+            computation.
         __call__: An alias for :meth:`pull` that aggressively runs upstream nodes even
             _outside_ the local scope (i.e. runs parents' dependencies as well).
         (de)activate_strict_hints: Recursively (de)activate strict hints among data IO.
@@ -262,6 +295,8 @@ class Node(
     """
 
     use_cache = True
+    persistent_cache: PersistentCache | None = None
+    memmap_threshold: int | None = None
 
     def __init__(
         self,
@@ -306,7 +341,9 @@ class Node(
         # under-development status -- API may change to be more user-friendly
         self._do_clean: bool = False  # Power-user override for cleaning up temporary
         # serialized results and empty directories (or not).
-        self._cached_inputs = None
+        self._cached_input_fingerprint: str | None = None
+        self._persistent_cache_key: str | None = None
+        self._mapped_arrays: list[MappedArray] = []
         self._user_data = {}  # A place for power-users to bypass node-injection
 
         self._setup_node()
@@ -391,8 +428,25 @@ class Node(
 
     def on_run(self, *args, **kwargs) -> Any:
         save_result: bool = args[0]
-        args = args[1:]
+        map_arrays: bool = args[1]
+        args = args[2:]
         result = self._on_run(*args, **kwargs)
+        if isawaitable(result):
+            result = await_synchronously(result)
+        return self._prepare_result(result, save_result, map_arrays)
+
+    async def on_run_async(self, *args, **kwargs) -> Any:
+        save_result: bool = args[0]
+        map_arrays: bool = args[1]
+        args = args[2:]
+        result = await self._on_run_async(*args, **kwargs)
+        return self._prepare_result(result, save_result, map_arrays)
+
+    def _prepare_result(self, result: Any, save_result: bool, map_arrays: bool):
+        if map_arrays:
+            result = map_large_arrays(
+                result, self._mapped_array_directory, self.memmap_threshold
+            )
         if save_result:
             self._temporary_result_pickle(result)
         return result
@@ -401,12 +455,67 @@ class Node(
     def _on_run(self, *args, **kwargs) -> Any:
         pass
 
+    async def _on_run_async(self, *args, **kwargs) -> Any:
+        """
+        What to do when running on an event loop. By default, :meth:`_on_run`, and
+        then await its result if it is awaitable (e.g. the node function is a
+        coroutine function).
+        """
+        result = self._on_run(*args, **kwargs)
+        if isawaitable(result):
+            result = await result
+        return result
+
+    @property
+    def _detached_on_run(self) -> callable | None:
+        """
+        A stand-in for :meth:`_on_run` which doesn't need the node itself, if there is
+        one. When available, only this and the run arguments (instead of the entire
+        node) get sent to executors.
+        """
+        return None
+
+    @property
+    def _executor_on_run(self) -> callable:
+        detached = self._detached_on_run
+        if detached is None:
+            return super()._executor_on_run
+        return _DetachedOnRun(
+            detached,
+            self._temporary_result_file if self._serialize_result else None,
+            self._mapped_array_directory,
+            self.memmap_threshold,
+        )
+
     @property
     def run_args(self) -> tuple[tuple, dict]:
         args, kwargs = self._run_args
-        args = (self._serialize_result,) + args
+        args = (self._serialize_result, self._maps_large_arrays) + args
         return args, kwargs
 
+    @property
+    def _maps_large_arrays(self) -> bool:
+        """
+        Whether large array results should be passed back by reference, i.e. when they
+        would otherwise get serialized.
+        """
+        return self.memmap_threshold is not None and (
+            self._serialize_result
+            or (
+                self.executor is not None
+                and not isinstance(self.executor, ThreadPoolExecutor)
+            )
+        )
+
+    def _receive_run_output(self, run_output):
+        run_output, mapped = load_mapped_arrays(run_output)
+        if len(mapped) > 0:
+            # The loaded arrays stay mapped after their files are removed, so the
+            # handoff files are not needed past this point
+            self._mapped_arrays.extend(mapped)
+            self._unlink_mapped_arrays()
+        return run_output
+
     @property
     @abstractmethod
     def _run_args(self, *args, **kwargs) -> Any:
@@ -489,19 +598,82 @@ class Node(
         self.set_input_values(*args, **kwargs)
 
         return super().run(
-            check_readiness=check_readiness,
-            raise_run_exceptions=raise_run_exceptions,
-            before_run_kwargs={
+            **self._run_stage_kwargs(
+                run_data_tree=run_data_tree,
+                run_parent_trees_too=run_parent_trees_too,
+                fetch_input=fetch_input,
+                check_readiness=check_readiness,
+                raise_run_exceptions=raise_run_exceptions,
+                emit_ran_signal=emit_ran_signal,
+            )
+        )
+
+    async def arun(
+        self,
+        *args,
+        run_data_tree: bool = False,
+        run_parent_trees_too: bool = False,
+        fetch_input: bool = True,
+        check_readiness: bool = True,
+        raise_run_exceptions: bool = True,
+        emit_ran_signal: bool = True,
+        **kwargs,
+    ):
+        """
+        An awaitable counterpart to :meth:`run`, taking the same arguments.
+
+        Without an executor, the node runs as a task on the running event loop: nodes
+        whose node function is a coroutine function (`async def`) await it, so they
+        run concurrently with everything else on the loop, and composites run their
+        children like this too. With an executor, the run happens there as usual, but
+        is waited for without blocking the loop.
+
+        Returns:
+            (Any): The result of running the node (never a futures object).
+        """
+        if self.running and self._serialize_result:
+            return self.run(
+                raise_run_exceptions=raise_run_exceptions,
+                emit_ran_signal=emit_ran_signal,
+            )
+
+        self.set_input_values(*args, **kwargs)
+
+        return await super().arun(
+            **self._run_stage_kwargs(
+                run_data_tree=run_data_tree,
+                run_parent_trees_too=run_parent_trees_too,
+                fetch_input=fetch_input,
+                check_readiness=check_readiness,
+                raise_run_exceptions=raise_run_exceptions,
+                emit_ran_signal=emit_ran_signal,
+            )
+        )
+
+    @staticmethod
+    def _run_stage_kwargs(
+        run_data_tree: bool,
+        run_parent_trees_too: bool,
+        fetch_input: bool,
+        check_readiness: bool,
+        raise_run_exceptions: bool,
+        emit_ran_signal: bool,
+    ) -> dict:
+        """Distribute the node run arguments to the stages of the run cycle."""
+        return {
+            "check_readiness": check_readiness,
+            "raise_run_exceptions": raise_run_exceptions,
+            "before_run_kwargs": {
                 "run_data_tree": run_data_tree,
                 "run_parent_trees_too": run_parent_trees_too,
                 "fetch_input": fetch_input,
                 "emit_ran_signal": emit_ran_signal,
             },
-            run_finally_kwargs={
+            "run_finally_kwargs": {
                 "emit_ran_signal": emit_ran_signal,
                 "raise_run_exceptions": raise_run_exceptions,
             },
-        )
+        }
 
     def _before_run(
         self,
@@ -518,22 +690,73 @@ class Node(
         if fetch_input:
             self.inputs.fetch()
 
-        if self.use_cache and self.cache_hit:  # Read and use cache
-
-            if self.parent is None and emit_ran_signal:
-                self.emit()
-            elif self.parent is not None:
-                self.parent.register_child_starting(self)
-                self.parent.register_child_finished(self)
-                if emit_ran_signal:
-                    self.parent.register_child_emitting(self)
-
+        input_fingerprint = self._input_fingerprint() if self.use_cache else None
+        if (
+            input_fingerprint is not None
+            and input_fingerprint == self._cached_input_fingerprint
+        ):  # Read and use cache
+            self._register_cache_hit(emit_ran_signal)
             return True, self._outputs_to_run_return()
         elif self.use_cache:  # Write cache and continue
-            self._cached_inputs = self.inputs.to_value_dict()
+            self._cached_input_fingerprint = input_fingerprint
+
+        self._persistent_cache_key = (
+            self.persistent_cache.key(self, input_fingerprint=input_fingerprint)
+            if input_fingerprint is not None and self.persistent_cache is not None
+            else None
+        )
+        if self._persistent_cache_key is not None and self._load_persistent_cache():
+            self._persistent_cache_key = None
+            self._register_cache_hit(emit_ran_signal)
+            return True, self._outputs_to_run_return()
 
         return super()._before_run(check_readiness=check_readiness)
 
+    def _register_cache_hit(self, emit_ran_signal: bool):
+        if self.parent is None and emit_ran_signal:
+            self.emit()
+        elif self.parent is not None:
+            self.parent.register_child_starting(self)
+            self.parent.register_child_finished(self)
+            if emit_ran_signal:
+                self.parent.register_child_emitting(self)
+
+    @property
+    def profiling(self) -> bool:
+        return super().profiling or (
+            self.parent is not None and self.parent._run_profile_draft is not None
+        )
+
+    def _record_run_profile(self, profile: RunProfile) -> None:
+        super()._record_run_profile(profile)
+        if self.parent is not None and self.parent._run_profile_draft is not None:
+            self.parent.register_child_profile(profile)
+
+    def _load_persistent_cache(self) -> bool:
+        """
+        Update output from the persistent cache, if it has a matching entry.
+
+        Returns:
+            (bool): Whether the output was loaded.
+        """
+        cached = self.persistent_cache.load(self._persistent_cache_key)
+        if cached is None or set(cached.keys()) != set(self.outputs.labels):
+            return False
+        for label, value in cached.items():
+            self.outputs[label].value = value
+        logger.info(f"{self.full_label} loaded its output from the persistent cache")
+        return True
+
+    def _save_persistent_cache(self):
+        try:
+            self.persistent_cache.save(
+                self._persistent_cache_key, self.outputs.to_value_dict()
+            )
+        except Exception as e:
+            logger.warning(
+                f"{self.full_label} could not write to the persistent cache: {e}"
+            )
+
     def _run(
         self,
         executor: Executor | None,
@@ -552,18 +775,45 @@ class Node(
             finish_run_kwargs=finish_run_kwargs,
         )
 
-    def _run_finally(self, /, emit_ran_signal: bool, raise_run_exceptions: bool):
-        super()._run_finally()
+    async def _arun(
+        self,
+        executor: Executor | None,
+        raise_run_exceptions: bool,
+        run_exception_kwargs: dict,
+        run_finally_kwargs: dict,
+        finish_run_kwargs: dict,
+    ) -> Any | tuple:
         if self.parent is not None:
-            self.parent.register_child_finished(self)
-        if self.checkpoint is not None:
-            self.save_checkpoint(self.checkpoint)
+            self.parent.register_child_starting(self)
+        return await super()._arun(
+            executor=executor,
+            raise_run_exceptions=raise_run_exceptions,
+            run_exception_kwargs=run_exception_kwargs,
+            run_finally_kwargs=run_finally_kwargs,
+            finish_run_kwargs=finish_run_kwargs,
+        )
 
-        if emit_ran_signal:
-            if self.parent is None:
+    def _run_finally(self, /, emit_ran_signal: bool, raise_run_exceptions: bool):
+        super()._run_finally()
+        if self._persistent_cache_key is not None:
+            if not self.failed:
+                self._save_persistent_cache()
+            self._persistent_cache_key = None
+
+        if self.parent is None:
+            if self.checkpoint is not None:
+                self.save_checkpoint(self.checkpoint)
+            if emit_ran_signal:
                 self.emit()
-            else:
-                self.parent.register_child_emitting(self)
+        else:
+            with self.parent._child_signal_condition:
+                # Hold the parent's run loop until our signals are queued, so it can't
+                # mistake us finishing for the end of its run
+                self.parent.register_child_finished(self)
+                if self.checkpoint is not None:
+                    self.save_checkpoint(self.checkpoint)
+                if emit_ran_signal:
+                    self.parent.register_child_emitting(self)
 
         if (
             self.failed
@@ -583,118 +833,108 @@ class Node(
         Use topological analysis to build a tree of all upstream dependencies and run
         them.
 
+        Each upstream node runs as soon as the nodes it depends on are done, so
+        independent branches run concurrently when their nodes have executors (or
+        are `async`). Nodes without an executor get the parent's
+        :attr:`pyiron_workflow.nodes.composite.Composite.scheduler` (if any) for the
+        duration. No `ran` signals get emitted, so nothing outside the tree gets
+        triggered, and neither labels nor signal connections get touched.
+
         Args:
             run_parent_trees_too (bool): First, call the same method on this node's
                 parent (if one exists), and recursively up the parentage tree. (Default
                 is False, only run nodes in this scope, i.e. sharing the same parent.)
+
+        Raises:
+            CircularDataFlowError: When the data tree is not a DAG.
         """
         if run_parent_trees_too and self.parent is not None:
             self.parent.run_data_tree(run_parent_trees_too=True)
             self.parent.inputs.fetch()
 
-        label_map = {}
-        nodes = {}
+        upstream = data_tree_dependencies(self)
+        del upstream[self]  # It's last, and nothing else depends on it
+        if len(upstream) == 0:
+            return
 
-        data_tree_nodes = get_nodes_in_data_tree(self)
-        for node in data_tree_nodes:
-            if node.executor is not None:
-                raise ValueError(
-                    f"Running the data tree is pull-paradigm action, and is "
-                    f"incompatible with using executors. While running "
-                    f"{self.full_label}, an executor request was found on "
-                    f"{node.full_label}"
-                )
-
-        for node in data_tree_nodes:
-            modified_label = node.label + str(id(node))
-            label_map[modified_label] = node.label
-            node.label = modified_label  # Ensure each node has a unique label
-            # This is necessary when the nodes do not have a workflow and may thus have
-            # arbitrary labels.
-            # This is pretty ugly; it would be nice to not depend so heavily on labels.
-            # Maybe we could switch a bunch of stuff to rely on the unique ID?
-            nodes[modified_label] = node
+        scheduler, owns_scheduler = (
+            (None, False) if self.parent is None else self.parent._parse_scheduler()
+        )
+        scheduled = (
+            []
+            if scheduler is None
+            else self.parent._lend_scheduler(scheduler, upstream)
+        )
+        try:
+            await_synchronously(_arun_in_dag_order(upstream))
+        finally:
+            for node in scheduled:
+                node.executor = None
+            if owns_scheduler:
+                scheduler.shutdown(wait=True)
 
+    def _input_fingerprint(self) -> str | None:
         try:
-            disconnected_pairs, starters = set_run_connections_according_to_linear_dag(
-                nodes
-            )
-            data_tree_starters = list(set(starters).intersection(data_tree_nodes))
-        except Exception as e:
-            # If the dag setup fails it will repair any connections it breaks before
-            # raising the error, but we still need to repair our label changes
-            for modified_label, node in nodes.items():
-                node.label = label_map[modified_label]
-            raise e
+            return fingerprint_values(self.inputs.to_value_dict())
+        except FingerprintError as e:
+            logger.debug(f"{self.full_label} input cannot be fingerprinted: {e}")
+            return None
+
+    @property
+    def cache_hit(self) -> bool:
+        if self._cached_input_fingerprint is None:
+            return False
+        return self._input_fingerprint() == self._cached_input_fingerprint
 
+    @classmethod
+    def _fingerprint_source(cls) -> str | None:
+        """
+        The source code determining what the node computes, or None if it cannot be
+        found.
+        """
         try:
-            parent_starting_nodes = (
-                self.parent.starting_nodes if self.parent is not None else None
-            )  # We need these for state recovery later, even if we crash
+            return getsource(cls)
+        except (OSError, TypeError):
+            return None
 
-            if len(data_tree_starters) == 1 and data_tree_starters[0] is self:
-                # If you're the only one in the data tree, there's nothing upstream to
-                # run.
-                pass
-            else:
-                for node in set(nodes.values()).difference(data_tree_nodes):
-                    # Disconnect any nodes not in the data tree to avoid unnecessary
-                    # execution
-                    node.signals.disconnect_run()
-
-                self.signals.disconnect_run()
-                # Don't let anything upstream trigger _this_ node
-
-                if self.parent is None:
-                    for starter in data_tree_starters:
-                        starter.run()  # Now push from the top
-                else:
-                    # Run the special exec connections from above with the parent
-
-                    # Workflow parents will attempt to automate execution on run,
-                    # undoing all our careful execution
-                    # This heinous hack breaks in and stops that behaviour
-                    # I recognize this is dirty, but let's be pragmatic about getting
-                    # the features playing together. Workflows and pull are anyhow
-                    # already both very annoying on their own...
-                    from pyiron_workflow.workflow import Workflow
-
-                    if isinstance(self.parent, Workflow):
-                        automated = self.parent.automate_execution
-                        self.parent.automate_execution = False
-
-                    self.parent.starting_nodes = data_tree_starters
-                    self.parent.run()
-
-                    # And revert our workflow hack
-                    if isinstance(self.parent, Workflow):
-                        self.parent.automate_execution = automated
-        finally:
-            # No matter what, restore the original connections and labels afterwards
-            for modified_label, node in nodes.items():
-                node.label = label_map[modified_label]
-                node.signals.disconnect_run()
-            for c1, c2 in disconnected_pairs:
-                c1.connect(c2)
-            if self.parent is not None:
-                self.parent.starting_nodes = parent_starting_nodes
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _class_fingerprint(cls) -> str:
+        return fingerprint_code(
+            cls.__module__, cls.__qualname__, cls._fingerprint_source()
+        )
 
     @property
-    def cache_hit(self):
-        try:
-            return self.inputs.to_value_dict() == self._cached_inputs
-        except:
-            return False
+    def code_fingerprint(self) -> str:
+        """
+        A fingerprint of the code defining what this node computes, stable across
+        python sessions.
+
+        Raises:
+            (pyiron_workflow.fingerprint.FingerprintError): If the source code cannot
+                be found, e.g. for classes defined in an interactive session.
+        """
+        return self._class_fingerprint()
 
     @property
     def _temporary_result_file(self):
         return self.as_path().joinpath("run_result.tmp")
 
     def _temporary_result_pickle(self, results):
-        self._temporary_result_file.parent.mkdir(parents=True, exist_ok=True)
-        self._temporary_result_file.touch(exist_ok=False)
-        with self._temporary_result_file.open("wb") as f:
-            cloudpickle.dump(results, f)
+        _pickle_result(self._temporary_result_file, results)
+
+    @property
+    def _mapped_array_directory(self):
+        return self.as_path().joinpath("mapped_arrays")
+
+    def _unlink_mapped_arrays(self):
+        # Hang on to any files which are still in use, to try again later
+        self._mapped_arrays = [m for m in self._mapped_arrays if not m.unlink()]
+        if self._mapped_array_directory.is_dir() and not any(
+            self._mapped_array_directory.iterdir()
+        ):
+            self._mapped_array_directory.rmdir()
+            self._remove_empty_directories()
 
     def _temporary_result_unpickle(self):
         with self._temporary_result_file.open("rb") as f:
@@ -1069,20 +1309,35 @@ class Node(
 
     def _clean_graph_directory(self):
         """
-        Delete the temporary results file (if any), and then go from this node's
-        semantic directory up to its semantic root's directory removing any empty
-        directories. Note: doesn't do a sophisticated walk, so sibling empty
-        directories will cause a parent to identify as non-empty.
+        Delete the temporary results file and memory-mapped array files (if any), and
+        then go from this node's semantic directory up to its semantic root's
+        directory removing any empty directories. Note: doesn't do a sophisticated
+        walk, so sibling empty directories will cause a parent to identify as
+        non-empty.
         """
         self._temporary_result_file.unlink(missing_ok=True)
+        self._unlink_mapped_arrays()
+        self._remove_empty_directories()
 
-        # Recursively remove empty directories
+    def _remove_empty_directories(self):
+        """
+        Go from this node's semantic directory up to its semantic root's directory,
+        removing empty directories until a non-empty one is found.
+        """
         root_directory = self.semantic_root.as_path().parent
         for parent in self._temporary_result_file.parents:
             if parent == root_directory or not parent.exists() or any(parent.iterdir()):
                 break
             parent.rmdir()
 
+    def __setstate__(self, state):
+        # States saved before content-based caching or memory-mapped results lack
+        # these -- without a fingerprint, the first run is simply a cache miss
+        state.setdefault("_cached_input_fingerprint", None)
+        state.setdefault("_persistent_cache_key", None)
+        state.setdefault("_mapped_arrays", [])
+        super().__setstate__(state)
+
     def display_state(self, state=None, ignore_private=True):
         state = dict(self.__getstate__()) if state is None else state
         if self.parent is not None:
@@ -1097,3 +1352,93 @@ class Node(
         Any additional info that may be particularly useful for users of the node class.
         """
         return ""
+
+
+def _pickle_result(file: Path, results):
+    file.parent.mkdir(parents=True, exist_ok=True)
+    file.touch(exist_ok=False)
+    with file.open("wb") as f:
+        cloudpickle.dump(results, f)
+
+
+class _DetachedOnRun:
+    """
+    Does what :meth:`Node.on_run` does, but with a computation that doesn't need the
+    node, so that executors get sent only that computation instead of the whole node.
+    """
+
+    def __init__(
+        self,
+        fnc: callable,
+        result_file: Path | None,
+        mapped_array_directory: Path,
+        memmap_threshold: int | None,
+    ):
+        self.fnc = fnc
+        self.result_file = result_file
+        self.mapped_array_directory = mapped_array_directory
+        self.memmap_threshold = memmap_threshold
+
+    def __call__(self, save_result: bool, map_arrays: bool, /, *args, **kwargs):
+        result = self.fnc(*args, **kwargs)
+        if isawaitable(result):
+            result = await_synchronously(result)
+        if map_arrays:
+            result = map_large_arrays(
+                result, self.mapped_array_directory, self.memmap_threshold
+            )
+        if save_result:
+            _pickle_result(self.result_file, result)
+        return result
+
+
+async def _arun_in_dag_order(dependencies: dict[Node, set[Node]]) -> None:
+    """
+    Pull-run each node as soon as all the nodes it depends on have run, so that
+    independent branches run concurrently.
+
+    Args:
+        dependencies (dict[Node, set[Node]]): The nodes to run, in execution order,
+            and the nodes among them that each one depends on.
+
+    Raises:
+        (Exception): The first exception (in execution order) encountered by a node;
+            once a node fails, the tasks of all the nodes downstream of it get
+            cancelled.
+    """
+    downstream = {node: set() for node in dependencies}
+    for node, upstream in dependencies.items():
+        for n in upstream:
+            downstream[n].add(node)
+    tasks = {}
+
+    def cancel_downstream(node: Node):
+        for d in downstream[node]:
+            if tasks[d].cancel():
+                cancel_downstream(d)
+
+    async def run_after(node: Node, upstream: list[asyncio.Task]):
+        if len(upstream) > 0:
+            # Unlike gather, wait leaves the upstream tasks alone when this one gets
+            # cancelled -- other branches may still depend on them
+            await asyncio.wait(upstream)
+            for task in upstream:
+                task.result()  # Don't run on top of a failed or cancelled upstream
+        try:
+            await node.arun(
+                run_data_tree=False,
+                fetch_input=True,
+                check_readiness=True,
+                emit_ran_signal=False,
+            )
+        except Exception:
+            cancel_downstream(node)
+            raise
+
+    for node, upstream in dependencies.items():
+        tasks[node] = asyncio.create_task(run_after(node, [tasks[n] for n in upstream]))
+    for result in await asyncio.gather(*tasks.values(), return_exceptions=True):
+        if isinstance(result, BaseException) and not isinstance(
+            result, asyncio.CancelledError
+        ):
+            raise result
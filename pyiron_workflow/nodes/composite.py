@@ -6,16 +6,24 @@ sub-graph
 from __future__ import annotations
 
 from abc import ABC
-from time import sleep
-from typing import Literal, Optional, TYPE_CHECKING
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from threading import Condition
+from typing import Iterable, Literal, Optional, TYPE_CHECKING
 
 from pyiron_snippets.colors import SeabornColors
 from pyiron_snippets.dotdict import DotDict
 
 from pyiron_workflow.create import HasCreator
+from pyiron_workflow.fingerprint import fingerprint_code
+from pyiron_workflow.mixin.run import EventLoopExecutor
 from pyiron_workflow.node import Node
 from pyiron_workflow.mixin.semantics import SemanticParent
-from pyiron_workflow.topology import set_run_connections_according_to_dag
+from pyiron_workflow.topology import (
+    ExecutionPlan,
+    critical_path_priorities,
+    set_run_connections_according_to_dag,
+)
 
 if TYPE_CHECKING:
     from pyiron_workflow.channels import (
@@ -24,6 +32,7 @@ if TYPE_CHECKING:
         OutputSignal,
     )
     from pyiron_workflow.create import Creator, Wrappers
+    from pyiron_workflow.profiling import RunProfile
     from pyiron_workflow.storage import StorageInterface
 
 
@@ -105,6 +114,29 @@ class Composite(SemanticParent, HasCreator, Node, ABC):
         provenance_by_execution (list[str]): The child nodes (by label) in the order
             that they started executing on the last :meth:`run` call.
         running_children (list[str]): The names of children who are currently running.
+        run_profile (pyiron_workflow.profiling.RunProfile | None): For composites, the
+            profile also holds the profiles of all child runs (recursively), so it is
+            a trace of the whole sub-graph, which can be exported to the Chrome trace
+            event format with its :meth:`to_chrome_trace` method.
+        scheduler (int | Executor | tuple[callable, tuple, dict] | None): An executor
+            to run children on, so that independent children run concurrently without
+            needing executors assigned individually. For the duration of each run, it
+            gets lent to each child that doesn't have an :attr:`executor` of its own;
+            the execution flow still decides _when_ each child runs, so data
+            dependencies are respected and each child is dispatched as soon as its
+            upstream nodes are done. An integer gets a thread pool with that many
+            workers. Executor instances are shared across runs, while integers and
+            instructions for building an executor (as for :attr:`executor`) give a
+            fresh executor each run, which is shut down afterwards. Process-based
+            executors need to be able to serialize the children, e.g.
+            :class:`pyiron_workflow.executors.CloudpickleProcessPoolExecutor`. Failures
+            of children on the scheduler get raised by the composite once the other
+            children are done. When several children are ready at once, those with
+            the longest chain of work downstream of them (weighted by their
+            :attr:`run_duration` from previous runs, where available) go first. For
+            integer schedulers, ready children are held back until a worker is free,
+            so this priority holds throughout the run. (Default is None, children
+            without their own executor run in the composite's process and thread.)
         signal_queue (list[tuple[OutputSignal, InputSignal]]): Pending signal event
             pairs from child execution flow connections.
         starting_nodes (None | list[pyiron_workflow.node.Node]): A subset
@@ -139,8 +171,15 @@ class Composite(SemanticParent, HasCreator, Node, ABC):
         self.provenance_by_completion: list[str] = []
         self.running_children: list[str] = []
         self.signal_queue: list[tuple[OutputSignal, InputSignal]] = []
-        self._child_sleep_interval = 0.01  # How long to wait when the signal_queue is
-        # empty but the running_children list is not
+        self._child_signal_condition = Condition()  # Guards the signal queue and
+        # running children, and wakes the run loop when either of them changes
+        self._run_loop_wakeup: tuple[asyncio.AbstractEventLoop, asyncio.Event] | None
+        self._run_loop_wakeup = None  # The same, for run loops on an event loop
+        self.scheduler: int | Executor | tuple[callable, tuple, dict] | None = None
+        self._child_profiles: list[RunProfile] = []
+        self._topology_version = 0  # Bumped whenever the children or their
+        # connections change
+        self._execution_plan: ExecutionPlan | None = None
 
         super().__init__(
             label,
@@ -165,38 +204,289 @@ class Composite(SemanticParent, HasCreator, Node, ABC):
             node.deactivate_strict_hints()
 
     def _on_run(self):
-        # Reset provenance and run status trackers
+        self._reset_run_trackers()
+
+        scheduler, owns_scheduler = self._parse_scheduler()
+        scheduled = self._lend_scheduler(scheduler)
+        priorities = None if scheduler is None else self._get_child_priorities()
+        capacity = self._get_scheduler_capacity(owns_scheduler)
+        try:
+            self._start_children(priorities=priorities, capacity=capacity)
+            self._run_while_children_or_signals_exist(
+                priorities=priorities, capacity=capacity, scheduled=scheduled
+            )
+        finally:
+            self._return_scheduler(scheduler, owns_scheduler, scheduled)
+
+        self._raise_scheduled_failures(scheduled)
+
+        return self
+
+    async def _on_run_async(self):
+        """
+        Run the children as tasks on the running event loop (unless they have an
+        executor of their own, or get the :attr:`scheduler`), so that children which
+        await things run concurrently.
+        """
+        if (
+            type(self)._on_run is not Composite._on_run
+            and type(self)._on_run_async is Composite._on_run_async
+        ):
+            # A customized run without an awaitable counterpart, so respect it
+            return self._on_run()
+
+        self._reset_run_trackers()
+
+        scheduler, owns_scheduler = self._parse_scheduler()
+        scheduled = self._lend_scheduler(scheduler)
+        priorities = None if scheduler is None else self._get_child_priorities()
+        capacity = self._get_scheduler_capacity(owns_scheduler)
+        loop = asyncio.get_running_loop()
+        on_loop = self._lend_scheduler(EventLoopExecutor(loop))
+        self._run_loop_wakeup = (loop, asyncio.Event())
+        try:
+            self._start_children(priorities=priorities, capacity=capacity)
+            await self._arun_while_children_or_signals_exist(
+                priorities=priorities, capacity=capacity, scheduled=scheduled
+            )
+        finally:
+            self._run_loop_wakeup = None
+            self._return_scheduler(scheduler, owns_scheduler, scheduled + on_loop)
+
+        self._raise_scheduled_failures(scheduled + on_loop)
+
+        return self
+
+    def _reset_run_trackers(self):
+        """Reset provenance and run status trackers."""
         self.provenance_by_execution = []
         self.provenance_by_completion = []
         self.running_children = [n.label for n in self if n.running]
         self.signal_queue = []
+        self._child_profiles = []
+
+    def _parse_scheduler(self) -> tuple[Executor | None, bool]:
+        """
+        Returns:
+            (Executor | None): The executor to run children on, if any.
+            (bool): Whether this executor was created just for this run.
+        """
+        if self.scheduler is None:
+            return None, False
+        elif isinstance(self.scheduler, int) and not isinstance(self.scheduler, bool):
+            if self.scheduler < 1:
+                raise ValueError(
+                    f"{self.full_label} needs a positive number of scheduler workers, "
+                    f"but got {self.scheduler}"
+                )
+            return ThreadPoolExecutor(max_workers=self.scheduler), True
+        executor = self._parse_executor(self.scheduler)
+        return executor, executor is not self.scheduler
+
+    def _get_scheduler_capacity(self, owns_scheduler: bool) -> int | None:
+        """
+        How many children can run on the scheduler at once, if this is limited.
+        """
+        return (
+            self.scheduler
+            if owns_scheduler and isinstance(self.scheduler, int)
+            else None
+        )
 
+    def _start_children(
+        self,
+        priorities: Optional[dict[str, float]] = None,
+        capacity: Optional[int] = None,
+    ) -> None:
+        """
+        Resume the children that were still running, or otherwise run the starting
+        nodes -- highest priority first, and queueing any beyond the capacity for the
+        run loop to start once there are free workers.
+        """
         if len(self.running_children) > 0:  # Start from a broken process
             for label in self.running_children:
                 self.children[label].run()
                 # Running children will find serialized result and proceed,
                 # or raise an error because they're already running
         else:  # Start fresh
-            for node in self.starting_nodes:
+            starting_nodes = self.starting_nodes
+            if priorities is not None:
+                starting_nodes = sorted(
+                    starting_nodes, key=lambda n: -priorities.get(n.label, 0.0)
+                )
+            if capacity is not None:
+                # Leave the rest to the run loop, which waits for free workers
+                for node in starting_nodes[capacity:]:
+                    self.signal_queue.append((None, node.signals.input.run))
+                starting_nodes = starting_nodes[:capacity]
+            for node in starting_nodes:
                 node.run()
 
-        self._run_while_children_or_signals_exist()
+    @staticmethod
+    def _return_scheduler(
+        scheduler: Executor | None, owns_scheduler: bool, scheduled: list[Node]
+    ) -> None:
+        """Take the scheduler back from the children, and shut it down if ours."""
+        for child in scheduled:
+            child.executor = None
+        if owns_scheduler:
+            scheduler.shutdown(wait=True)
+
+    def _lend_scheduler(
+        self, scheduler: Executor | None, children: Optional[Iterable[Node]] = None
+    ) -> list[Node]:
+        """
+        Give the scheduler to the children (default is all of them) that don't have
+        an executor of their own.
 
-        return self
+        Returns:
+            (list[Node]): The children that got the scheduler.
+        """
+        if scheduler is None:
+            return []
+        children = self if children is None else children
+        scheduled = [child for child in children if child.executor is None]
+        for child in scheduled:
+            child.executor = scheduler
+        return scheduled
+
+    def _get_child_priorities(self) -> dict[str, float] | None:
+        """
+        Critical-path priorities for the children, or None if the data flow isn't
+        suitable for computing them (e.g. because it is cyclic).
+        """
+        if len(self) == 0:
+            return None
+        try:
+            return critical_path_priorities(
+                self.children,
+                durations={
+                    child.label: child.run_duration
+                    for child in self
+                    if child.run_duration is not None
+                },
+            )
+        except (ValueError, KeyError):
+            return None
+
+    def _raise_scheduled_failures(self, scheduled: list[Node]) -> None:
+        # Exceptions on executors don't propagate back to us, so look for them
+        errors = {
+            child.label: (
+                None
+                if child.future is None or not child.future.done()
+                else child.future.exception()
+            )
+            for child in scheduled
+            if child.failed and child.label in self.provenance_by_execution
+        }
+        if len(errors) > 0:
+            cause = next(iter(errors.values()))
+            raise FailedChildError(
+                f"{self.full_label} encountered error(s) in scheduled child(ren): "
+                f"{errors}"
+            ) from (cause if len(errors) == 1 else None)
+
+    def _run_while_children_or_signals_exist(
+        self,
+        priorities: Optional[dict[str, float]] = None,
+        capacity: Optional[int] = None,
+        scheduled: tuple[Node, ...] | list[Node] = (),
+    ):
+        """
+        Fire queued signals until no children are running and no signals are left.
 
-    def _run_while_children_or_signals_exist(self):
+        Args:
+            priorities (dict[str, float] | None): Priorities for the children by label.
+                When given, the queued signal going to the highest priority child
+                gets fired first, instead of the oldest. (Default is None, FIFO.)
+            capacity (int | None): The maximum number of :param:`scheduled` children
+                to have running at once; signals wait in the queue until there is
+                space. (Default is None, no limit.)
+            scheduled (tuple[Node, ...] | list[Node]): Children running on the
+                scheduler.
+        """
+        scheduled_labels = set(child.label for child in scheduled)
         errors = {}
-        while len(self.running_children) > 0 or len(self.signal_queue) > 0:
-            try:
-                firing, receiving = self.signal_queue.pop(0)
-                try:
-                    receiving(firing)
-                except Exception as e:
-                    errors[receiving.full_label] = e
-            except IndexError:
-                # The signal queue is empty, but there is still someone running...
-                sleep(self._child_sleep_interval)
+        while True:
+            with self._child_signal_condition:
+                self._child_signal_condition.wait_for(
+                    lambda: self._can_proceed(capacity, scheduled_labels)
+                )
+                signal = self._pop_next_signal(priorities)
+            if signal is None:
+                break
+            # The condition is released while firing, so children running on
+            # executors can keep registering themselves in the meantime
+            self._fire_signal(*signal, errors)
+
+        self._raise_child_errors(errors)
 
+    async def _arun_while_children_or_signals_exist(
+        self,
+        priorities: Optional[dict[str, float]] = None,
+        capacity: Optional[int] = None,
+        scheduled: tuple[Node, ...] | list[Node] = (),
+    ):
+        """
+        Fire queued signals until no children are running and no signals are left,
+        waiting for children without blocking the event loop.
+
+        Takes the same arguments as :meth:`_run_while_children_or_signals_exist`.
+        """
+        wakeup = self._run_loop_wakeup[1]
+        scheduled_labels = set(child.label for child in scheduled)
+        errors = {}
+        while True:
+            wakeup.clear()  # Before checking, so no wakeup call can get lost
+            with self._child_signal_condition:
+                can_proceed = self._can_proceed(capacity, scheduled_labels)
+                signal = self._pop_next_signal(priorities) if can_proceed else None
+            if not can_proceed:
+                await wakeup.wait()
+            elif signal is None:
+                break
+            else:
+                self._fire_signal(*signal, errors)
+
+        self._raise_child_errors(errors)
+
+    def _can_proceed(self, capacity: int | None, scheduled_labels: set[str]) -> bool:
+        """
+        Whether the run loop can fire a queued signal or is done, i.e. whether there
+        is a signal and room to run its receiver, or nobody is running. Call while
+        holding the child signal condition.
+        """
+        has_capacity = capacity is None or capacity > sum(
+            label in scheduled_labels for label in self.running_children
+        )
+        return (len(self.signal_queue) > 0 and has_capacity) or len(
+            self.running_children
+        ) == 0
+
+    def _pop_next_signal(
+        self, priorities: Optional[dict[str, float]]
+    ) -> tuple[OutputSignal | None, InputSignal] | None:
+        """
+        The next signal to fire, or None if there is nothing left to fire. Call while
+        holding the child signal condition, once the run loop can proceed.
+        """
+        if len(self.signal_queue) == 0:
+            return None
+        return self.signal_queue.pop(self._next_signal_index(priorities))
+
+    @staticmethod
+    def _fire_signal(
+        firing: OutputSignal | None,
+        receiving: InputSignal,
+        errors: dict[str, Exception],
+    ) -> None:
+        try:
+            receiving(firing)
+        except Exception as e:
+            errors[receiving.full_label] = e
+
+    def _raise_child_errors(self, errors: dict[str, Exception]) -> None:
         if len(errors) == 1:
             raise FailedChildError(
                 f"{self.full_label} encountered error in child: {errors}"
@@ -206,6 +496,15 @@ class Composite(SemanticParent, HasCreator, Node, ABC):
                 f"{self.full_label} encountered multiple errors in children: {errors}"
             ) from None
 
+    def _next_signal_index(self, priorities: Optional[dict[str, float]]) -> int:
+        if priorities is None:
+            return 0
+        # max returns the first of equals, so ties stay first-in-first-out
+        return max(
+            range(len(self.signal_queue)),
+            key=lambda i: priorities.get(self.signal_queue[i][1].owner.label, 0.0),
+        )
+
     def register_child_starting(self, child: Node) -> None:
         """
         To be called by children when they start their run cycle.
@@ -215,44 +514,93 @@ class Composite(SemanticParent, HasCreator, Node, ABC):
                 signal. Should always be a child of `self`, but this is not explicitly
                 verified at runtime.
         """
-        self.provenance_by_execution.append(child.label)
-        self.running_children.append(child.label)
+        with self._child_signal_condition:
+            self.provenance_by_execution.append(child.label)
+            self.running_children.append(child.label)
 
     def register_child_finished(self, child: Node) -> None:
         """
         To be called by children when they are finished their run.
 
+        Wakes up the run loop, which may be waiting on this child to finish.
+
         Args:
             child [Node]: The child that is finished and would like to fire its `ran`
                 signal. Should always be a child of `self`, but this is not explicitly
                 verified at runtime.
         """
-        try:
-            self.running_children.remove(child.label)
-            self.provenance_by_completion.append(child.label)
-        except ValueError as e:
-            raise KeyError(
-                f"No element {child.label} to remove while {self.running_children}, "
-                f"{self.provenance_by_execution}, {self.provenance_by_completion}"
-            ) from e
+        with self._child_signal_condition:
+            try:
+                self.running_children.remove(child.label)
+                self.provenance_by_completion.append(child.label)
+            except ValueError as e:
+                raise KeyError(
+                    f"No element {child.label} to remove while "
+                    f"{self.running_children}, {self.provenance_by_execution}, "
+                    f"{self.provenance_by_completion}"
+                ) from e
+            self._notify_run_loop()
+
+    def _notify_run_loop(self) -> None:
+        """Wake up the run loop. Call while holding the child signal condition."""
+        self._child_signal_condition.notify_all()
+        if self._run_loop_wakeup is not None:
+            loop, wakeup = self._run_loop_wakeup
+            loop.call_soon_threadsafe(wakeup.set)
+
+    def register_child_profile(self, profile: RunProfile) -> None:
+        """
+        To be called by profiled children when they are finished their run.
+
+        Args:
+            profile [RunProfile]: The profile of the child's run.
+        """
+        with self._child_signal_condition:
+            self._child_profiles.append(profile)
+
+    def _record_run_profile(self, profile: RunProfile) -> None:
+        profile.children = self._child_profiles
+        self._child_profiles = []
+        super()._record_run_profile(profile)
 
     def register_child_emitting(self, child: Node) -> None:
         """
         To be called by children when they want to emit their signals.
 
+        Wakes up the run loop so the queued signals get fired right away.
+
         Args:
             child [Node]: The child that is finished and would like to fire its `ran`
                 signal (and possibly others). Should always be a child of `self`, but
                 this is not explicitly verified at runtime.
         """
-        for firing in child.emitting_channels:
-            for receiving in firing.connections:
-                self.signal_queue.append((firing, receiving))
+        with self._child_signal_condition:
+            for firing in child.emitting_channels:
+                for receiving in firing.connections:
+                    self.signal_queue.append((firing, receiving))
+            self._notify_run_loop()
 
     @property
     def _run_args(self) -> tuple[tuple, dict]:
         return (), {}
 
+    @property
+    def code_fingerprint(self) -> str:
+        """
+        A fingerprint of this class's code combined with the code and connections of
+        all the children.
+        """
+        return fingerprint_code(
+            self.__class__.__module__,
+            self.__class__.__qualname__,
+            "\n".join(
+                [self._class_fingerprint()]
+                + sorted(f"{n.label}:{n.code_fingerprint}" for n in self)
+                + sorted(str(c) for c in self._child_data_connections)
+                + sorted(str(c) for c in self._child_signal_connections)
+            ),
+        )
+
     def process_run_result(self, run_output):
         if run_output is not self:
             self._parse_remotely_executed_self(run_output)
@@ -263,6 +611,7 @@ class Composite(SemanticParent, HasCreator, Node, ABC):
         for node in self:
             node._parent = None
             node._detached_parent_path = None
+            node._invalidate_semantic_path()
         other_self.running = False  # It's done now
         state = self._get_state_from_remote_other(other_self)
         self.__setstate__(state)
@@ -271,6 +620,9 @@ class Composite(SemanticParent, HasCreator, Node, ABC):
         state = other_self.__getstate__()
         state.pop("executor")  # Got overridden to None for __getstate__, so keep local
         state.pop("_parent")  # Got overridden to None for __getstate__, so keep local
+        if state["scheduler"] is None and self.scheduler is not None:
+            state.pop("scheduler")  # May have been overridden to None for
+            # __getstate__ to avoid serializing an executor instance, so keep local
         return state
 
     def disconnect_run(self) -> list[tuple[Channel, Channel]]:
@@ -293,6 +645,23 @@ class Composite(SemanticParent, HasCreator, Node, ABC):
         """
         _, upstream_most_nodes = set_run_connections_according_to_dag(self.children)
         self.starting_nodes = upstream_most_nodes
+        self._execution_plan = ExecutionPlan(
+            self._topology_version, tuple(n.label for n in upstream_most_nodes)
+        )
+
+    def _apply_execution_plan(self):
+        """
+        Make sure the run signals follow the DAG flow of the data, re-using the last
+        execution plan if the topology hasn't changed since it was made.
+        """
+        plan = self._execution_plan
+        if plan is None or plan.topology_version != self._topology_version:
+            self.set_run_signals_to_dag_execution()
+        else:
+            self.starting_nodes = [self.children[l] for l in plan.starting_labels]
+
+    def _topology_changed(self) -> None:
+        self._topology_version += 1
 
     def add_child(
         self,
@@ -305,7 +674,8 @@ class Composite(SemanticParent, HasCreator, Node, ABC):
                 f"Only new {Node.__name__} instances may be added, but got "
                 f"{type(child)}."
             )
-        self._cached_inputs = None  # Reset cache after graph change
+        self._cached_input_fingerprint = None  # Reset cache after graph change
+        self._topology_changed()
         return super().add_child(child, label=label, strict_naming=strict_naming)
 
     def remove_child(self, child: Node | str) -> list[tuple[Channel, Channel]]:
@@ -323,9 +693,28 @@ class Composite(SemanticParent, HasCreator, Node, ABC):
         disconnected = child.disconnect()
         if child in self.starting_nodes:
             self.starting_nodes.remove(child)
-        self._cached_inputs = None  # Reset cache after graph change
+        self._cached_input_fingerprint = None  # Reset cache after graph change
+        self._topology_changed()
         return disconnected
 
+    def _child_data_connections_changed(self) -> None:
+        """
+        A hook called whenever a data connection forms or breaks on one of the
+        children.
+        """
+        self._topology_changed()
+
+    def _child_signal_connections_changed(self) -> None:
+        """
+        A hook called whenever a signal connection forms or breaks on one of the
+        children.
+        """
+        self._topology_changed()
+
+    def _child_relabeled(self, child: Node) -> None:
+        super()._child_relabeled(child)
+        self._topology_changed()
+
     def replace_child(
         self, owned_node: Node | str, replacement: Node | type[Node]
     ) -> Node:
@@ -403,8 +792,8 @@ class Composite(SemanticParent, HasCreator, Node, ABC):
             sending_channel.value_receiver = receiving_channel
 
         # Clear caches
-        self._cached_inputs = None
-        replacement._cached_inputs = None
+        self._cached_input_fingerprint = None
+        replacement._cached_input_fingerprint = None
 
         return owned_node
 
@@ -496,6 +885,12 @@ class Composite(SemanticParent, HasCreator, Node, ABC):
 
     def __getstate__(self):
         state = super().__getstate__()
+        # Thread synchronization primitives can't be serialized
+        del state["_child_signal_condition"]
+        del state["_run_loop_wakeup"]
+        if isinstance(self.scheduler, Executor):
+            state["scheduler"] = None  # Nor can executor instances
+
         # Store connections as strings
         state["_child_data_connections"] = self._child_data_connections
         state["_child_signal_connections"] = self._child_signal_connections
@@ -514,9 +909,20 @@ class Composite(SemanticParent, HasCreator, Node, ABC):
         state["starting_nodes"] = [
             state[label] for label in state.pop("_starting_node_labels")
         ]
+        # States saved before scheduling, profiling and execution plans lack these
+        state.setdefault("scheduler", None)
+        state.setdefault("_child_profiles", [])
+        state.setdefault("_topology_version", 0)
+        state.setdefault("_execution_plan", None)
 
         super().__setstate__(state)
 
+        if "_child_signal_condition" not in self.__dict__:
+            # Keep any existing condition, in case someone is already waiting on it
+            self._child_signal_condition = Condition()
+        if "_run_loop_wakeup" not in self.__dict__:
+            self._run_loop_wakeup = None
+
         # Nodes don't store connection information, so restore it to them
         self._restore_data_connections_from_strings(child_data_connections)
         self._restore_signal_connections_from_strings(child_signal_connections)
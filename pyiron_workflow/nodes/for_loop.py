@@ -1,20 +1,26 @@
 from __future__ import annotations
 
 from abc import ABC
-from concurrent.futures import Executor
+from concurrent.futures import Executor, as_completed
 from functools import lru_cache
+from inspect import isawaitable
 import itertools
 import math
-from typing import Any, ClassVar, Literal, Optional
+import warnings
+from typing import Any, Callable, ClassVar, Iterator, Literal, NamedTuple, Optional
 
 from pandas import DataFrame
 from pyiron_snippets.factory import classfactory
 
 from pyiron_workflow.channels import NOT_DATA
+from pyiron_workflow.fingerprint import FingerprintError, fingerprint_values
+from pyiron_workflow.mixin.run import ReadinessError, await_synchronously
 from pyiron_workflow.nodes.composite import Composite
+from pyiron_workflow.nodes.function import Function
 from pyiron_workflow.nodes.static_io import StaticNode
 from pyiron_workflow.storage import StorageInterface
 from pyiron_workflow.nodes.transform import (
+    _ColumnBuffer,
     inputs_to_dict,
     inputs_to_dataframe,
     inputs_to_list,
@@ -138,6 +144,46 @@ class MapsToNonexistentOutputError(ValueError):
     """
 
 
+def _evaluate_body(body_node_class: type[StaticNode], kwargs: dict[str, Any]) -> tuple:
+    """
+    Get the output values of the body for a single row of input, without building a
+    graph.
+
+    Function bodies simply call their node function, anything else runs a standalone
+    body node instance.
+    """
+    if issubclass(body_node_class, Function):
+        output = body_node_class.node_function(**kwargs)
+        if isawaitable(output):
+            output = await_synchronously(output)
+        return (output,) if len(body_node_class.preview_outputs()) == 1 else output
+    body = body_node_class(**kwargs)
+    body.run()
+    return tuple(body.outputs.to_value_dict().values())
+
+
+def _evaluate_body_chunk(
+    body_node_class: type[StaticNode], rows: list[dict[str, Any]]
+) -> list[tuple]:
+    """Evaluate the body for several rows of input in a single task."""
+    return [_evaluate_body(body_node_class, kwargs) for kwargs in rows]
+
+
+class ForRow(NamedTuple):
+    """
+    The result of evaluating a for-loop body on a single row of looped input.
+
+    Attributes:
+        index (int): The row number.
+        input (dict[str, Any]): The looped input values for this row.
+        output (dict[str, Any]): The body output values, keyed by their column name.
+    """
+
+    index: int
+    input: dict[str, Any]
+    output: dict[str, Any]
+
+
 class For(Composite, StaticNode, ABC):
     """
     Specifies fixed fields of some other node class to iterate over, but allows the
@@ -148,6 +194,27 @@ class For(Composite, StaticNode, ABC):
 
     The :attr:`body_node_executor` gets applied to each body node instance on each
     run.
+
+    When the subgraph gets rebuilt, body nodes from the previous run whose looped
+    input matches a row of the new looped input are re-used for that row instead of
+    being re-instantiated, so (if they use caching) they don't need to re-compute
+    anything. E.g. extending a parameter sweep by a few points only computes the new
+    points.
+
+    When :attr:`vectorize` is set, no subgraph of body, indexing, and collection nodes
+    is built at all. Instead, the body is evaluated directly for each row of looped
+    input (for function bodies this is just a call to the node function) and the
+    output is assembled from the results. This is much cheaper for long loops over
+    cheap bodies, but the rows don't exist as nodes, so their input is not
+    type-checked and there is no per-row provenance or caching. If there is a
+    :attr:`body_node_executor`, rows are submitted to it in contiguous batches of
+    :attr:`chunksize` rows, analogous to :meth:`concurrent.futures.Executor.map`, so
+    that many cheap evaluations don't each pay the transport overhead of their own
+    task.
+
+    Results can also be streamed row-by-row with :meth:`iter_rows` and
+    :meth:`stream`, which evaluate the body the same way but never collect the
+    output, so large loops don't need to hold every result in memory.
     """
 
     _body_node_class: ClassVar[type[StaticNode]]
@@ -208,6 +275,8 @@ class For(Composite, StaticNode, ABC):
         checkpoint: Literal["pickle"] | StorageInterface | None = None,
         strict_naming: bool = True,
         body_node_executor: Optional[Executor] = None,
+        vectorize: bool = False,
+        chunksize: int = 1,
         **kwargs,
     ):
         super().__init__(
@@ -222,6 +291,8 @@ class For(Composite, StaticNode, ABC):
             **kwargs,
         )
         self.body_node_executor = body_node_executor
+        self.vectorize = vectorize
+        self.chunksize = chunksize
 
     def _setup_node(self) -> None:
         super()._setup_node()
@@ -236,10 +307,211 @@ class For(Composite, StaticNode, ABC):
         self.starting_nodes = input_nodes
         self._input_node_labels = tuple(n.label for n in input_nodes)
 
+    @property
+    def chunksize(self) -> int:
+        return self._chunksize
+
+    @chunksize.setter
+    def chunksize(self, chunksize: int):
+        if not isinstance(chunksize, int) or chunksize < 1:
+            raise ValueError(
+                f"{self.full_label} needs a positive integer chunksize, but got "
+                f"{chunksize}"
+            )
+        self._chunksize = chunksize
+
+    def _warn_unused_chunksize(self, reason: str):
+        if self.chunksize != 1:
+            warnings.warn(
+                f"{self.full_label} has a chunksize of {self.chunksize}, but {reason}, "
+                f"so it is ignored. Rows only get chunked when they are evaluated "
+                f"directly (i.e. vectorized runs, or streaming) on a "
+                f"body_node_executor."
+            )
+
     def _on_run(self):
+        if self.vectorize:
+            return self._run_vectorized()
+        self._warn_unused_chunksize("the loop is not vectorized")
         self._build_body()
         return super()._on_run()
 
+    async def _on_run_async(self):
+        if self.vectorize:
+            return self._run_vectorized()
+        self._warn_unused_chunksize("the loop is not vectorized")
+        self._build_body()
+        return await super()._on_run_async()
+
+    def _run_vectorized(self):
+        """
+        Evaluate the body directly on each row of the looped input and write the
+        collected results straight to the output.
+        """
+        looped_rows, row_kwargs = self._get_rows()
+
+        self._clean_existing_subgraph()
+        self.provenance_by_execution = []
+        self.provenance_by_completion = []
+
+        hints = {
+            label: self._body_node_class.preview_inputs()[label][0]
+            for label in self._iter_on + self._zip_on
+        }
+        hints.update(
+            {
+                self.output_column_map[label]: hint
+                for label, hint in self._body_node_class.preview_outputs().items()
+            }
+        )
+        n_rows = len(row_kwargs)
+        # Results go straight into their column, so there is never a copy of them
+        # held row-wise
+        columns = {
+            label: (
+                _ColumnBuffer(n_rows, hint)
+                if self._output_as_dataframe
+                else [NOT_DATA] * n_rows
+            )
+            for label, hint in hints.items()
+        }
+        for n, looped in enumerate(looped_rows):
+            for label, value in looped.items():
+                columns[label][n] = value
+        output_labels = list(hints.keys())[len(self._iter_on + self._zip_on) :]
+        for n, result in self._iter_evaluated_rows(row_kwargs):
+            for label, value in zip(output_labels, result):
+                columns[label][n] = value
+
+        if self._output_as_dataframe:
+            self.outputs.df.value = DataFrame(
+                {label: column.finalize() for label, column in columns.items()},
+                copy=False,
+            )
+        else:
+            for label, column in columns.items():
+                self.outputs[label].value = column
+        return self
+
+    def iter_rows(self, **kwargs) -> Iterator[ForRow]:
+        """
+        Evaluate the body directly on each row of looped input, yielding results as
+        they are completed.
+
+        Like a vectorized run, no body subgraph is built. Unlike a run, the
+        results are only yielded and never collected into output, and the node
+        does not go through its run cycle (i.e. there is no cache, status, or
+        signal emission).
+
+        Args:
+            **kwargs: Input values to update before iterating.
+
+        Yields:
+            (ForRow): The row number, looped input, and body output of each row --
+                in order when there is no :attr:`body_node_executor`, and in order
+                of completion otherwise.
+
+        Raises:
+            (ReadinessError): If the node is not ready to run.
+        """
+        self.set_input_values(**kwargs)
+        if not self.ready:
+            raise ReadinessError(self._readiness_error_message)
+
+        looped_rows, row_kwargs = self._get_rows()
+        output_labels = [
+            self.output_column_map[label]
+            for label in self._body_node_class.preview_outputs().keys()
+        ]
+        for n, result in self._iter_evaluated_rows(row_kwargs):
+            yield ForRow(n, looped_rows[n], dict(zip(output_labels, result)))
+
+    def stream(self, sink: Callable[[ForRow], Any], **kwargs) -> int:
+        """
+        Pass each row of :meth:`iter_rows` to a sink as soon as it is available,
+        without keeping any of them around.
+
+        Args:
+            sink (Callable[[ForRow], Any]): What to do with each row, e.g. append it
+                to a file or a database.
+            **kwargs: Input values to update before iterating.
+
+        Returns:
+            (int): The number of rows processed.
+
+        Examples:
+            >>> from pyiron_workflow import Workflow
+            >>>
+            >>> loop = Workflow.create.for_node(
+            ...     Workflow.create.standard.Add, iter_on="obj", other=1
+            ... )
+            >>> largest = []
+            >>> loop.stream(
+            ...     lambda row: largest.append(max([row.output["add"], *largest])),
+            ...     obj=[1, 5, 3],
+            ... )
+            3
+
+            >>> largest
+            [2, 6, 6]
+        """
+        n_rows = 0
+        for row in self.iter_rows(**kwargs):
+            sink(row)
+            n_rows += 1
+        return n_rows
+
+    def _get_rows(self) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """
+        The looped input values for each row, and the full set of body input for each
+        row.
+        """
+        values = self.inputs.to_value_dict()
+        iter_maps = dictionary_to_index_maps(
+            values,
+            nested_keys=self._iter_on,
+            zipped_keys=self._zip_on,
+        )
+        looped_labels = self._iter_on + self._zip_on
+        broadcast = {k: v for k, v in values.items() if k not in looped_labels}
+        looped_rows = [
+            {label: values[label][i] for label, i in channel_map.items()}
+            for channel_map in iter_maps
+        ]
+        return looped_rows, [{**broadcast, **looped} for looped in looped_rows]
+
+    def _iter_evaluated_rows(
+        self, rows: list[dict[str, Any]]
+    ) -> Iterator[tuple[int, tuple]]:
+        if self.body_node_executor is None:
+            self._warn_unused_chunksize("there is no body_node_executor")
+            for n, kwargs in enumerate(rows):
+                yield n, _evaluate_body(self._body_node_class, kwargs)
+            return
+
+        executor = self._parse_executor(self.body_node_executor)
+        chunk_starts = {}
+        try:
+            for start in range(0, len(rows), self.chunksize):
+                future = executor.submit(
+                    _evaluate_body_chunk,
+                    self._body_node_class,
+                    rows[start : start + self.chunksize],
+                )
+                chunk_starts[future] = start
+            for future in as_completed(chunk_starts):
+                start = chunk_starts.pop(future)  # Release the result once yielded
+                for i, result in enumerate(future.result()):
+                    yield start + i, result
+        finally:
+            # Stopped early (by the consumer, or by a failing chunk), so don't keep
+            # computing rows nobody will receive
+            for future in chunk_starts:
+                future.cancel()
+            if executor is not self.body_node_executor:
+                # We built it, so we clean it up
+                executor.shutdown(wait=False, cancel_futures=True)
+
     def _build_body(self):
         """
         Construct instances of the body node based on input length, and wire them to IO.
@@ -250,9 +522,11 @@ class For(Composite, StaticNode, ABC):
             zipped_keys=self._zip_on,
         )
 
+        reusable_bodies = self._find_reusable_body_nodes(iter_maps)
+
         self._clean_existing_subgraph()
 
-        self._create_and_connect_input_to_body_nodes(iter_maps)
+        self._create_and_connect_input_to_body_nodes(iter_maps, reusable_bodies)
 
         if self._output_as_dataframe:
             self._collect_output_as_dataframe(iter_maps)
@@ -278,12 +552,70 @@ class For(Composite, StaticNode, ABC):
                     # Data should simply be coming from the value link
                     # We just want to refresh the output
                 )
-        # TODO: Instead of deleting _everything_ each time, try and re-use stuff
+        # Body nodes worth keeping were already found, and get re-parented when the
+        # body is created
+
+    def _find_reusable_body_nodes(
+        self, iter_maps: tuple[dict[str, int], ...]
+    ) -> dict[int, StaticNode]:
+        """
+        Match existing body nodes to the rows of the new looped input, based on the
+        fingerprint of the looped input they last received.
 
-    def _create_and_connect_input_to_body_nodes(self, iter_maps):
+        Args:
+            iter_maps (tuple[dict[str, int], ...]): The new rows.
+
+        Returns:
+            (dict[int, StaticNode]): Existing body nodes keyed by the new row number
+                they can be used for.
+        """
+        previous_bodies = {}
+        n = 0
+        while self._body_name(n) in self.children:
+            body = self.children[self._body_name(n)]
+            n += 1
+            if body.failed or body.running:
+                continue
+            key = self._row_fingerprint(
+                {
+                    label: body.inputs[label].value
+                    for label in self._iter_on + self._zip_on
+                }
+            )
+            if key is not None:
+                previous_bodies.setdefault(key, []).append(body)
+
+        if len(previous_bodies) == 0:
+            return {}  # Don't bother fingerprinting the new rows
+
+        reusable = {}
+        for n, channel_map in enumerate(iter_maps):
+            key = self._row_fingerprint(
+                {label: self.inputs[label].value[i] for label, i in channel_map.items()}
+            )
+            if len(previous_bodies.get(key, [])) > 0:
+                reusable[n] = previous_bodies[key].pop(0)
+        return reusable
+
+    @staticmethod
+    def _row_fingerprint(looped_values: dict[str, Any]) -> str | None:
+        try:
+            return fingerprint_values(looped_values)
+        except FingerprintError:
+            return None
+
+    def _create_and_connect_input_to_body_nodes(
+        self,
+        iter_maps: tuple[dict[str, int], ...],
+        reusable_bodies: Optional[dict[int, StaticNode]] = None,
+    ):
+        reusable_bodies = {} if reusable_bodies is None else reusable_bodies
         for n, channel_map in enumerate(iter_maps):
-            # Make the body node
-            body_node = self._body_node_class(label=self._body_name(n), parent=self)
+            # Make (or re-use) the body node
+            if n in reusable_bodies:
+                body_node = self.add_child(reusable_bodies[n], label=self._body_name(n))
+            else:
+                body_node = self._body_node_class(label=self._body_name(n), parent=self)
             body_node.executor = self.body_node_executor
 
             # Broadcast macro input to body node
@@ -399,6 +731,24 @@ class For(Composite, StaticNode, ABC):
                 )
             return preview
 
+    @classmethod
+    def _fingerprint_source(cls) -> str | None:
+        try:
+            body_fingerprint = cls._body_node_class._class_fingerprint()
+        except FingerprintError:
+            return None
+        return (
+            f"{body_fingerprint} iter_on={cls._iter_on} zip_on={cls._zip_on} "
+            f"output_as_dataframe={cls._output_as_dataframe} "
+            f"output_column_map={cls.output_column_map}"
+        )
+
+    @property
+    def code_fingerprint(self) -> str:
+        # The body is rebuilt on each run, so it is the class alone that determines
+        # what gets computed
+        return self._class_fingerprint()
+
     @property
     def _input_value_links(self):
         """
@@ -454,6 +804,9 @@ class For(Composite, StaticNode, ABC):
         # Purge value links from the state
         input_links = state.pop("_input_value_links")
         output_links = state.pop("_output_value_links")
+        # States saved before vectorized and chunked runs existed lack these
+        state.setdefault("vectorize", False)
+        state.setdefault("_chunksize", 1)
 
         super().__setstate__(state)
 
@@ -542,6 +895,8 @@ def for_node(
     output_as_dataframe: bool = True,
     output_column_map: Optional[dict[str, str]] = None,
     use_cache: bool = True,
+    vectorize: bool = False,
+    chunksize: int = 1,
     **node_kwargs,
 ):
     """
@@ -574,6 +929,13 @@ def for_node(
             channel labels as columb names.)
         use_cache (bool): Whether this node should default to caching its values.
             (Default is True.)
+        vectorize (bool): Whether to evaluate the body directly for each row of
+            looped input instead of building a subgraph of body nodes. (Default is
+            False, build the subgraph.)
+        chunksize (int): How many rows of a vectorized loop to submit to the
+            :attr:`body_node_executor` as a single task. Only used when vectorizing
+            (or streaming) with an executor; otherwise anything but 1 gets a warning.
+            Must be a positive integer. (Default is 1, submit each row individually.)
         **node_kwargs: Regular keyword node arguments.
 
     Returns:
@@ -645,6 +1007,32 @@ def for_node(
         >>> out.df.columns
         Index(['a', 'b', 'c', 'd', 'out_a', 'out_b', 'out_c', 'out_d', 'e'], dtype='object')
 
+        For long loops over cheap bodies, building the subgraph can easily cost more
+        than the actual computation. Vectorized loops skip the subgraph and evaluate
+        the body directly, giving the same output without any body nodes:
+        >>> vectorized = Workflow.create.for_node(
+        ...     FiveApart,
+        ...     iter_on=("a", "b"),
+        ...     zip_on=("c", "d"),
+        ...     a=[1, 2],
+        ...     b=[3, 4, 5, 6],
+        ...     c=[7, 8],
+        ...     d=[9, 10, 11],
+        ...     e="e",
+        ...     output_column_map={
+        ...         "a": "out_a",
+        ...         "b": "out_b",
+        ...         "c": "out_c",
+        ...         "d": "out_d"
+        ...     },
+        ...     vectorize=True,
+        ... )
+        >>> vectorized().df.equals(out.df)
+        True
+
+        >>> len(vectorized)  # Just the input nodes
+        5
+
     """
     for_node_factory.clear(
         _for_node_class_name(body_node_class, iter_on, zip_on, output_as_dataframe)
@@ -658,4 +1046,4 @@ def for_node(
         use_cache,
     )
     cls.preview_io()
-    return cls(*node_args, **node_kwargs)
+    return cls(*node_args, vectorize=vectorize, chunksize=chunksize, **node_kwargs)
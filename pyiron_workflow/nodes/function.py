@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import copyreg
+from functools import partial
 from inspect import getsource
+import pickle
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from pyiron_snippets.colors import SeabornColors
 from pyiron_snippets.factory import classfactory
@@ -40,6 +44,11 @@ class Function(StaticNode, ScrapesIO, ABC):
         - A single tuple output channel can be forced by manually providing exactly one
             output label
     - Running the node executes the wrapped function and returns its result
+    - The wrapped function may be a coroutine function (`async def`)
+        - Running the node runs the coroutine to completion
+        - Awaiting the node's :meth:`arun` awaits the coroutine on the running event
+            loop, so it runs concurrently with other tasks there (e.g. sibling nodes
+            in an awaited workflow)
     - Input updates can be made with `*args` as well as the usual `**kwargs`, following
         the same input order as the wrapped function.
     - A default label can be scraped from the name of the wrapped function
@@ -316,6 +325,15 @@ class Function(StaticNode, ScrapesIO, ABC):
     def _on_run(self, **kwargs):
         return self.node_function(**kwargs)
 
+    @property
+    def _detached_on_run(self) -> callable | None:
+        # The node function is all we need, unless the run got customized
+        return (
+            partial(_run_node_function, _BlankNode(self))
+            if type(self)._on_run is Function._on_run
+            else super()._detached_on_run
+        )
+
     @property
     def _run_args(self) -> tuple[tuple, dict]:
         kwargs = self.inputs.to_value_dict()
@@ -347,6 +365,13 @@ class Function(StaticNode, ScrapesIO, ABC):
     def _extra_info(cls) -> str:
         return getsource(cls.node_function)
 
+    @classmethod
+    def _fingerprint_source(cls) -> str | None:
+        try:
+            return getsource(cls.node_function)
+        except (OSError, TypeError):
+            return None
+
 
 @classfactory
 def function_node_factory(
@@ -467,3 +492,37 @@ def function_node(
     )
     factory_made.preview_io()
     return factory_made(*node_args, **node_kwargs)
+
+
+class _BlankNode:
+    """
+    Pickles as a blank instance of the node's class, i.e. using the same recipe to
+    recover the class as the node itself would (which, unlike decorated node
+    functions, works with :mod:`pickle`), but without any of the node's state.
+
+    Reducing a node also gets its whole state, so the recipe is only worked out once
+    per class.
+    """
+
+    _recipes: WeakKeyDictionary[type[Function], tuple] = WeakKeyDictionary()
+
+    def __init__(self, node: Function):
+        try:
+            self._recipe = self._recipes[type(node)]
+        except KeyError:
+            self._recipe = node.__reduce_ex__(pickle.HIGHEST_PROTOCOL)[:2]
+            if self._recipe[0] is copyreg.__newobj__:
+                # Pickle only accepts this for actual instances of the class
+                self._recipe = (_new_blank_instance, self._recipe[1])
+            self._recipes[type(node)] = self._recipe
+
+    def __reduce__(self):
+        return self._recipe
+
+
+def _new_blank_instance(cls: type[Function], *args) -> Function:
+    return cls.__new__(cls, *args)
+
+
+def _run_node_function(node: Function | _BlankNode, /, **kwargs):
+    return node.node_function(**kwargs)
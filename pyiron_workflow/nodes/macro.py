@@ -461,6 +461,13 @@ class Macro(Composite, StaticNode, ScrapesIO, ABC):
     def _extra_info(cls) -> str:
         return getsource(cls.graph_creator)
 
+    @classmethod
+    def _fingerprint_source(cls) -> str | None:
+        try:
+            return getsource(cls.graph_creator)
+        except (OSError, TypeError):
+            return None
+
 
 @classfactory
 def macro_node_factory(
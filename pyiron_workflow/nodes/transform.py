@@ -9,7 +9,8 @@ from dataclasses import dataclass as as_dataclass, MISSING
 import itertools
 from typing import Any, ClassVar, Optional
 
-from pandas import DataFrame
+import numpy as np
+from pandas import DataFrame, Series
 from pyiron_snippets.colors import SeabornColors
 from pyiron_snippets.factory import classfactory
 
@@ -18,6 +19,83 @@ from pyiron_workflow.mixin.preview import builds_class_io
 from pyiron_workflow.nodes.static_io import StaticNode
 
 
+class _ColumnBuffer:
+    """
+    A preallocated, fixed-length column of values for building dataframes without
+    intermediate lists.
+
+    Columns of python or numpy scalars are stored in a numeric array of the matching
+    dtype, and anything else in an object array. The dtype is taken from the type
+    hint if there is one, and otherwise from the first value received. If a later
+    value doesn't fit, the column falls back to an object array.
+    """
+
+    _NUMERIC: ClassVar[dict[type, tuple[type, tuple[type, ...]]]] = {
+        bool: (np.bool_, (bool, np.bool_)),
+        int: (np.int64, (int, np.integer)),
+        float: (np.float64, (float, np.floating)),
+        complex: (np.complex128, (complex, np.complexfloating)),
+    }
+
+    def __init__(self, length: int, type_hint: Any = None):
+        self._hinted = type_hint in self._NUMERIC
+        self._accepts: tuple[type, ...] | None = None
+        if self._hinted:
+            dtype, self._accepts = self._NUMERIC[type_hint]
+            self.data = np.empty(length, dtype=dtype)
+        else:
+            self.data = np.empty(length, dtype=object)
+        self._n_set = 0
+
+    def __setitem__(self, i: int, value: Any):
+        if self._n_set == 0 and not self._hinted:
+            self._maybe_specialize(value)
+        if self._accepts is not None and not self._fits(value):
+            self._fall_back_to_objects()
+        try:
+            self.data[i] = value
+        except OverflowError:  # E.g. python int too big for int64
+            self._fall_back_to_objects()
+            self.data[i] = value
+        self._n_set += 1
+
+    def _fall_back_to_objects(self):
+        self._accepts = None
+        self.data = self.data.astype(object)
+
+    def _maybe_specialize(self, value: Any):
+        for python_type, (dtype, accepts) in self._NUMERIC.items():
+            if type(value) is python_type:
+                self.data = np.empty(len(self.data), dtype=dtype)
+                self._accepts = accepts
+                return
+
+    def _fits(self, value: Any) -> bool:
+        if isinstance(value, (bool, np.bool_)) and self.data.dtype != np.bool_:
+            return False  # Don't let bools pass as numbers
+        return isinstance(value, self._accepts)
+
+    def finalize(self) -> np.ndarray:
+        """
+        Returns:
+            (np.ndarray): The filled buffer, with object columns converted to a more
+                specific dtype where possible (just like building a dataframe from a
+                list would do).
+
+        Raises:
+            (ValueError): If not every value in the column was set.
+        """
+        if self._n_set != len(self.data):
+            raise ValueError(
+                f"All columns must be of the same length, but only {self._n_set} of "
+                f"{len(self.data)} values were set"
+            )
+        if self.data.dtype == object:
+            # Series.infer_objects mimics the inference when constructing from lists
+            return Series(self.data, copy=False).infer_objects().to_numpy()
+        return self.data
+
+
 class Transformer(StaticNode, ABC):
     """
     Transformers are a special case of :class:`StaticNode` nodes that turn many inputs
@@ -285,14 +363,15 @@ class InputsToDataframe(_HasLength, FromManyInputs, ABC):
     _output_type_hint: ClassVar[Any] = DataFrame
 
     def _on_run(self, *rows: dict[str, Any]) -> Any:
-        df_dict = {}
+        columns = {}
         for i, row in enumerate(rows):
             for key, value in row.items():
                 if i == 0:
-                    df_dict[key] = [value]
-                else:
-                    df_dict[key].append(value)
-        return DataFrame(df_dict)
+                    columns[key] = _ColumnBuffer(len(rows))
+                columns[key][i] = value
+        return DataFrame(
+            {key: column.finalize() for key, column in columns.items()}, copy=False
+        )
 
     @property
     def _run_args(self) -> tuple[tuple, dict]:
@@ -0,0 +1,184 @@
+"""
+Timing information for runs, to tell apart time spent on the actual computation from
+time spent in the workflow machinery around it.
+
+Profiling is opt-in, by setting the :attr:`profile` attribute of a node. Children of a
+composite that is being profiled get profiled too, so the composite's
+:attr:`run_profile` holds a tree of the run, which can be exported to the Chrome
+trace event format for viewing in, e.g., `chrome://tracing` or Perfetto.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+from time import thread_time, time
+from typing import Any, Awaitable, Iterator, NamedTuple
+
+
+class ProfiledOutput(NamedTuple):
+    """
+    What a profiled :meth:`on_run` call returns: the actual output, along with timing
+    measured wherever the call happened (which might be a different process).
+    """
+
+    output: Any
+    start: float
+    duration: float
+    cpu_time: float
+
+
+def profiled_call(fnc: callable, /, *args, **kwargs) -> ProfiledOutput:
+    """
+    Call and time a function wherever the call happens.
+    """
+    start, cpu_start = time(), thread_time()
+    output = fnc(*args, **kwargs)
+    return ProfiledOutput(output, start, time() - start, thread_time() - cpu_start)
+
+
+async def profiled_await(awaitable: Awaitable) -> ProfiledOutput:
+    """
+    Await and time an awaitable. Note that the CPU time includes anything else the
+    event loop ran on its thread in the meantime.
+    """
+    start, cpu_start = time(), thread_time()
+    output = await awaitable
+    return ProfiledOutput(output, start, time() - start, thread_time() - cpu_start)
+
+
+@dataclass
+class RunProfile:
+    """
+    The timing of a single run.
+
+    All times are wall-clock times in seconds, except :attr:`start`, which is a
+    timestamp in seconds since the epoch.
+
+    Attributes:
+        label (str): The full label of what was run.
+        start (float): When the run was requested.
+        before_run (float): Time spent preparing the run, e.g. fetching input, checking
+            the cache, and checking readiness (including type checks).
+        submit (float): Time spent handing the run to an executor, which includes
+            serializing it for process-based executors. Zero when running locally.
+        queue (float): Time between handing the run off and it actually starting,
+            e.g. while waiting for a free executor worker.
+        on_run (float): Time spent in :meth:`on_run`, i.e. the actual computation.
+        on_run_cpu (float): CPU time of the thread executing :meth:`on_run`.
+        collect (float): Time spent retrieving the result from the executor, which
+            includes deserializing it for process-based executors. Zero when running
+            locally.
+        process_result (float): Time spent processing the result, e.g. updating
+            output channels.
+        total (float): Time from the run being requested until it finished.
+        stopped_early (bool): Whether the run returned before computing anything, e.g.
+            on a cache hit.
+        failed (bool): Whether the run failed.
+        children (list[RunProfile]): For composites, the profiles of child runs in
+            the order they finished.
+    """
+
+    label: str
+    start: float
+    before_run: float = 0.0
+    submit: float = 0.0
+    queue: float = 0.0
+    on_run: float = 0.0
+    on_run_cpu: float = 0.0
+    collect: float = 0.0
+    process_result: float = 0.0
+    total: float = 0.0
+    stopped_early: bool = False
+    failed: bool = False
+    children: list[RunProfile] = field(default_factory=list)
+
+    @property
+    def overhead(self) -> float:
+        """
+        Time spent on anything but :meth:`on_run`. For composites, this is the
+        overhead of the composite itself; the computation of the children counts
+        towards its :attr:`on_run`.
+        """
+        return self.total - self.on_run
+
+    def walk(self) -> Iterator[RunProfile]:
+        """Iterate over this profile and, recursively, all its children."""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def to_chrome_trace(self) -> dict:
+        """
+        This profile and its children in the Chrome trace event format.
+
+        Each label gets its own row, with the run as a whole and its non-zero phases
+        nested underneath.
+
+        Returns:
+            (dict): The JSON-serializable trace.
+        """
+        lanes: dict[str, int] = {}
+        events = []
+        for profile in self.walk():
+            if profile.label not in lanes:
+                lanes[profile.label] = len(lanes)
+                events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": 0,
+                        "tid": lanes[profile.label],
+                        "args": {"name": profile.label},
+                    }
+                )
+            events.extend(profile._chrome_events(lanes[profile.label]))
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save_chrome_trace(self, filename: str | Path) -> None:
+        """
+        Write the :meth:`to_chrome_trace` JSON to file.
+
+        Args:
+            filename (str | Path): Where to write the trace.
+        """
+        with open(filename, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+    def _chrome_events(self, tid: int) -> list[dict]:
+        def event(name, start, duration, args=None):
+            return {
+                "name": name,
+                "ph": "X",
+                "pid": 0,
+                "tid": tid,
+                "ts": start * 1e6,
+                "dur": duration * 1e6,
+                **({} if args is None else {"args": args}),
+            }
+
+        phases = ("before_run", "submit", "queue", "on_run")
+        tail_phases = ("collect", "process_result")
+        details = phases + ("on_run_cpu",) + tail_phases + ("stopped_early", "failed")
+        events = [
+            event(
+                self.label,
+                self.start,
+                self.total,
+                args={name: getattr(self, name) for name in details},
+            )
+        ]
+        # The leading phases happen back to back from the start, and the trailing
+        # ones back to back up to the end
+        t = self.start
+        for name in phases:
+            if getattr(self, name) > 0:
+                events.append(event(name, t, getattr(self, name)))
+            t += getattr(self, name)
+        t = self.start + self.total - sum(getattr(self, name) for name in tail_phases)
+        for name in tail_phases:
+            if getattr(self, name) > 0:
+                events.append(event(name, t, getattr(self, name)))
+            t += getattr(self, name)
+        return events
@@ -6,7 +6,7 @@ data flow dependencies.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import NamedTuple, Optional, TYPE_CHECKING
 
 from toposort import toposort, toposort_flatten, CircularDependencyError
 
@@ -22,6 +22,22 @@ class CircularDataFlowError(ValueError):
     pass
 
 
+class ExecutionPlan(NamedTuple):
+    """
+    The result of automating the execution flow of a graph, which stays valid for as
+    long as the graph's topology doesn't change.
+
+    Attributes:
+        topology_version (int): The version of the graph topology the plan was made
+            for, i.e. including the run signal connections the plan set.
+        starting_labels (tuple[str, ...]): The labels of the upstream-most nodes, i.e.
+            those with no data dependencies.
+    """
+
+    topology_version: int
+    starting_labels: tuple[str, ...]
+
+
 def nodes_to_data_digraph(nodes: dict[str, Node]) -> dict[str, set[str]]:
     """
     Maps a set of nodes to a digraph of their data dependency in the format of label
@@ -89,6 +105,51 @@ def nodes_to_data_digraph(nodes: dict[str, Node]) -> dict[str, set[str]]:
     return digraph
 
 
+def critical_path_priorities(
+    nodes: dict[str, Node], durations: Optional[dict[str, float]] = None
+) -> dict[str, float]:
+    """
+    Prioritizes nodes by the length of the longest chain of data dependencies that
+    starts with them, i.e. the minimum time it will take to finish everything
+    downstream of them once they start. Running the highest priority nodes first
+    works through the critical path of the graph as early as possible.
+
+    Args:
+        nodes (dict[str, Node]): A label-keyed dictionary of sibling nodes.
+        durations (dict[str, float] | None): How long (some of) the nodes take to run,
+            by label. Nodes without a duration are assumed to take the average of the
+            known durations. (Default is None, all nodes take the same time.)
+
+    Returns:
+        (dict[str, float]): The priority of each node by label; larger values should
+            run sooner.
+
+    Raises:
+        CircularDataFlowError: When the data flow is not a DAG.
+    """
+    digraph = nodes_to_data_digraph(nodes)
+    try:
+        execution_order = toposort_flatten(digraph)
+    except CircularDependencyError as e:
+        _raise_wrapped_circular_error(e)
+
+    durations = {} if durations is None else durations
+    default_duration = (
+        sum(durations.values()) / len(durations) if len(durations) > 0 else 1.0
+    )
+    downstream = {label: [] for label in digraph}
+    for label, upstream_labels in digraph.items():
+        for upstream in upstream_labels:
+            downstream[upstream].append(label)
+
+    priorities = {}
+    for label in reversed(execution_order):
+        priorities[label] = durations.get(label, default_duration) + max(
+            (priorities[d] for d in downstream[label]), default=0.0
+        )
+    return priorities
+
+
 def _set_new_run_connections_with_fallback_recovery(
     connection_creator: callable[[dict[str, Node]], list[Node]], nodes: dict[str, Node]
 ):
@@ -223,16 +284,70 @@ def set_run_connections_according_to_dag(
 def get_nodes_in_data_tree(node: Node) -> set[Node]:
     """
     Get a set of all nodes from this one and upstream through data connections.
+
+    Each node is visited only once, so this scales linearly with the size of the tree
+    no matter how many paths lead to a node, and doesn't recurse, so it works for
+    arbitrarily deep trees. (Cyclic data flow is left for the topological sorting of
+    the tree to catch.)
     """
-    try:
-        nodes = set([node])
-        for channel in node.inputs:
+    nodes = {node}
+    to_visit = [node]
+    while len(to_visit) > 0:
+        for channel in to_visit.pop().inputs:
             for connection in channel.connections:
-                nodes = nodes.union(get_nodes_in_data_tree(connection.owner))
-        return nodes
-    except RecursionError:
+                if connection.owner not in nodes:
+                    nodes.add(connection.owner)
+                    to_visit.append(connection.owner)
+    return nodes
+
+
+def data_tree_dependencies(node: Node) -> dict[Node, set[Node]]:
+    """
+    Map this node and all nodes upstream of it through data connections to the nodes
+    each one directly depends on for data.
+
+    Unlike :func:`nodes_to_data_digraph`, this is keyed by the nodes themselves, so it
+    doesn't rely on the nodes having unique labels (e.g. when they have no parent).
+
+    Args:
+        node (Node): The node at the bottom of the data tree.
+
+    Returns:
+        (dict[Node, set[Node]]): The nodes in execution order (i.e. every node comes
+            after all its dependencies, so the passed node comes last) and their
+            direct dependencies.
+
+    Raises:
+        CircularDataFlowError: When the data tree is not a DAG.
+    """
+    digraph = {
+        n: set(c.owner for inp in n.inputs for c in inp.connections)
+        for n in get_nodes_in_data_tree(node)
+    }
+
+    # Sort it ourselves, since toposort compares the nodes with `!=`, which nodes
+    # overload to inject new nodes
+    downstream = {n: [] for n in digraph}
+    for n, dependencies in digraph.items():
+        for upstream in dependencies:
+            downstream[upstream].append(n)
+    n_waiting_on = {n: len(dependencies) for n, dependencies in digraph.items()}
+    ready = [n for n, n_waiting in n_waiting_on.items() if n_waiting == 0]
+    execution_order = []
+    while len(ready) > 0:
+        n = ready.pop()
+        execution_order.append(n)
+        for d in downstream[n]:
+            n_waiting_on[d] -= 1
+            if n_waiting_on[d] == 0:
+                ready.append(d)
+
+    if len(execution_order) < len(digraph):
+        cyclic = [
+            n.full_label for n, n_waiting in n_waiting_on.items() if n_waiting > 0
+        ]
         raise CircularDataFlowError(
             f"Detected a cycle in the data flow topology, unable to automate the "
-            f"execution of non-DAGs: finding the upstream nodes for {node.label} hit a "
-            f"recursion error."
+            f"execution of non-DAGs: cycles found among {cyclic}"
         )
+    return {n: digraph[n] for n in execution_order}
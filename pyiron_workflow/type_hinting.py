@@ -1,31 +1,242 @@
 """
 This module provides helper functions for evaluating data relative to type hints, and
 type hints relative to each other.
+
+Values are validated against hints by validators that get compiled once per hint (see
+:func:`get_validator`). The items of containers hinted with subscripted generics (e.g.
+`list[float]` or `dict[str, int]`) are checked according to the module-level
+:data:`collection_check` setting, so that large containers need not be iterated over
+in full. E.g., to check up to 100 evenly spaced items of each container instead of
+only the first one:
+
+>>> from pyiron_workflow import type_hinting
+>>>
+>>> type_hinting.collection_check = 100
+>>> type_hinting.valid_value(list(range(1000)) + ["not an int"], list[int])
+True
+>>> type_hinting.collection_check = "all"
+>>> type_hinting.valid_value(list(range(1000)) + ["not an int"], list[int])
+False
+>>> type_hinting.collection_check = "first"  # Back to the default
 """
 
+import collections.abc
+from functools import lru_cache
+from itertools import islice
 import types
 import typing
 from collections.abc import Callable
 
+import numpy as np
 from pint import Quantity
 from typeguard import check_type, TypeCheckError
 
+collection_check: typing.Literal["shallow", "first", "all"] | int = "first"
+"""
+How to check the items of containers against the item types of subscripted hints:
+not at all (`"shallow"`), only the first item (`"first"`, the default), all of them
+(`"all"`), or (for positive integers) up to that many items, evenly spaced through
+sequences.
+"""
+
+_SEQUENCE_ORIGINS = (
+    list,
+    collections.abc.Sequence,
+    collections.abc.MutableSequence,
+)
+_SET_ORIGINS = (
+    set,
+    frozenset,
+    collections.abc.Set,
+    collections.abc.MutableSet,
+)
+_MAPPING_ORIGINS = (
+    dict,
+    collections.abc.Mapping,
+    collections.abc.MutableMapping,
+)
+
 
 def valid_value(value, type_hint) -> bool:
-    value = value.magnitude if isinstance(value, Quantity) else value  # De-unit it
+    return get_validator(type_hint)(value)
+
 
+def get_validator(type_hint) -> Callable[[typing.Any], bool]:
+    """
+    A function checking whether values conform to the type hint. The units of
+    :class:`pint.Quantity` values are disregarded, i.e. their magnitude gets checked.
+
+    Validators are compiled once per hint and cached. Common hints get specialized
+    validators, e.g. plain `isinstance` checks for classes, item checks governed by
+    :data:`collection_check` for containers, and dtype and dimensionality checks for
+    :class:`numpy.ndarray` hints like `numpy.typing.NDArray[numpy.float64]`; the
+    remaining hints are checked with :func:`typeguard.check_type`.
+
+    Args:
+        type_hint: The hint to validate against.
+
+    Returns:
+        (Callable[[Any], bool]): The validator.
+    """
     try:
-        return isinstance(value, type_hint)
-    except TypeError:
-        # Subscripted generics cannot be used with class and instance checks
+        return _cached_validator(type_hint)
+    except TypeError:  # Unhashable hint
+        return _strip_units(_compile_validator(type_hint))
+
+
+@lru_cache(maxsize=None)
+def _cached_validator(type_hint) -> Callable[[typing.Any], bool]:
+    return _strip_units(_compile_validator(type_hint))
+
+
+def _strip_units(
+    validator: Callable[[typing.Any], bool],
+) -> Callable[[typing.Any], bool]:
+    def unitless_validator(value) -> bool:
+        return validator(value.magnitude if isinstance(value, Quantity) else value)
+
+    return unitless_validator
+
+
+def _compile_validator(type_hint) -> Callable[[typing.Any], bool]:
+    if type_hint is typing.Any or type_hint is object:
+        return lambda value: True
+    if type_hint is None or type_hint is type(None):
+        return lambda value: value is None
+
+    origin = typing.get_origin(type_hint)
+    args = typing.get_args(type_hint)
+
+    if origin is None:
+        try:
+            isinstance(None, type_hint)
+        except TypeError:
+            # E.g. non-runtime protocols, let typeguard handle these
+            return _typeguard_validator(type_hint)
+        return lambda value: isinstance(value, type_hint)
+    elif origin in (typing.Union, types.UnionType):
+        if all(
+            typing.get_origin(arg) is None and isinstance(arg, type) for arg in args
+        ):
+            return lambda value: isinstance(value, args)
+        validators = tuple(_compile_validator(arg) for arg in args)
+        return lambda value: any(validator(value) for validator in validators)
+    elif origin is typing.Literal:
+        return lambda value: any(
+            type(value) is type(arg) and value == arg for arg in args
+        )
+    elif origin is np.ndarray:
+        return _ndarray_validator(args)
+    elif origin in _SEQUENCE_ORIGINS and len(args) == 1:
+        return _collection_validator(
+            origin, _sampled_items, _compile_validator(args[0])
+        )
+    elif origin in _SET_ORIGINS and len(args) == 1:
+        return _collection_validator(origin, _first_items, _compile_validator(args[0]))
+    elif origin in _MAPPING_ORIGINS and len(args) == 2:
+        key_validator = _compile_validator(args[0])
+        value_validator = _compile_validator(args[1])
+        return _collection_validator(
+            origin,
+            lambda value: _first_items(value.items()),
+            lambda item: key_validator(item[0]) and value_validator(item[1]),
+        )
+    elif origin is tuple and len(args) == 2 and args[1] is Ellipsis:
+        return _collection_validator(tuple, _sampled_items, _compile_validator(args[0]))
+    elif origin is tuple and len(args) > 0 and Ellipsis not in args:
+        validators = tuple(_compile_validator(arg) for arg in args)
+        return lambda value: (
+            isinstance(value, tuple)
+            and len(value) == len(validators)
+            and all(validator(item) for validator, item in zip(validators, value))
+        )
+    else:
+        return _typeguard_validator(type_hint)
+
+
+def _typeguard_validator(type_hint) -> Callable[[typing.Any], bool]:
+    def validator(value) -> bool:
         try:
-            # typeguard handles this case
             check_type(value, type_hint)
             return True
         except TypeCheckError:
             # typeguard raises an error on a failed check
             return False
 
+    return validator
+
+
+def _collection_validator(
+    origin: type,
+    get_items: Callable[[typing.Any], typing.Iterable],
+    item_validator: Callable[[typing.Any], bool],
+) -> Callable[[typing.Any], bool]:
+    def validator(value) -> bool:
+        return isinstance(value, origin) and all(
+            item_validator(item) for item in get_items(value)
+        )
+
+    return validator
+
+
+def _first_items(collection: typing.Iterable) -> typing.Iterable:
+    """The items of the collection to check, per :data:`collection_check`"""
+    if collection_check == "shallow":
+        return ()
+    elif collection_check == "first":
+        return islice(collection, 1)
+    elif collection_check == "all":
+        return collection
+    else:
+        return islice(collection, collection_check)
+
+
+def _sampled_items(sequence: typing.Sequence) -> typing.Iterable:
+    """Like :func:`_first_items`, but spread samples evenly over the sequence"""
+    if isinstance(collection_check, int) and len(sequence) > collection_check:
+        return (
+            sequence[i * len(sequence) // collection_check]
+            for i in range(collection_check)
+        )
+    return _first_items(sequence)
+
+
+def _ndarray_validator(args: tuple) -> Callable[[typing.Any], bool]:
+    shape_hint, dtype_hint = args if len(args) == 2 else (typing.Any, typing.Any)
+    scalar_hints = (
+        typing.get_args(dtype_hint)
+        if typing.get_origin(dtype_hint) is np.dtype
+        else (typing.Any,)
+    )
+    scalar_types = tuple(
+        typing.get_origin(scalar) or scalar  # E.g. np.floating[Any] -> np.floating
+        for hint in scalar_hints
+        for scalar in (
+            typing.get_args(hint)
+            if typing.get_origin(hint) in (typing.Union, types.UnionType)
+            else (hint,)
+        )
+    )
+    check_dtype = typing.Any not in scalar_types
+    dimension_hints = (
+        typing.get_args(shape_hint)
+        if typing.get_origin(shape_hint) is tuple
+        else (typing.Any, Ellipsis)
+    )
+    ndim = None if Ellipsis in dimension_hints else len(dimension_hints)
+
+    def validator(value) -> bool:
+        return (
+            isinstance(value, np.ndarray)
+            and (ndim is None or value.ndim == ndim)
+            and (
+                not check_dtype
+                or any(np.issubdtype(value.dtype, scalar) for scalar in scalar_types)
+            )
+        )
+
+    return validator
+
 
 def type_hint_to_tuple(type_hint) -> tuple:
     if isinstance(type_hint, (types.UnionType, typing._UnionGenericAlias)):
@@ -35,6 +246,31 @@ def type_hint_to_tuple(type_hint) -> tuple:
 
 
 def type_hint_is_as_or_more_specific_than(hint, other) -> bool:
+    """
+    Whether values conforming to the hint always conform to the other hint, e.g. for
+    deciding whether an output channel may connect to an input channel.
+
+    Results are cached per pair of hints.
+
+    Args:
+        hint: The (e.g. output channel) hint that should be more specific.
+        other: The (e.g. input channel) hint to compare to.
+
+    Returns:
+        (bool): Whether the hint is as or more specific than the other.
+    """
+    try:
+        return _cached_hint_comparison(hint, other)
+    except TypeError:  # Unhashable hint(s)
+        return _type_hint_is_as_or_more_specific_than(hint, other)
+
+
+@lru_cache(maxsize=None)
+def _cached_hint_comparison(hint, other) -> bool:
+    return _type_hint_is_as_or_more_specific_than(hint, other)
+
+
+def _type_hint_is_as_or_more_specific_than(hint, other) -> bool:
     hint_origin = typing.get_origin(hint)
     other_origin = typing.get_origin(other)
     if set([hint_origin, other_origin]) & set([types.UnionType, typing.Union]):
@@ -16,6 +16,7 @@ from pyiron_workflow.mixin.semantics import ParentMost
 
 
 if TYPE_CHECKING:
+    from pyiron_workflow.channels import Channel
     from pyiron_workflow.io import IO
     from pyiron_workflow.node import Node
     from pyiron_workflow.storage import StorageInterface
@@ -189,6 +190,18 @@ class Workflow(ParentMost, Composite):
         If you want or need more control, you can set the `automate_execution` flag to
         `False` and manually specify an execution flow.
 
+        Independent nodes can run concurrently without assigning each one an
+        executor, by giving the workflow a :attr:`scheduler` -- or just a number of
+        worker threads for a single run:
+
+        >>> wf = Workflow("wide")
+        >>> wf.a = Workflow.create.standard.Sleep(0.2)
+        >>> wf.b = Workflow.create.standard.Sleep(0.2)
+        >>> wf.c = Workflow.create.standard.Sleep(0.2)
+        >>> wf.total = wf.a + wf.b + wf.c
+        >>> wf.run(max_workers=3)
+        {'total__add': 0.6000000000000001}
+
     TODO: Once you're satisfied with how a workflow is structured, you can export it
         as a macro node for use in other workflows. (Maybe we should allow for nested
         workflows without exporting to a node? I was concerned then what happens to the
@@ -220,6 +233,8 @@ class Workflow(ParentMost, Composite):
         self.outputs_map = outputs_map
         self._inputs = None
         self._outputs = None
+        self._inputs_map_snapshot = None
+        self._outputs_map_snapshot = None
         self.automate_execution = automate_execution
 
         super().__init__(
@@ -285,18 +300,46 @@ class Workflow(ParentMost, Composite):
 
     @property
     def inputs(self) -> Inputs:
-        return self._build_inputs()
+        # Maps can be edited in-place, so compare them against the map the cached
+        # panel was built with
+        if self._inputs is None or self._inputs_map_snapshot != self.inputs_map:
+            self._inputs = self._build_inputs()
+        return self._inputs
 
     def _build_inputs(self):
+        self._inputs_map_snapshot = self._snapshot(self.inputs_map)
         return self._build_io("inputs", self.inputs_map)
 
     @property
     def outputs(self) -> Outputs:
-        return self._build_outputs()
+        if self._outputs is None or self._outputs_map_snapshot != self.outputs_map:
+            self._outputs = self._build_outputs()
+        return self._outputs
 
     def _build_outputs(self):
+        self._outputs_map_snapshot = self._snapshot(self.outputs_map)
         return self._build_io("outputs", self.outputs_map)
 
+    @staticmethod
+    def _snapshot(key_map: bidict | None) -> dict | None:
+        return None if key_map is None else dict(key_map)
+
+    def _invalidate_io(self) -> None:
+        """
+        Clear the cached IO panels, e.g. because the children or their connections
+        changed.
+        """
+        self._inputs = None
+        self._outputs = None
+
+    def _child_data_connections_changed(self) -> None:
+        super()._child_data_connections_changed()
+        self._invalidate_io()
+
+    def _child_relabeled(self, child: Node) -> None:
+        super()._child_relabeled(child)
+        self._invalidate_io()  # Panel keys are built from the child labels
+
     def _build_io(
         self,
         i_or_o: Literal["inputs", "outputs"],
@@ -346,7 +389,7 @@ class Workflow(ParentMost, Composite):
         emit_ran_signal: bool,
     ) -> tuple[bool, Any]:
         if self.automate_execution:
-            self.set_run_signals_to_dag_execution()
+            self._apply_execution_plan()
         return super()._before_run(
             check_readiness=check_readiness,
             run_data_tree=run_data_tree,
@@ -358,12 +401,22 @@ class Workflow(ParentMost, Composite):
     def run(
         self,
         check_readiness: bool = True,
+        max_workers: Optional[int] = None,
         **kwargs,
     ):
         # Note: Workflows may have neither parents nor siblings, so we don't need to
         # worry about running their data trees first, fetching their input, nor firing
         # their `ran` signal, hence the change in signature from Node.run
 
+        if max_workers is not None:
+            # Shortcut to run children concurrently on a thread pool, just this once
+            scheduler = self.scheduler
+            self.scheduler = max_workers
+            try:
+                return self.run(check_readiness=check_readiness, **kwargs)
+            finally:
+                self.scheduler = scheduler
+
         return super().run(
             run_data_tree=False,
             run_parent_trees_too=False,
@@ -373,6 +426,33 @@ class Workflow(ParentMost, Composite):
             **kwargs,
         )
 
+    async def arun(
+        self,
+        check_readiness: bool = True,
+        max_workers: Optional[int] = None,
+        **kwargs,
+    ):
+        """
+        An awaitable counterpart to :meth:`run`, which runs the children as tasks on
+        the running event loop.
+        """
+        if max_workers is not None:
+            scheduler = self.scheduler
+            self.scheduler = max_workers
+            try:
+                return await self.arun(check_readiness=check_readiness, **kwargs)
+            finally:
+                self.scheduler = scheduler
+
+        return await super().arun(
+            run_data_tree=False,
+            run_parent_trees_too=False,
+            fetch_input=False,
+            check_readiness=check_readiness,
+            emit_ran_signal=False,
+            **kwargs,
+        )
+
     def pull(self, run_parent_trees_too=False, **kwargs):
         """Workflows are a parent-most object, so this simply runs without pulling."""
         return self.run(**kwargs)
@@ -478,6 +558,36 @@ class Workflow(ParentMost, Composite):
             self.signals.output,
         ]
 
+    def __getstate__(self):
+        state = super().__getstate__()
+        # The cached IO panels only point to child channels, so just rebuild them
+        state["_inputs"] = None
+        state["_outputs"] = None
+        return state
+
+    def __setstate__(self, state):
+        # States saved before the panels were cached may hold stale ones
+        state["_inputs"] = None
+        state["_outputs"] = None
+        state["_inputs_map_snapshot"] = None
+        state["_outputs_map_snapshot"] = None
+        super().__setstate__(state)
+
+    def add_child(
+        self,
+        child: Node,
+        label: Optional[str] = None,
+        strict_naming: Optional[bool] = None,
+    ) -> Node:
+        child = super().add_child(child, label=label, strict_naming=strict_naming)
+        self._invalidate_io()
+        return child
+
+    def remove_child(self, child: Node | str) -> list[tuple[Channel, Channel]]:
+        disconnected = super().remove_child(child)
+        self._invalidate_io()
+        return disconnected
+
     def replace_child(
         self, owned_node: Node | str, replacement: Node | type[Node]
     ) -> Node:
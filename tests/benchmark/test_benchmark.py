@@ -1,10 +1,210 @@
+"""
+Benchmarks for the overhead of the workflow machinery itself, i.e. with nodes that do
+(next to) nothing.
+
+Each benchmark records the best time per call over several repeats. A summary gets
+printed once all the benchmarks have run, and if the `PYIRON_WORKFLOW_BENCHMARK_FILE`
+environment variable points to a JSON file, the results get appended to it -- along
+with the package version and a timestamp -- so they can be tracked over time.
+"""
+
+from datetime import datetime, timezone
+import json
+import os
+from pathlib import Path
+import pickle
+import platform
+from tempfile import TemporaryDirectory
+from time import perf_counter
 import unittest
 
+from pyiron_workflow import __version__
+from pyiron_workflow._tests import ensure_tests_in_python_path
+from pyiron_workflow.workflow import Workflow
+
+ensure_tests_in_python_path()
+from static import demo_nodes
+
+RESULTS: dict[str, float] = {}
+
+
+@Workflow.wrap.as_function_node("y")
+def NoOp(x: int = 0):
+    y = x
+    return y
+
+
+def chain(n: int) -> Workflow:
+    wf = Workflow("chain")
+    wf.n0 = NoOp()
+    for i in range(1, n):
+        wf.add_child(NoOp(wf.children[f"n{i - 1}"]), label=f"n{i}")
+    return wf
+
+
+def without_cache(wf: Workflow) -> Workflow:
+    wf.use_cache = False
+    for node in wf:
+        node.use_cache = False
+    return wf
+
+
+def tearDownModule():
+    if len(RESULTS) == 0:
+        return
+    width = max(len(name) for name in RESULTS)
+    print("\nBenchmark results (best time per call):")
+    for name, seconds in RESULTS.items():
+        print(f"{name:<{width}}  {seconds * 1e3:12.4f} ms")
+
+    filename = os.environ.get("PYIRON_WORKFLOW_BENCHMARK_FILE")
+    if filename is not None:
+        path = Path(filename)
+        history = json.loads(path.read_text()) if path.is_file() else []
+        history.append(
+            {
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "version": __version__,
+                "python": platform.python_version(),
+                "results": RESULTS,
+            }
+        )
+        path.write_text(json.dumps(history, indent=2))
+
+
+class BenchmarkCase(unittest.TestCase):
+    def benchmark(self, name, func, setup=None, number=1, repeat=5):
+        """
+        Time `func`, called `number` times in a row on the result of `setup` (if any),
+        and record the best time per call out of `repeat` tries.
+        """
+        best = float("inf")
+        for _ in range(repeat):
+            args = () if setup is None else (setup(),)
+            start = perf_counter()
+            for _ in range(number):
+                result = func(*args)
+            best = min(best, (perf_counter() - start) / number)
+        RESULTS[f"{self.__class__.__name__}.{name}"] = best
+        return result
+
+
+class TestConstruction(BenchmarkCase):
+    def test_node_instantiation(self):
+        node = self.benchmark("node_instantiation", NoOp, number=100)
+        self.assertIsInstance(node, NoOp)
+
+    def test_macro_instantiation(self):
+        macro = self.benchmark(
+            "macro_instantiation", demo_nodes.AddThree, number=20
+        )
+        self.assertEqual(3, len(macro))
+
+    def test_workflow_construction(self):
+        for n in (10, 100, 1000):
+            with self.subTest(n=n):
+                wf = self.benchmark(
+                    f"workflow_construction_{n}",
+                    lambda: chain(n),
+                    repeat=5 if n < 1000 else 2,
+                )
+                self.assertEqual(n, len(wf))
+
+    def test_dag_execution_signals(self):
+        for n in (100, 1000):
+            with self.subTest(n=n):
+                wf = chain(n)
+                self.benchmark(
+                    f"set_run_signals_to_dag_execution_{n}",
+                    wf.set_run_signals_to_dag_execution,
+                    repeat=5 if n < 1000 else 2,
+                )
+                self.assertListEqual([wf.n0], wf.starting_nodes)
+
+
+class TestRunning(BenchmarkCase):
+    def test_function_run(self):
+        node = NoOp(x=1)
+        node.use_cache = False
+        self.assertEqual(
+            1, self.benchmark("function_run", node.run, number=1000)
+        )
+
+    def test_function_cache_hit(self):
+        node = NoOp(x=1)
+        node.run()
+        self.assertEqual(
+            1, self.benchmark("function_cache_hit", node.run, number=1000)
+        )
+
+    def test_executor_payload(self):
+        node = NoOp(x=1)
+        payload = self.benchmark(
+            "executor_payload", lambda: node._executor_on_run, number=1000
+        )
+        self.assertEqual(1, pickle.loads(pickle.dumps(payload))(False, False, x=1))
+
+    def test_workflow_run(self):
+        wf = without_cache(chain(100))
+        out = self.benchmark("workflow_run_100", wf.run, number=5)
+        self.assertEqual(0, out.n99__y)
+
+
+class TestForLoop(BenchmarkCase):
+    LENGTHS = (10, 1000, 10000)
+    # The graph-based loop only runs up to 1000 rows, rather than the full 10000.
+    # It still scales super-linearly in the loop length -- e.g. an accumulating run
+    # signal with one connection per row re-checks all of them each time one fires --
+    # so it takes ~20 s at 1000 rows, ~2 min at 4000 and far longer at 10000
+    GRAPH_MAX_LENGTH = 1000
+
+    def _benchmark_for(self, n, vectorize):
+        def setup():
+            return Workflow.create.for_node(
+                NoOp, iter_on="x", x=list(range(n)), vectorize=vectorize
+            )
+
+        def run(for_node):
+            for_node.run()
+            return for_node
+
+        for_node = self.benchmark(
+            f"for_{'vectorized' if vectorize else 'graph'}_{n}",
+            run,
+            setup=setup,
+            repeat=5 if n < 1000 else 1,
+        )
+        self.assertEqual(n, len(for_node.outputs.df.value))
+
+    def test_graph(self):
+        for n in self.LENGTHS:
+            if n <= self.GRAPH_MAX_LENGTH:
+                with self.subTest(n=n):
+                    self._benchmark_for(n, vectorize=False)
+
+    def test_vectorized(self):
+        for n in self.LENGTHS:
+            with self.subTest(n=n):
+                self._benchmark_for(n, vectorize=True)
+
+
+class TestStorage(BenchmarkCase):
+    def test_save_load(self):
+        wf = chain(100)
+        wf.run()
+        with TemporaryDirectory() as tmp:
+            filename = Path(tmp) / "chain"
+
+            self.benchmark("save_100", lambda: wf.save(filename=filename))
+
+            def load():
+                loaded = Workflow("loaded")
+                loaded.load(filename=filename)
+                return loaded
 
-class TestNothing(unittest.TestCase):
-    def test_nothing(self):
-        self.assertTrue(True)
+            loaded = self.benchmark("load_100", load)
+        self.assertEqual(wf.n99.outputs.y.value, loaded.n99.outputs.y.value)
 
 
-if __name__ == '__main__':
+if __name__ == "__main__":
     unittest.main()
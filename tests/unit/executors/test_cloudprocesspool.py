@@ -1,8 +1,10 @@
 from functools import partialmethod
 from concurrent.futures import TimeoutError
+from pathlib import Path
 from time import sleep
 import unittest
 
+from pyiron_workflow.executors import cloudpickleprocesspool
 from pyiron_workflow.executors.cloudpickleprocesspool import (
     CloudpickleProcessPoolExecutor
 )
@@ -46,6 +48,10 @@ def dynamic_foo():
     return as_dynamic_foo
 
 
+def worker_class_keys():
+    return sorted(cloudpickleprocesspool._worker_classes.keys())
+
+
 class TestCloudpickleProcessPoolExecutor(unittest.TestCase):
 
     def test_unpickleable_callable(self):
@@ -164,6 +170,45 @@ class TestCloudpickleProcessPoolExecutor(unittest.TestCase):
             fs = executor.submit(f.run)
             fs.result(timeout=0.0001)
 
+    def test_cache_classes(self):
+        @dynamic_foo()
+        def does_nothing():
+            return
+
+        @dynamic_foo()
+        def updates_arg(arg):
+            arg.result = "input updated"
+            return arg
+
+        updater = updates_arg()
+        with CloudpickleProcessPoolExecutor(max_workers=1, cache_classes=True) as exe:
+            for i in range(3):
+                arg = does_nothing()
+                returned = exe.submit(updater.run, arg).result(timeout=120)
+                self.assertIs(
+                    arg.__class__,
+                    returned.__class__,
+                    msg="Returned instances should map back to the original class"
+                )
+                self.assertEqual("input updated", returned.result)
+
+            registry = exe._class_registry
+            self.assertListEqual(
+                [arg.__class__],
+                list(registry.classes.values()),
+                msg="Only dynamic classes should get registered, and only once"
+            )
+            self.assertListEqual(
+                sorted(registry.classes.keys()),
+                exe.submit(worker_class_keys).result(timeout=120),
+                msg="The worker should hold on to the classes it loaded"
+            )
+            directory = registry.directory
+        self.assertFalse(
+            Path(directory).exists(),
+            msg="Shutting down should clean up the registered classes"
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
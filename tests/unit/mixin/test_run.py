@@ -1,10 +1,15 @@
+import asyncio
 from concurrent.futures import Future
 import unittest
 
 from pyiron_workflow.executors.cloudpickleprocesspool import (
     CloudpickleProcessPoolExecutor
 )
-from pyiron_workflow.mixin.run import Runnable, ReadinessError
+from pyiron_workflow.mixin.run import (
+    Runnable,
+    ReadinessError,
+    await_synchronously,
+)
 
 
 class ConcreteRunnable(Runnable):
@@ -177,6 +182,70 @@ class TestRunnable(unittest.TestCase):
             runnable.executor = (maybe_get_executor, (False,), {})
             runnable.run()
 
+    def test_arun(self):
+        runnable = ConcreteRunnable()
+        self.assertDictEqual(
+            runnable.expected_run_output,
+            asyncio.run(runnable.arun()),
+            msg="Awaiting should give the result directly"
+        )
+        self.assertDictEqual(runnable.expected_processed_value, runnable.processed)
+
+        with CloudpickleProcessPoolExecutor() as exe:
+            runnable.executor = exe
+            runnable.processed = None
+            self.assertDictEqual(
+                runnable.expected_run_output,
+                asyncio.run(runnable.arun()),
+                msg="Awaiting should give the result directly, even with an executor"
+            )
+            self.assertDictEqual(runnable.expected_processed_value, runnable.processed)
+
+    def test_await_synchronously(self):
+        async def forty_two():
+            await asyncio.sleep(0)
+            return 42
+
+        async def inside_a_running_loop():
+            return await_synchronously(forty_two())
+
+        self.assertEqual(42, await_synchronously(forty_two()))
+        self.assertEqual(42, asyncio.run(inside_a_running_loop()))
+
+    def test_profile(self):
+        runnable = ConcreteRunnable()
+        runnable.run()
+        self.assertIsNone(runnable.run_profile, msg="Profiling should be opt-in")
+
+        runnable.profile = True
+        runnable.run()
+        profile = runnable.run_profile
+        self.assertEqual(runnable.label, profile.label)
+        self.assertFalse(profile.failed)
+        self.assertEqual(0, profile.submit, msg="Nothing to submit when running locally")
+        self.assertGreaterEqual(profile.total, profile.before_run + profile.on_run)
+        self.assertAlmostEqual(profile.overhead, profile.total - profile.on_run)
+
+        with CloudpickleProcessPoolExecutor() as exe:
+            runnable.executor = exe
+            runnable.run().result(timeout=30)
+        profile = runnable.run_profile
+        self.assertDictEqual(
+            runnable.expected_processed_value,
+            runnable.processed,
+            msg="Profiling should be transparent to the result"
+        )
+        self.assertGreater(profile.submit, 0, msg="The run got serialized and sent")
+        self.assertGreater(
+            profile.on_run, 0, msg="Timing from the other process should get returned"
+        )
+
+        failing = FailingRunnable()
+        failing.profile = True
+        with self.assertRaises(RuntimeError):
+            failing.run()
+        self.assertTrue(failing.run_profile.failed)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -30,6 +30,38 @@ class TestSemantics(unittest.TestCase):
             msg="Nothings should be suggested for my_neighbor_stinks"
         )
 
+    def test_child_labels(self):
+        parent = SemanticParent("parent", strict_naming=False)
+        for _ in range(4):
+            parent.add_child(Semantic("child"))
+        parent.child3 = "a label-like attribute"
+        parent.add_child(Semantic("child"))
+        self.assertListEqual(
+            ["child", "child0", "child1", "child2", "child4"],
+            list(parent.children.keys()),
+            msg="Suffixes should count up, skipping labels that are already taken"
+        )
+
+        with self.subTest("State from before the suffix counters existed"):
+            state = parent.__getstate__()
+            del state["_label_suffix_counters"]
+            older = SemanticParent.__new__(SemanticParent)
+            older.__setstate__(state)
+            older.add_child(Semantic("child"))
+            self.assertIn(
+                "child5",
+                older.children.keys(),
+                msg="Suffixing should still work after loading an older state"
+            )
+
+        with self.assertRaises(AttributeError, msg="Children can't shadow methods"):
+            parent.add_child(Semantic("add_child"))
+        with self.assertRaises(AttributeError, msg="Nor instance attributes"):
+            parent.add_child(Semantic("strict_naming"))
+        parent.strict_naming = True
+        with self.assertRaises(AttributeError, msg="Nor each other, when strict"):
+            parent.add_child(Semantic("child"))
+
     def test_label_validity(self):
         with self.assertRaises(TypeError, msg="Label must be a string"):
             Semantic(label=123)
@@ -84,6 +116,34 @@ class TestSemantics(unittest.TestCase):
         self.assertEqual(self.middle2.semantic_path, "/root/middle/middle_sub")
         self.assertEqual(self.child2.semantic_path, "/root/middle/middle_sub/child2")
 
+    def test_path_cache(self):
+        self.assertEqual("/root/middle/middle_sub/child2", self.child2.semantic_path)
+
+        self.middle1.label = "renamed"
+        self.assertEqual(
+            "/root/renamed/middle_sub/child2",
+            self.child2.semantic_path,
+            msg="Relabeling an ancestor should update the cached path"
+        )
+
+        self.middle1.remove_child(self.middle2)
+        self.assertEqual(
+            "/middle_sub/child2",
+            self.child2.semantic_path,
+            msg="Losing an ancestor should update the cached path"
+        )
+
+        self.root.add_child(self.middle2, label="moved")
+        self.assertEqual(
+            "/root/moved/child2",
+            self.child2.semantic_path,
+            msg="Gaining an ancestor, and relabeling on adding, should update the "
+                "cached path"
+        )
+
+        self.child2.label = "relabeled"
+        self.assertEqual("/root/moved/relabeled", self.child2.semantic_path)
+
     def test_root(self):
         self.assertEqual(self.root.semantic_root, self.root)
         self.assertEqual(self.child1.semantic_root, self.root)
@@ -1,4 +1,5 @@
-from concurrent.futures import ProcessPoolExecutor
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import unittest
 
 from pyiron_workflow._tests import ensure_tests_in_python_path
@@ -417,6 +418,25 @@ class TestComposite(unittest.TestCase):
             msg="n3 was omitted from the execution diagram, it should not have run"
         )
 
+    def test_arun_customized_run(self):
+        customized_runs = []
+
+        class Customized(AComposite):
+            def _on_run(self):
+                customized_runs.append(self.label)
+                return super()._on_run()
+
+        comp = Customized("customized")
+        comp.n1 = comp.create.function_node(plus_one, x=0)
+        comp.starting_nodes = [comp.n1]
+        asyncio.run(comp.arun())
+        self.assertListEqual(
+            ["customized"],
+            customized_runs,
+            msg="Awaiting should not skip over a customized run"
+        )
+        self.assertEqual(1, comp.n1.outputs.y.value)
+
     def test_set_run_signals_to_dag(self):
         # Like the run test, but manually invoking this first
         self.comp.n1 = self.comp.create.function_node(plus_one, x=0)
@@ -603,6 +623,37 @@ class TestComposite(unittest.TestCase):
                 "retain its executor"
         )
 
+    def test_executor_children_wake_run_loop(self):
+        n_links = 20
+        previous = None
+        for i in range(n_links):
+            n = self.comp.create.function_node(
+                plus_one, x=0 if previous is None else previous, label=f"n{i}"
+            )
+            self.comp.add_child(n)
+            if previous is not None:
+                previous >> n
+            previous = n
+        self.comp.starting_nodes = [self.comp.n0]
+
+        with ThreadPoolExecutor() as exe:
+            for n in self.comp:
+                n.executor = exe
+            self.comp.run()
+
+        self.assertEqual(
+            n_links,
+            previous.outputs.y.value,
+            msg="Every executor-backed child should finish and queue its signals "
+                "before the run loop is allowed to exit"
+        )
+        self.assertListEqual(
+            [f"n{i}" for i in range(n_links)],
+            self.comp.provenance_by_completion,
+        )
+        self.assertListEqual([], self.comp.running_children)
+        self.assertListEqual([], self.comp.signal_queue)
+
     def test_result_serialization(self):
         """
         This is actually only a useful feature if you have an executor which will
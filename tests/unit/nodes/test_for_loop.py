@@ -1,16 +1,20 @@
+import asyncio
 from concurrent.futures import ThreadPoolExecutor
 from itertools import product
 import pickle
-from time import perf_counter
+from threading import Event
+from time import perf_counter, sleep
 import unittest
 
 from pandas import DataFrame
 from pyiron_snippets.dotdict import DotDict
 
 from pyiron_workflow._tests import ensure_tests_in_python_path
+from pyiron_workflow.mixin.run import ReadinessError
 from pyiron_workflow.nodes.for_loop import (
     dictionary_to_index_maps,
     for_node,
+    ForRow,
     UnmappedConflictError,
     MapsToNonexistentOutputError
 )
@@ -113,6 +117,42 @@ def FiveTogether(
     return (a, b, c, d, e,),
 
 
+BODY_CALLS = []
+
+
+@as_function_node
+def CountedSquare(x: int, shift: int = 0):
+    BODY_CALLS.append(x)
+    square = x * x + shift
+    return square
+
+
+GATE = Event()
+
+
+@as_function_node
+def Gated(x: int):
+    BODY_CALLS.append(x)
+    if x > 0:
+        GATE.wait(timeout=5)
+    y = x
+    return y
+
+
+@as_function_node("y")
+async def AsyncPlusOne(x: int):
+    await asyncio.sleep(0)
+    y = x + 1
+    return y
+
+
+@as_function_node("slept")
+async def AsyncSleep(t: float):
+    await asyncio.sleep(t)
+    slept = t
+    return slept
+
+
 class TestForNode(unittest.TestCase):
 
     @classmethod
@@ -398,6 +438,211 @@ class TestForNode(unittest.TestCase):
                         "nodes on serialization or the thread lock/queue objects hit us"
                 )
 
+    def test_vectorized(self):
+        kwargs = {
+            "iter_on": ("a", "b"),
+            "zip_on": ("c", "d"),
+            "a": [1, 2],
+            "b": [3, 4, 5],
+            "c": [7, 8],
+            "d": [9, 10, 11],
+            "e": "e",
+        }
+        for output_as_dataframe in [True, False]:
+            with self.subTest(f"output_as_dataframe {output_as_dataframe}"):
+                graph = for_node(
+                    FiveTogether, output_as_dataframe=output_as_dataframe, **kwargs
+                )
+                vectorized = for_node(
+                    FiveTogether,
+                    output_as_dataframe=output_as_dataframe,
+                    vectorize=True,
+                    **kwargs
+                )
+                expected = graph()
+                out = vectorized()
+                if output_as_dataframe:
+                    self.assertTrue(expected.df.equals(out.df))
+                else:
+                    self.assertDictEqual(dict(expected), dict(out))
+                self.assertEqual(
+                    len(vectorized.preview_inputs()),
+                    len(vectorized),
+                    msg="Only the input nodes should exist, there is no body subgraph"
+                )
+
+        with self.subTest("Switching modes discards the old subgraph"):
+            graph.vectorize = True
+            graph()
+            self.assertEqual(len(graph.preview_inputs()), len(graph))
+
+    def test_vectorized_macro_body(self):
+        n = for_node(self.AddThree, iter_on="x", x=[1, 2, 3], vectorize=True)
+        self.assertListEqual([4, 5, 6], n().df["add_three"].to_list())
+
+    def test_vectorized_executor(self):
+        n = for_node(Add, iter_on="obj", obj=[1, 2, 3], other=10, vectorize=True)
+        for title, executor in [
+            ("Instance", ThreadPoolExecutor()),
+            ("Instructions", (ThreadPoolExecutor, (), {})),
+        ]:
+            with self.subTest(title):
+                n.body_node_executor = executor
+                self.assertListEqual([11, 12, 13], n().df["add"].to_list())
+        n.body_node_executor = None
+
+    def test_vectorized_chunksize(self):
+        n = for_node(
+            Add, iter_on="obj", obj=list(range(10)), other=1, vectorize=True
+        )
+        n.use_cache = False  # Re-run with the same input
+
+        class CountingExecutor(ThreadPoolExecutor):
+            n_submitted = 0
+
+            def submit(self, fn, /, *args, **kwargs):
+                self.n_submitted += 1
+                return super().submit(fn, *args, **kwargs)
+
+        for chunksize, n_tasks in [(1, 10), (3, 4), (10, 1), (100, 1)]:
+            with self.subTest(chunksize=chunksize):
+                with CountingExecutor() as exe:
+                    n.body_node_executor = exe
+                    n.chunksize = chunksize
+                    self.assertListEqual(
+                        list(range(1, 11)),
+                        n().df["add"].to_list(),
+                        msg="Chunks should be unpacked in order"
+                    )
+                self.assertEqual(n_tasks, exe.n_submitted)
+
+        n.body_node_executor = None
+
+        with self.subTest("Invalid chunksize"):
+            for invalid in [0, -1, 2.5]:
+                with self.assertRaises(ValueError):
+                    n.chunksize = invalid
+            with self.assertRaises(ValueError, msg="Validated on instantiation too"):
+                for_node(Add, iter_on="obj", chunksize=0)
+
+        with self.subTest("Unused chunksize"):
+            n.chunksize = 3
+            with self.assertWarns(UserWarning, msg="No executor to chunk for"):
+                n(obj=[1, 2])
+            n.vectorize = False
+            with self.assertWarns(UserWarning, msg="No rows to chunk at all"):
+                n(obj=[1, 2])
+
+    def test_body_reuse(self):
+        BODY_CALLS.clear()
+        n = for_node(CountedSquare, iter_on="x", x=[1, 2, 3])
+        n()
+        first_bodies = [n.children[f"body_{i}"] for i in range(3)]
+        self.assertListEqual([1, 2, 3], sorted(BODY_CALLS))
+
+        BODY_CALLS.clear()
+        out = n(x=[0, 1, 2, 3, 4])
+        self.assertListEqual(
+            [0, 1, 4, 9, 16],
+            out.df["square"].to_list(),
+        )
+        self.assertListEqual(
+            [0, 4],
+            sorted(BODY_CALLS),
+            msg="Extending the looped input should only compute the new rows"
+        )
+        for i, body in enumerate(first_bodies):
+            self.assertIs(
+                body,
+                n.children[f"body_{i + 1}"],
+                msg="Matching rows should be found even when their index changes"
+            )
+
+        BODY_CALLS.clear()
+        out = n(shift=1)
+        self.assertListEqual([1, 2, 5, 10, 17], out.df["square"].to_list())
+        self.assertEqual(
+            5,
+            len(BODY_CALLS),
+            msg="Re-used bodies should still re-compute when broadcast input changes"
+        )
+
+        BODY_CALLS.clear()
+        out = n(x=[4, 4])
+        self.assertListEqual([17, 17], out.df["square"].to_list())
+        self.assertListEqual([4], BODY_CALLS, msg="Each body can only be re-used once")
+        self.assertFalse(
+            "body_2" in n.children,
+            msg="Unused bodies should be removed"
+        )
+
+    def test_iter_rows(self):
+        n = for_node(CountedSquare, iter_on="x")
+        with self.assertRaises(ReadinessError):
+            next(n.iter_rows())
+
+        rows = list(n.iter_rows(x=[1, 2, 3], shift=1))
+        self.assertListEqual(
+            [
+                ForRow(0, {"x": 1}, {"square": 2}),
+                ForRow(1, {"x": 2}, {"square": 5}),
+                ForRow(2, {"x": 3}, {"square": 10}),
+            ],
+            rows,
+        )
+        self.assertFalse(
+            n.outputs.ready,
+            msg="Streaming is not a run, and should not collect output"
+        )
+        self.assertEqual(
+            len(n.preview_inputs()),
+            len(n),
+            msg="Streaming should not build a body subgraph"
+        )
+
+    def test_iter_rows_executor(self):
+        n = for_node(Sleep, iter_on="t", chunksize=1)
+        with ThreadPoolExecutor(max_workers=3) as exe:
+            n.body_node_executor = exe
+            rows = list(n.iter_rows(t=[0.3, 0.15, 0.0]))
+        n.body_node_executor = None
+        self.assertListEqual(
+            [2, 1, 0],
+            [row.index for row in rows],
+            msg="Rows should be yielded as they complete"
+        )
+        self.assertListEqual([0.0, 0.15, 0.3], [row.output["time"] for row in rows])
+
+    def test_iter_rows_stopped_early(self):
+        for title, executor in [
+            ("Instance", ThreadPoolExecutor(max_workers=1)),
+            ("Instructions", (ThreadPoolExecutor, (), {"max_workers": 1})),
+        ]:
+            with self.subTest(title):
+                BODY_CALLS.clear()
+                GATE.clear()
+                n = for_node(Gated, iter_on="x")
+                n.body_node_executor = executor
+                rows = n.iter_rows(x=list(range(5)))
+                self.assertEqual(0, next(rows).index)
+                rows.close()  # As when breaking out of a loop over the rows
+                GATE.set()
+                if isinstance(executor, ThreadPoolExecutor):
+                    executor.shutdown(wait=True)
+                else:
+                    sleep(0.1)
+                self.assertFalse(
+                    any(x in BODY_CALLS for x in [2, 3, 4]),
+                    msg="Chunks still queued when the consumer stops should never run"
+                )
+                n.body_node_executor = None
+
+    def test_stream(self):
+        received = []
+        n = for_node(CountedSquare, iter_on="x", zip_on=(), x=[4, 5])
+        self.assertEqual(2, n.stream(received.append))
+        self.assertListEqual([16, 25], [row.output["square"] for row in received])
+
     def test_with_connections_dataframe(self):
         length_y = 3
 
@@ -493,6 +738,64 @@ class TestForNode(unittest.TestCase):
                 (1, 2, 4, 6, "instance",)
             )
 
+    def test_arun(self):
+        for vectorize in [False, True]:
+            with self.subTest(vectorize=vectorize):
+                loop = Add.for_node(
+                    iter_on="other",
+                    obj=1,
+                    other=[1, 2],
+                    output_as_dataframe=False,
+                    vectorize=vectorize,
+                )
+                out = asyncio.run(loop.arun())
+                self.assertListEqual(
+                    [1 + 1, 1 + 2],
+                    out.add,
+                    msg="Awaited runs should (re)build the body like regular runs do"
+                )
+
+        with self.subTest("Concurrent bodies"):
+            loop = AsyncSleep.for_node(
+                iter_on="t", t=[0.3] * 4, output_as_dataframe=False
+            )
+            n_builds = 0
+            build_body = loop._build_body
+
+            def counting_build_body():
+                nonlocal n_builds
+                n_builds += 1
+                return build_body()
+
+            loop._build_body = counting_build_body
+            t0 = perf_counter()
+            asyncio.run(loop.arun())
+            self.assertEqual(1, n_builds, msg="The body should only get built once")
+            self.assertLess(
+                perf_counter() - t0,
+                0.9,
+                msg="Awaiting bodies should overlap on the event loop"
+            )
+
+    def test_async_body(self):
+        for vectorize in [False, True]:
+            with self.subTest(vectorize=vectorize):
+                loop = AsyncPlusOne.for_node(
+                    iter_on="x",
+                    x=[1, 2],
+                    output_as_dataframe=False,
+                    vectorize=vectorize,
+                )
+                self.assertListEqual([2, 3], loop().y)
+
+        with self.subTest("iter_rows"):
+            rows = list(AsyncPlusOne.for_node(iter_on="x").iter_rows(x=[1, 2]))
+            self.assertListEqual(
+                [{"y": 2}, {"y": 3}],
+                [row.output for row in rows],
+                msg="Awaitable node function results should get awaited"
+            )
+
     def test_shortcut(self):
         loop1 = Add.for_node(
             iter_on="other",
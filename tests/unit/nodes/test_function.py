@@ -1,9 +1,11 @@
+import asyncio
 from pathlib import Path
 import pickle
 from typing import Optional, Union
 import unittest
 
 from pyiron_workflow.channels import NOT_DATA
+from pyiron_workflow.executors import CloudpickleProcessPoolExecutor
 from pyiron_workflow.nodes.function import function_node, as_function_node, Function
 from pyiron_workflow.io import ConnectionCopyError, ValueCopyError
 from pyiron_workflow.nodes.multiple_distpatch import MultipleDispatchError
@@ -37,6 +39,12 @@ def multiple_branches(x):
         return False
 
 
+class Subclassed(Function):
+    @staticmethod
+    def node_function(x):
+        return x
+
+
 class TestFunction(unittest.TestCase):
     def test_instantiation(self):
         with self.subTest("Void function is allowable"):
@@ -527,6 +535,83 @@ class TestFunction(unittest.TestCase):
             reloaded.outputs.to_value_dict()
         )
 
+    def test_executor_payload(self):
+        n = function_node(returns_multiple, 1, 2)
+        payload = n._executor_on_run
+        self.assertTupleEqual(
+            (1, 2, 3),
+            pickle.loads(pickle.dumps(payload.fnc))(x=1, y=2),
+            msg="Executors should get sent just the node function, not the node"
+        )
+        self.assertLess(
+            len(pickle.dumps(payload)),
+            len(pickle.dumps(n.on_run)) / 2,
+            msg="Sending the function should be much cheaper than sending the node"
+        )
+
+        with CloudpickleProcessPoolExecutor() as exe:
+            n.executor = exe
+            n.run().result(timeout=30)
+        self.assertDictEqual(
+            {"x": 1, "y": 2, "x + y": 3},
+            n.outputs.to_value_dict(),
+            msg="Results of the function should be applied to the local node"
+        )
+
+        class Custom(Function):
+            @staticmethod
+            def node_function(x):
+                return x
+
+            def _on_run(self, **kwargs):
+                return self.label
+
+        custom = Custom(label="custom")
+        self.assertEqual(
+            custom.on_run,
+            custom._executor_on_run,
+            msg="When the run is customized, the whole node is needed"
+        )
+
+        self.assertEqual(
+            1,
+            pickle.loads(pickle.dumps(Subclassed()._executor_on_run))(
+                False, False, x=1
+            ),
+            msg="Directly subclassed nodes should also be sent without their state"
+        )
+
+        self.assertIs(
+            payload.fnc.args[0]._recipe,
+            type(n)()._executor_on_run.fnc.args[0]._recipe,
+            msg="Reducing a node means getting its whole state, so only do it once "
+                "per class"
+        )
+
+    def test_async_node_function(self):
+        async def async_plus_one(x: int = 1) -> int:
+            await asyncio.sleep(0)
+            y = x + 1
+            return y
+
+        n = function_node(async_plus_one, x=1)
+        self.assertListEqual(["y"], n.outputs.labels)
+        self.assertEqual(2, n.run(), msg="Coroutines should get run when running")
+        self.assertEqual(
+            3,
+            asyncio.run(n.arun(x=2)),
+            msg="Coroutines should get awaited when awaiting"
+        )
+
+        with CloudpickleProcessPoolExecutor() as exe:
+            n.executor = exe
+            n.run(x=3).result(timeout=30)
+        self.assertEqual(
+            4,
+            n.outputs.y.value,
+            msg="Coroutines should get run on executors too"
+        )
+
     def test_decoration(self):
         with self.subTest("@as_function_node(*output_labels, ...)"):
             WithDecoratorSignature = as_function_node("z")(plus_one)
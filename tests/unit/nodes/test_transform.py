@@ -3,11 +3,13 @@ import pickle
 import random
 import unittest
 
+import numpy as np
 from pandas import DataFrame
 
 from pyiron_workflow.channels import NOT_DATA
 from pyiron_workflow.nodes.function import as_function_node
 from pyiron_workflow.nodes.transform import (
+    _ColumnBuffer,
     Transformer,
     as_dataclass_node,
     dataclass_node,
@@ -138,6 +140,44 @@ class TestTransformer(unittest.TestCase):
         ):
             n(row_0=d1, row_1=d3, row_2=d1)
 
+    def test_inputs_to_dataframe_dtypes(self):
+        rows = [
+            {"i": 1, "f": 1.5, "b": True, "mixed": 1, "t": (1,), "big": 2**70},
+            {"i": 2, "f": 2.5, "b": False, "mixed": 2.5, "t": (2,), "big": 1},
+        ]
+        df = inputs_to_dataframe(2, row_0=rows[0], row_1=rows[1]).run()
+        self.assertTrue(
+            df.equals(DataFrame({k: [r[k] for r in rows] for k in rows[0]})),
+            msg="Columns should get the same dtypes as building from lists"
+        )
+
+    def test_column_buffer(self):
+        with self.subTest("Hinted"):
+            column = _ColumnBuffer(2, float)
+            self.assertEqual(np.float64, column.data.dtype)
+            column[1] = 2.0
+            column[0] = 1.0
+            self.assertListEqual([1.0, 2.0], column.finalize().tolist())
+
+        with self.subTest("Values that don't fit fall back to objects"):
+            column = _ColumnBuffer(2, int)
+            column[0] = 1
+            column[1] = True
+            self.assertEqual(object, column.finalize().dtype)
+
+        with self.subTest("Unfilled"):
+            column = _ColumnBuffer(2)
+            column[0] = "a"
+            with self.assertRaises(ValueError):
+                column.finalize()
+
+        with self.subTest("No copy"):
+            column = _ColumnBuffer(2, int)
+            column[0] = 1
+            column[1] = 2
+            df = DataFrame({"x": column.finalize()}, copy=False)
+            self.assertTrue(np.shares_memory(column.data, df["x"].to_numpy()))
+
     def test_dataclass_node(self):
         # Note: We'd need to declare the generator and classes outside the <locals> of
         # this test function if we wanted them to be pickleable, but we test the
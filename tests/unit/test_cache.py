@@ -0,0 +1,128 @@
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from pyiron_workflow._tests import ensure_tests_in_python_path
+from pyiron_workflow.cache import PersistentCache
+from pyiron_workflow.fingerprint import FingerprintError
+from pyiron_workflow.nodes.function import function_node
+from pyiron_workflow.workflow import Workflow
+
+ensure_tests_in_python_path()
+from static import demo_nodes
+
+CALLS = []
+
+
+def counted_plus_one(x: int = 0) -> int:
+    CALLS.append(x)
+    y = x + 1
+    return y
+
+
+class TestPersistentCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = TemporaryDirectory()
+        self.cache = PersistentCache(Path(self.tmp.name) / "cache")
+        CALLS.clear()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_fresh_instances_hit(self):
+        first = function_node(counted_plus_one, x=1)
+        first.persistent_cache = self.cache
+        first.run()
+        self.assertListEqual([1], CALLS)
+
+        second = function_node(counted_plus_one, x=1)
+        second.persistent_cache = self.cache
+        self.assertEqual(2, second.run())
+        self.assertListEqual(
+            [1],
+            CALLS,
+            msg="A fresh instance with the same code and input should load the output "
+                "instead of recomputing it"
+        )
+
+        second.run(x=2)
+        self.assertListEqual([1, 2], CALLS, msg="New input should miss")
+
+    def test_opt_in(self):
+        function_node(counted_plus_one, x=1).run()
+        self.assertFalse(
+            self.cache.directory.exists(),
+            msg="Nothing should be written unless the cache is requested"
+        )
+
+        n = function_node(counted_plus_one, x=1)
+        n.persistent_cache = self.cache
+        n.use_cache = False
+        n.run()
+        self.assertFalse(
+            self.cache.directory.exists(),
+            msg="Nodes that don't use caching should not use the persistent cache"
+        )
+
+    def test_key(self):
+        n = function_node(counted_plus_one, x=1)
+        key = self.cache.key(n)
+        self.assertEqual(key, self.cache.key(function_node(counted_plus_one, x=1)))
+        self.assertNotEqual(key, self.cache.key(function_node(counted_plus_one, x=2)))
+        self.assertNotEqual(
+            key,
+            self.cache.key(demo_nodes.OptionallyAdd(x=1)),
+            msg="Different code should give a different key"
+        )
+
+    def test_unfingerprintable(self):
+        namespace = {}
+        exec("def interactive(x=1):\n    return x", namespace)  # No source file
+        n = function_node(
+            namespace["interactive"], output_labels="y", validate_output_labels=False
+        )
+        with self.assertRaises(FingerprintError):
+            n.code_fingerprint
+        self.assertIsNone(self.cache.key(n))
+        n.persistent_cache = self.cache
+        self.assertEqual(1, n.run(), msg="Nodes without keys should just run")
+
+    def test_macro(self):
+        m = demo_nodes.AddThree(x=0)
+        m.persistent_cache = self.cache
+        m.run()
+        self.assertTrue(self.cache.has(self.cache.key(m)))
+
+        fresh = demo_nodes.AddThree(x=0)
+        fresh.persistent_cache = self.cache
+        self.assertEqual(3, fresh.run().add_three)
+        self.assertListEqual(
+            [],
+            fresh.provenance_by_execution,
+            msg="The macro output came from the cache, so the children never ran"
+        )
+
+    def test_workflow_structure_in_key(self):
+        wf = Workflow("wf")
+        wf.a = wf.create.function_node(counted_plus_one)
+        wf.b = wf.create.function_node(counted_plus_one)
+        unconnected = self.cache.key(wf)
+        wf.b.inputs.x = wf.a
+        self.assertNotEqual(
+            unconnected,
+            self.cache.key(wf),
+            msg="Connections are part of the composite code"
+        )
+
+    def test_clear(self):
+        n = function_node(counted_plus_one, x=1)
+        n.persistent_cache = self.cache
+        n.run()
+        key = self.cache.key(n)
+        self.assertDictEqual({"y": 2}, self.cache.load(key))
+        self.cache.clear()
+        self.assertIsNone(self.cache.load(key))
+
+
+if __name__ == "__main__":
+    unittest.main()
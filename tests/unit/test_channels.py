@@ -1,5 +1,6 @@
 import unittest
 
+from pyiron_workflow import type_hinting
 from pyiron_workflow.channels import (
     Channel, InputData, OutputData, InputSignal, AccumulatingInputSignal, OutputSignal,
     NOT_DATA, ChannelConnectionError, BadCallbackError
@@ -343,6 +344,42 @@ class TestDataChannels(unittest.TestCase):
             msg="Without checking the hint, we should only car that there's data"
         )
 
+    def test_ready_is_cached(self):
+        calls = []
+
+        def counting_validator(value):
+            calls.append(value)
+            return isinstance(value, list)
+
+        self.si._validator = counting_validator
+        self.si._validator_hint = self.si.type_hint
+        self.si.value = [1]
+        self.assertTrue(self.si.ready)
+        self.assertTrue(self.si.ready)
+        self.assertEqual(
+            1,
+            len(calls),
+            msg="The value got validated on assignment, and that should be remembered"
+        )
+
+        self.si.type_hint = list[int]
+        self.assertTrue(self.si.ready, msg="New hints should get checked afresh")
+        self.assertEqual(1, len(calls), msg="A new hint gets a new validator")
+        self.si._value = ["not an int"]
+        self.assertFalse(self.si.ready, msg="New values should get checked afresh")
+
+        self.si.value = [1, "not an int"]  # Only the first item gets checked
+        self.assertTrue(self.si.ready)
+        try:
+            type_hinting.collection_check = "all"
+            self.assertFalse(
+                self.si.ready,
+                msg="Changing how collections get checked should invalidate the "
+                    "remembered validity"
+            )
+        finally:
+            type_hinting.collection_check = "first"
+
     def test_if_not_data(self):
         if NOT_DATA:
             a = 0
@@ -0,0 +1,166 @@
+import unittest
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+import pint
+
+from pyiron_workflow.fingerprint import (
+    FingerprintError,
+    fingerprint_code,
+    fingerprint_value,
+    fingerprint_values,
+)
+from pyiron_workflow.nodes.function import function_node
+
+CALLS = []
+
+
+def counted_sum(x: np.ndarray) -> float:
+    CALLS.append(x)
+    s = float(np.sum(x))
+    return s
+
+
+def counted_identity(x):
+    CALLS.append(x)
+    return x
+
+
+@dataclass
+class Point:
+    x: float
+    data: np.ndarray
+
+
+class Unpicklable:
+    def __reduce__(self):
+        raise TypeError("Nope")
+
+
+class TestFingerprint(unittest.TestCase):
+    def test_primitives(self):
+        self.assertEqual(fingerprint_value("a"), fingerprint_value("a"))
+        self.assertNotEqual(
+            fingerprint_value(1),
+            fingerprint_value(1.0),
+            msg="Types should be distinguished, even when values compare equal"
+        )
+        self.assertNotEqual(fingerprint_value(1), fingerprint_value(True))
+        self.assertNotEqual(fingerprint_value("1"), fingerprint_value(b"1"))
+
+    def test_numpy(self):
+        a = np.arange(12.0).reshape(3, 4)
+        self.assertEqual(fingerprint_value(a), fingerprint_value(a.copy()))
+        self.assertEqual(
+            fingerprint_value(a.T),
+            fingerprint_value(np.ascontiguousarray(a.T)),
+            msg="Memory layout should not matter"
+        )
+        self.assertNotEqual(fingerprint_value(a), fingerprint_value(a.reshape(4, 3)))
+        self.assertNotEqual(fingerprint_value(a), fingerprint_value(a.astype(int)))
+        self.assertEqual(
+            fingerprint_value(np.array([None, [1]], dtype=object)),
+            fingerprint_value(np.array([None, [1]], dtype=object)),
+            msg="Object arrays should fall back to pickling"
+        )
+
+        masked = np.ma.array([1, 2, 3], mask=[0, 1, 0])
+        self.assertEqual(fingerprint_value(masked), fingerprint_value(masked.copy()))
+        self.assertNotEqual(
+            fingerprint_value(masked),
+            fingerprint_value(np.ma.array([1, 2, 3], mask=[0, 0, 0])),
+            msg="Masks are part of a masked array's value"
+        )
+        self.assertNotEqual(
+            fingerprint_value(masked),
+            fingerprint_value(np.ma.array([1, 2, 3], mask=[0, 1, 0], fill_value=-1)),
+        )
+        self.assertNotEqual(
+            fingerprint_value(masked), fingerprint_value(np.array([1, 2, 3]))
+        )
+
+    def test_pandas(self):
+        df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+        self.assertEqual(fingerprint_value(df), fingerprint_value(df.copy()))
+        self.assertNotEqual(
+            fingerprint_value(df), fingerprint_value(df.rename(columns={"a": "c"}))
+        )
+        self.assertNotEqual(fingerprint_value(df), fingerprint_value(df.iloc[::-1]))
+        self.assertNotEqual(fingerprint_value(df.a), fingerprint_value(df.a.rename("c")))
+        self.assertEqual(
+            fingerprint_value(pd.DataFrame({"a": [[1], [2]]})),
+            fingerprint_value(pd.DataFrame({"a": [[1], [2]]})),
+            msg="Unhashable contents should fall back to pickling"
+        )
+
+    def test_pint(self):
+        u = pint.UnitRegistry()
+        self.assertEqual(
+            fingerprint_value(np.ones(3) * u.meter),
+            fingerprint_value(np.ones(3) * u.meter),
+        )
+        self.assertNotEqual(
+            fingerprint_value(1.0 * u.meter), fingerprint_value(1.0 * u.second)
+        )
+
+    def test_dataclass(self):
+        p = Point(1.0, np.arange(3))
+        self.assertEqual(
+            fingerprint_value(p), fingerprint_value(Point(1.0, np.arange(3)))
+        )
+        self.assertNotEqual(
+            fingerprint_value(p), fingerprint_value(Point(1.0, np.arange(4)))
+        )
+
+    def test_unserializable(self):
+        with self.assertRaises(FingerprintError):
+            fingerprint_value(Unpicklable())
+        with self.assertRaises(FingerprintError):
+            fingerprint_values({"x": 1, "y": Unpicklable()})
+        with self.assertRaises(FingerprintError):
+            fingerprint_code("module", "name", None)
+
+    def test_values(self):
+        self.assertEqual(
+            fingerprint_values({"a": 1, "b": 2}),
+            fingerprint_values({"b": 2, "a": 1}),
+            msg="Should be independent of order"
+        )
+        self.assertNotEqual(
+            fingerprint_values({"a": 1, "b": 2}),
+            fingerprint_values({"a": 2, "b": 1}),
+        )
+
+
+class TestNodeCaching(unittest.TestCase):
+    def setUp(self):
+        CALLS.clear()
+
+    def test_array_input_hits(self):
+        n = function_node(counted_sum, x=np.arange(5))
+        n.run()
+        n.inputs.x = np.arange(5)  # A new but equal array
+        self.assertTrue(n.cache_hit)
+        n.run()
+        self.assertEqual(1, len(CALLS), msg="Equal array input should hit the cache")
+
+    def test_in_place_modification_misses(self):
+        x = np.arange(5)
+        n = function_node(counted_sum, x=x)
+        n.run()
+        x[0] = 100
+        self.assertFalse(n.cache_hit)
+        self.assertEqual(110, n.run())
+        self.assertEqual(2, len(CALLS))
+
+    def test_unfingerprintable_input_misses(self):
+        n = function_node(counted_identity, x=Unpicklable())
+        n.run()
+        self.assertFalse(n.cache_hit)
+        n.run()
+        self.assertEqual(2, len(CALLS), msg="Unfingerprintable input should never hit")
+
+
+if __name__ == "__main__":
+    unittest.main()
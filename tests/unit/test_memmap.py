@@ -0,0 +1,96 @@
+import pickle
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from pyiron_workflow.executors import CloudpickleProcessPoolExecutor
+from pyiron_workflow.memmap import MappedArray, load_mapped_arrays, map_large_arrays
+from pyiron_workflow.workflow import Workflow
+
+
+@Workflow.wrap.as_function_node("big", "small")
+def MakeArrays(n: int = 1000):
+    big = np.arange(n, dtype=float)
+    small = np.arange(2)
+    return big, small
+
+
+class TestMemmap(unittest.TestCase):
+    def test_round_trip(self):
+        with TemporaryDirectory() as d:
+            big, small = np.arange(1000, dtype=float), np.arange(2)
+            mapped = map_large_arrays((big, small, "foo"), Path(d), 100)
+            self.assertIsInstance(mapped[0], MappedArray)
+            self.assertIs(small, mapped[1], msg="Small arrays pass by value")
+            self.assertEqual("foo", mapped[2])
+
+            loaded, handles = load_mapped_arrays(pickle.loads(pickle.dumps(mapped)))
+            self.assertListEqual([mapped[0].path], [h.path for h in handles])
+            self.assertIsInstance(loaded[0], np.memmap)
+            self.assertTrue(np.array_equal(big, loaded[0]))
+
+            loaded[0][0] = 42
+            self.assertEqual(
+                0,
+                np.load(mapped[0].path)[0],
+                msg="Mapping is copy-on-write, so the file should be unchanged"
+            )
+
+            self.assertTrue(handles[0].unlink())
+            self.assertFalse(mapped[0].path.exists())
+
+    def test_containers(self):
+        with TemporaryDirectory() as d:
+            for result in [
+                np.ones(10),
+                [np.ones(10)],
+                {"a": np.ones(10)},
+            ]:
+                with self.subTest(type(result).__name__):
+                    mapped = map_large_arrays(result, Path(d), 0)
+                    loaded, handles = load_mapped_arrays(mapped)
+                    self.assertIsInstance(loaded, type(result))
+                    self.assertEqual(1, len(handles))
+
+    def test_node_on_executor(self):
+        n = MakeArrays(label="make_arrays")
+        n.memmap_threshold = 1000
+        self.assertFalse(n._maps_large_arrays, msg="Local runs pass by value")
+        try:
+            with CloudpickleProcessPoolExecutor() as exe:
+                n.executor = exe
+                self.assertTrue(n._maps_large_arrays)
+                n.run().result(timeout=30)
+            self.assertIsInstance(n.outputs.big.value, np.memmap)
+            self.assertNotIsInstance(n.outputs.small.value, np.memmap)
+            self.assertTrue(np.array_equal(np.arange(1000), n.outputs.big.value))
+            self.assertListEqual([], n._mapped_arrays)
+            self.assertFalse(
+                n.as_path().is_dir(),
+                msg="Handoff files should be removed as soon as they are loaded, even "
+                    "without cleaning up the graph directory"
+            )
+            self.assertTrue(
+                np.array_equal(np.arange(1000), n.outputs.big.value),
+                msg="Removing the files should not invalidate the mapped arrays"
+            )
+
+            n.executor = None
+            n.use_cache = False
+            n.memmap_threshold = 0
+            n._serialize_result = True
+            n._do_clean = True
+            n.run(n=500)
+            self.assertListEqual([], n._mapped_arrays, msg="Cleaned up")
+            self.assertEqual(500, len(n.outputs.big.value))
+            self.assertFalse(n.as_path().is_dir())
+        finally:
+            n.executor = None
+            n._unlink_mapped_arrays()
+            n._clean_graph_directory()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 from concurrent.futures import Future, ProcessPoolExecutor
 import pathlib
+from sys import getrecursionlimit
 import unittest
 
 from pyiron_workflow.channels import InputData, NOT_DATA
@@ -7,6 +8,7 @@ from pyiron_workflow.mixin.injection import OutputDataWithInjection, OutputsWith
 from pyiron_workflow.io import Inputs
 from pyiron_workflow.node import Node
 from pyiron_workflow.storage import available_backends, PickleStorage
+from pyiron_workflow.topology import get_nodes_in_data_tree
 from pyiron_workflow.mixin.single_output import AmbiguousOutputError
 
 
@@ -85,6 +87,28 @@ class TestNode(unittest.TestCase):
             msg="Should pull start down to end, even with no flow defined"
         )
 
+    def test_data_tree(self):
+        self.assertSetEqual(
+            {self.n1, self.n2, self.n3}, get_nodes_in_data_tree(self.n3)
+        )
+        self.assertSetEqual({self.n1}, get_nodes_in_data_tree(self.n1))
+
+        chain = [self.n3]
+        for i in range(2 * getrecursionlimit()):
+            chain.append(ANode(label=f"n{i}", x=chain[-1].outputs.y))
+        self.assertEqual(
+            len(chain) + 2,
+            len(get_nodes_in_data_tree(chain[-1])),
+            msg="Deep trees should not hit the recursion limit"
+        )
+
+        self.n1.inputs.x = self.n3.outputs.y
+        self.assertSetEqual(
+            {self.n1, self.n2, self.n3},
+            get_nodes_in_data_tree(self.n2),
+            msg="Cycles should terminate, they are caught when sorting the tree"
+        )
+
     def test_fetch_input(self):
         self.n1.outputs.y.value = 0
         with self.assertRaises(
@@ -0,0 +1,136 @@
+import json
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from pyiron_workflow._tests import ensure_tests_in_python_path
+from pyiron_workflow.profiling import RunProfile
+from pyiron_workflow.workflow import Workflow
+
+ensure_tests_in_python_path()
+from static import demo_nodes
+
+
+@Workflow.wrap.as_function_node("y")
+def PlusOne(x: int = 0):
+    y = x + 1
+    return y
+
+
+class TestRunProfile(unittest.TestCase):
+    def test_chrome_trace(self):
+        profile = RunProfile(
+            "/wf",
+            start=10.0,
+            before_run=1.0,
+            on_run=2.0,
+            process_result=0.5,
+            total=4.0,
+            children=[RunProfile("/wf/a", start=11.0, on_run=1.0, total=1.0)],
+        )
+        events = profile.to_chrome_trace()["traceEvents"]
+        self.assertListEqual(
+            ["/wf", "/wf/a"],
+            [e["args"]["name"] for e in events if e["ph"] == "M"],
+            msg="Each label should get its own row"
+        )
+        spans = {
+            (e["tid"], e["name"]): (e["ts"], e["dur"])
+            for e in events if e["ph"] == "X"
+        }
+        self.assertDictEqual(
+            {
+                (0, "/wf"): (10e6, 4e6),
+                (0, "before_run"): (10e6, 1e6),
+                (0, "on_run"): (11e6, 2e6),
+                (0, "process_result"): (13.5e6, 0.5e6),
+                (1, "/wf/a"): (11e6, 1e6),
+                (1, "on_run"): (11e6, 1e6),
+            },
+            spans,
+            msg="Leading phases should be laid out from the start, trailing phases "
+                "up to the end, and zero-duration phases skipped"
+        )
+
+        with TemporaryDirectory() as tmp:
+            filename = Path(tmp) / "trace.json"
+            profile.save_chrome_trace(filename)
+            with open(filename) as f:
+                self.assertDictEqual(profile.to_chrome_trace(), json.load(f))
+
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        self.wf = Workflow("profiled")
+        self.wf.a = PlusOne(1)
+        self.wf.b = PlusOne(self.wf.a)
+        self.wf.m = demo_nodes.AddThree(self.wf.b)
+
+    def test_opt_in(self):
+        self.wf.run()
+        self.assertTrue(
+            all(p is None for p in [self.wf.run_profile, self.wf.a.run_profile]),
+            msg="Profiling should be opt-in"
+        )
+
+        self.wf.a.profile = True
+        self.wf.run(a__x=2)
+        self.assertIsNotNone(self.wf.a.run_profile)
+        self.assertIsNone(
+            self.wf.run_profile,
+            msg="Profiling children should not profile their parent"
+        )
+
+    def test_trace(self):
+        self.wf.profile = True
+        self.wf.run()
+        profile = self.wf.run_profile
+        self.assertEqual(self.wf.full_label, profile.label)
+        self.assertListEqual(
+            self.wf.provenance_by_completion,
+            [p.label.split("/")[-1] for p in profile.children],
+            msg="Children of profiled composites should get profiled"
+        )
+        self.assertListEqual(
+            [self.wf.m.full_label + "/" + c for c in self.wf.m.provenance_by_completion],
+            [p.label for p in profile.children[-1].children],
+            msg="The profile should nest all the way down"
+        )
+        self.assertGreaterEqual(
+            profile.on_run,
+            sum(p.total for p in profile.children),
+            msg="The composite's computation is running its children"
+        )
+
+        self.wf.use_cache = False
+        self.wf.a.use_cache = False
+        self.wf.run()
+        self.assertDictEqual(
+            {"a": False, "b": True, "m": True},
+            {
+                p.label.split("/")[-1]: p.stopped_early
+                for p in self.wf.run_profile.children
+            },
+            msg="Cache hits should show up as stopping early"
+        )
+
+    def test_executor(self):
+        self.wf.profile = True
+        with ThreadPoolExecutor() as exe:
+            self.wf.b.executor = exe
+            self.wf.run()
+        b_profile = self.wf.run_profile.children[
+            self.wf.provenance_by_completion.index("b")
+        ]
+        self.assertGreater(b_profile.submit, 0)
+        self.assertGreaterEqual(b_profile.queue, 0)
+        self.assertEqual(
+            0,
+            self.wf.run_profile.children[0].submit,
+            msg="Only the child with an executor submitted anything"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
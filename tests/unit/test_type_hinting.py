@@ -1,10 +1,13 @@
 import typing
 import unittest
 
+import numpy as np
+import numpy.typing as npt
 from pint import UnitRegistry
 
+from pyiron_workflow import type_hinting
 from pyiron_workflow.type_hinting import (
-    type_hint_is_as_or_more_specific_than, valid_value
+    get_validator, type_hint_is_as_or_more_specific_than, valid_value
 )
 
 
@@ -32,13 +35,58 @@ class TestTypeHinting(unittest.TestCase):
                 (typing.Callable, Bar(), Foo()),
                 (tuple[int, float], (1, 1.1), ("fo", 0)),
                 (dict[str, int], {'a': 1}, {'a': 'b'}),
-                (int, 1 * ureg.seconds, 1.0 * ureg.seconds)  # Disregard unit, look@type
+                (int, 1 * ureg.seconds, 1.0 * ureg.seconds),  # Disregard unit, look@type
+                (typing.Literal[1], 1, True),  # Equal, but a different type
+                (list[int] | None, None, [1.0]),
+                (typing.Sequence[str], ("a", "b"), (1, "a")),
+                (set[int], {1}, {"a"}),
+                (tuple[int, ...], (1, 2, 3), (1.0,)),
+                (npt.NDArray[np.floating], np.ones(3), np.arange(3)),
+                (
+                    np.ndarray[tuple[int, int], np.dtype[np.int64]],
+                    np.eye(2, dtype=np.int64),
+                    np.arange(3, dtype=np.int64),  # Wrong dimensionality
+                ),
         ):
             with self.subTest(msg=f"Good {good} vs hint {hint}"):
                 self.assertTrue(valid_value(good, hint))
             with self.subTest(msg=f"Bad {bad} vs hint {hint}"):
                 self.assertFalse(valid_value(bad, hint))
 
+    def test_collection_check(self):
+        almost_all_floats = [0.0] * 999 + ["not a float"]
+        try:
+            for strategy, passes in (
+                ("shallow", True),
+                ("first", True),
+                (10, True),
+                (1000, False),
+                ("all", False),
+            ):
+                with self.subTest(strategy=strategy):
+                    type_hinting.collection_check = strategy
+                    self.assertEqual(
+                        passes, valid_value(almost_all_floats, list[float])
+                    )
+                    self.assertEqual(
+                        passes,
+                        valid_value(dict(enumerate(almost_all_floats)), dict[int, float])
+                    )
+            type_hinting.collection_check = "shallow"
+            self.assertFalse(
+                valid_value((1.0,), list[float]),
+                msg="Shallow checks should still check the container type"
+            )
+        finally:
+            type_hinting.collection_check = "first"
+
+    def test_validator_caching(self):
+        self.assertIs(
+            get_validator(list[int]),
+            get_validator(list[int]),
+            msg="Validators should be compiled once per hint"
+        )
+
     def test_hint_comparisons(self):
         # Standard types and typing types should be interoperable
         # tuple, dict, and typing.Callable care about the exact matching of args
@@ -86,5 +134,27 @@ class TestTypeHinting(unittest.TestCase):
                 )
 
 
+    def test_hint_comparison_caching(self):
+        type_hinting._cached_hint_comparison.cache_clear()
+        type_hint_is_as_or_more_specific_than(dict[str, int], dict[str, int | float])
+        misses = type_hinting._cached_hint_comparison.cache_info().misses
+        self.assertTrue(
+            type_hint_is_as_or_more_specific_than(
+                dict[str, int], dict[str, int | float]
+            )
+        )
+        self.assertEqual(
+            misses,
+            type_hinting._cached_hint_comparison.cache_info().misses,
+            msg="Repeated comparisons should be served from the cache"
+        )
+
+        unhashable = typing.Literal[[1]]
+        self.assertTrue(
+            type_hint_is_as_or_more_specific_than(unhashable, unhashable),
+            msg="Unhashable hints should fall back to an uncached comparison"
+        )
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,15 +1,20 @@
-from concurrent.futures import Future
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from io import BytesIO
 import pickle
-from time import sleep
+from time import perf_counter, sleep
 import unittest
 
 from bidict import ValueDuplicationError
 from pyiron_snippets.dotdict import DotDict
 
 from pyiron_workflow._tests import ensure_tests_in_python_path
-from pyiron_workflow.channels import NOT_DATA
+from pyiron_workflow.channels import DataChannel, NOT_DATA
 from pyiron_workflow.mixin.semantics import ParentMostError
+from pyiron_workflow.node import Node
+from pyiron_workflow.nodes.composite import FailedChildError
 from pyiron_workflow.storage import available_backends, TypeNotFoundError
+from pyiron_workflow.topology import critical_path_priorities
 from pyiron_workflow.workflow import Workflow
 
 ensure_tests_in_python_path()
@@ -38,6 +43,13 @@ def sum(a, b):
     return a + b
 
 
+@Workflow.wrap.as_function_node("five")
+async def async_five(sleep_time=0.):
+    await asyncio.sleep(sleep_time)
+    five = 5
+    return five
+
+
 class TestWorkflow(unittest.TestCase):
 
     def test_io(self):
@@ -48,8 +60,10 @@ class TestWorkflow(unittest.TestCase):
 
         inp = wf.inputs
         inp_again = wf.inputs
-        self.assertIsNot(
-            inp, inp_again, msg="Workflow input should always get rebuilt"
+        self.assertIs(
+            inp,
+            inp_again,
+            msg="Workflow input should only get rebuilt when the graph changes"
         )
 
         n_in = len(wf.inputs)
@@ -172,6 +186,48 @@ class TestWorkflow(unittest.TestCase):
                 msg="No IO should be left exposed"
             )
 
+    def test_io_caching(self):
+        wf = Workflow("wf")
+        wf.n1 = wf.create.function_node(plus_one)
+        wf.n2 = wf.create.function_node(plus_one)
+        self.assertListEqual(["n1__x", "n2__x"], wf.inputs.labels)
+
+        wf.n2.inputs.x = wf.n1.outputs.y
+        self.assertListEqual(
+            ["n1__x"], wf.inputs.labels, msg="Connections should invalidate the cache"
+        )
+        wf.n2.inputs.x.disconnect_all()
+        self.assertListEqual(["n1__x", "n2__x"], wf.inputs.labels)
+
+        wf.inputs_map = {"n1__x": "x"}
+        self.assertListEqual(["x", "n2__x"], wf.inputs.labels)
+        wf.inputs_map["n2__x"] = "x2"
+        self.assertListEqual(
+            ["x", "x2"], wf.inputs.labels, msg="In-place map edits should be caught"
+        )
+
+        wf.n3 = wf.create.function_node(plus_one)
+        self.assertIn("n3__y", wf.outputs.labels, msg="New children should appear")
+        wf.remove_child(wf.n3)
+        self.assertNotIn("n3__y", wf.outputs.labels)
+
+        wf.replace_child(wf.n1, wf.create.function_node(plus_one))
+        self.assertIs(
+            wf.n1.inputs.x,
+            wf.inputs.x,
+            msg="Replacement should invalidate the cache"
+        )
+
+        wf.n2.pull()
+        self.assertCountEqual(
+            ["n1__y", "n2__y"],
+            wf.outputs.labels,
+            msg="Pulling should leave the IO intact"
+        )
+
+        reloaded = pickle.loads(pickle.dumps(wf))
+        self.assertIs(reloaded.n1.inputs.x, reloaded.inputs.x)
+
     def test_is_parentmost(self):
         wf = Workflow("wf")
         wf2 = Workflow("wf2")
@@ -277,6 +333,221 @@ class TestWorkflow(unittest.TestCase):
 
         wf.executor_shutdown()
 
+    def test_scheduler(self):
+        t_sleep = 0.5
+        n_wide = 4
+
+        def build():
+            wf = Workflow("wide")
+            for i in range(n_wide):
+                wf.add_child(five(sleep_time=t_sleep), label=f"five{i}")
+            wf.total = wf.five0 + wf.five1 + wf.five2 + wf.five3
+            wf.use_cache = False
+            wf.recovery = None  # Some runs fail on purpose, and we don't want a file
+            return wf
+
+        with self.subTest("Worker count"):
+            wf = build()
+            wf.scheduler = n_wide
+            t_start = perf_counter()
+            out = wf.run()
+            dt = perf_counter() - t_start
+            self.assertEqual(5 * n_wide, out.total__add)
+            self.assertLess(
+                dt,
+                1.5 * t_sleep,
+                msg="Independent children should run concurrently"
+            )
+            self.assertTrue(
+                all(child.executor is None for child in wf),
+                msg="The scheduler should only be lent to children during the run"
+            )
+
+        with self.subTest("Executor instance"):
+            wf = build()
+            own_executor = (ThreadPoolExecutor, (), {})
+            wf.five0.executor = own_executor
+            with ThreadPoolExecutor(max_workers=n_wide) as exe:
+                wf.scheduler = exe
+                wf.run()
+                wf.run()  # Our executor should not have gotten shut down
+                self.assertIsNone(
+                    pickle.loads(pickle.dumps(wf)).scheduler,
+                    msg="Executor instances can't be serialized"
+                )
+            self.assertIs(
+                own_executor,
+                wf.five0.executor,
+                msg="Children with their own executor should keep using it"
+            )
+
+        with self.subTest("Run shortcut"):
+            for mode, run in [
+                ("run", lambda wf: wf.run(max_workers=n_wide)),
+                ("arun", lambda wf: asyncio.run(wf.arun(max_workers=n_wide))),
+            ]:
+                wf = build()
+                t_start = perf_counter()
+                run(wf)
+                self.assertLess(perf_counter() - t_start, 1.5 * t_sleep, msg=mode)
+                self.assertIsNone(
+                    wf.scheduler, msg=f"The shortcut should only be temporary ({mode})"
+                )
+
+        with self.subTest("Capacity"):
+            for mode, run in [
+                ("run", lambda wf: wf.run()),
+                ("arun", lambda wf: asyncio.run(wf.arun())),
+            ]:
+                wf = build()
+                wf.scheduler = 2
+                n_running = []
+                register_child_starting = wf.register_child_starting
+
+                def register_and_count(child):
+                    register_child_starting(child)
+                    n_running.append(len(wf.running_children))
+
+                wf.register_child_starting = register_and_count
+                self.assertEqual(5 * n_wide, run(wf).total__add)
+                self.assertEqual(
+                    2,
+                    max(n_running),
+                    msg=f"No more children than workers should be started at once "
+                        f"({mode})"
+                )
+
+        with self.subTest("Invalid"):
+            wf = build()
+            wf.scheduler = 0
+            with self.assertRaises(ValueError):
+                wf.run()
+
+    def test_scheduler_failure(self):
+        wf = Workflow("wf")
+        wf.ok = five()
+        wf.bad = wf.create.function_node(plus_one, x="not a number")
+        wf.recovery = None  # We fail on purpose, and don't want a file
+        wf.scheduler = 2
+        with self.assertRaises(
+            FailedChildError,
+            msg="Exceptions on the scheduler should not pass silently"
+        ):
+            wf.run()
+        self.assertEqual(5, wf.ok.outputs.five.value)
+        self.assertTrue(wf.bad.failed)
+
+    def test_arun(self):
+        t = 0.25
+        wf = Workflow("wf")
+        wf.a = async_five(sleep_time=t)
+        wf.b = async_five(sleep_time=t)
+        wf.c = async_five(sleep_time=t)
+        wf.sum = sum(wf.a, wf.b)
+        wf.after = async_five(sleep_time=wf.sum.outputs.sum * 0)
+
+        t0 = perf_counter()
+        out = asyncio.run(wf.arun())
+        dt = perf_counter() - t0
+        self.assertDictEqual(
+            {"c__five": 5, "after__five": 5},
+            out,
+            msg="Awaiting should give the same output as running"
+        )
+        self.assertLess(
+            dt,
+            2 * t,
+            msg="Awaiting nodes should run concurrently on the event loop"
+        )
+        self.assertTrue(
+            all(child.executor is None for child in wf),
+            msg="The event loop executor should only be lent for the run"
+        )
+
+        wf.use_cache = False
+        for node in wf:
+            node.use_cache = False
+        t0 = perf_counter()
+        wf.run()
+        self.assertGreater(
+            perf_counter() - t0,
+            3 * t,
+            msg="Async node functions still work synchronously, just not concurrently"
+        )
+
+        wf.bad = wf.create.function_node(plus_one, x="not a number")
+        wf.recovery = None  # We fail on purpose, and don't want a file
+        with self.assertRaises(
+            FailedChildError,
+            msg="Exceptions in tasks should not pass silently"
+        ):
+            asyncio.run(wf.arun())
+        self.assertTrue(wf.bad.failed)
+
+    def test_critical_path_first(self):
+        def make_workflow():
+            wf = Workflow("wf")
+            for i in range(3):
+                wf.add_child(wf.create.function_node(plus_one), label=f"cheap{i}")
+            wf.chain0 = wf.create.function_node(plus_one)
+            wf.chain1 = wf.create.function_node(plus_one, x=wf.chain0)
+            wf.chain2 = wf.create.function_node(plus_one, x=wf.chain1)
+            wf.use_cache = False
+            return wf
+
+        wf = make_workflow()
+
+        priorities = critical_path_priorities(wf.children)
+        self.assertDictEqual(
+            {
+                "cheap0": 1, "cheap1": 1, "cheap2": 1,
+                "chain0": 3, "chain1": 2, "chain2": 1,
+            },
+            priorities,
+            msg="Without durations, priority is the longest path downstream"
+        )
+        weighted = critical_path_priorities(
+            wf.children,
+            durations={"cheap1": 10., "chain0": 1., "chain1": 1., "chain2": 1.},
+        )
+        self.assertGreater(
+            weighted["cheap1"],
+            weighted["chain0"],
+            msg="Known durations should weight the path"
+        )
+        self.assertAlmostEqual(
+            13 / 4,
+            weighted["cheap0"],
+            msg="Unknown durations should be assumed average"
+        )
+
+        wf.run(max_workers=1)
+        self.assertListEqual(
+            ["chain0", "chain1"],
+            wf.provenance_by_execution[:2],
+            msg="With limited workers, the critical path should get dispatched first, "
+                "even though the cheap nodes were added first"
+        )
+        self.assertEqual(
+            "chain2",
+            wf.provenance_by_execution[-1],
+            msg="Once its remaining length ties with the others, the path end should "
+                "queue behind the cheap nodes that were already waiting"
+        )
+        self.assertTrue(
+            all(child.run_duration is not None for child in wf),
+            msg="Run durations should be recorded to inform priorities next time"
+        )
+
+        unscheduled = make_workflow()
+        unscheduled.run()
+        wf.run()
+        self.assertListEqual(
+            unscheduled.provenance_by_execution,
+            wf.provenance_by_execution,
+            msg="Without a scheduler, the execution order should be unchanged"
+        )
+
     def test_call(self):
         wf = Workflow("wf")
 
@@ -399,6 +670,37 @@ class TestWorkflow(unittest.TestCase):
             with self.assertRaises(ValueError):
                 cyclic()
 
+    def test_execution_plan_caching(self):
+        wf = Workflow("plan")
+        wf.a = wf.create.function_node(plus_one)
+        wf.b = wf.create.function_node(plus_one, x=wf.a)
+        wf.c = wf.create.function_node(plus_one)
+
+        wf.run()
+        plan = wf._execution_plan
+        self.assertCountEqual(["a", "c"], plan.starting_labels)
+        wf.run(a__x=1)
+        self.assertIs(
+            plan, wf._execution_plan, msg="Unchanged graphs should re-use their plan"
+        )
+
+        wf.c.inputs.x = wf.b
+        self.assertDictEqual({"c__y": 4}, wf.run(a__x=1))
+        self.assertIsNot(plan, wf._execution_plan, msg="New connections need a plan")
+        self.assertTupleEqual(("a",), wf._execution_plan.starting_labels)
+
+        plan = wf._execution_plan
+        wf.b >> wf.a  # Tamper with the automated signals
+        wf.run()
+        self.assertIsNot(plan, wf._execution_plan, msg="Signal changes need a plan")
+        self.assertNotIn(wf.b.signals.output.ran, wf.a.signals.input.run)
+
+        plan = wf._execution_plan
+        wf.d = wf.create.function_node(plus_one)
+        wf.run()
+        self.assertIsNot(plan, wf._execution_plan, msg="New children need a plan")
+        self.assertIn(wf.d, wf.starting_nodes)
+
     def test_pull_and_executors(self):
         @Workflow.wrap.as_macro_node("three__result")
         def add_three_macro(self, one__x):
@@ -419,25 +721,71 @@ class TestWorkflow(unittest.TestCase):
         )
 
         wf.m.one.executor = wf.create.ProcessPoolExecutor()
-        with self.assertRaises(
-            ValueError,
-            msg="Should not be able to pull with executor in local scope"
-        ):
-            wf.m.two.pull()
-            wf.m.one.executor_shutdown()  # Shouldn't get this far, but if so, shutdown
-        wf.m.one.executor = None
-
         wf.n1.executor = wf.create.ProcessPoolExecutor()
-        with self.assertRaises(
-            ValueError,
-            msg="Should not be able to pull with executor in parent scope"
-        ):
-            wf.m.two.pull(run_parent_trees_too=True)
-
-        # Pulling in the local scope should be fine with an executor only in the parent
-        # scope
-        wf.m.two.pull(run_parent_trees_too=False)
-        wf.executor_shutdown()
+        wf.n1.inputs.x = 1
+        try:
+            self.assertEqual(
+                (1 + 1) + (1 + 1),
+                wf.m.two.pull(run_parent_trees_too=True),
+                msg="Pulling should work with executors, in both scopes"
+            )
+        finally:
+            wf.executor_shutdown()
+
+    def test_parallel_pull(self):
+        wf = Workflow("parallel_pull")
+        wf.a = wf.create.standard.Sleep(0.2)
+        wf.b = wf.create.standard.Sleep(0.2)
+        wf.total = wf.a + wf.b
+        wf.use_cache = False
+        for node in wf:
+            node.use_cache = False
+        wf.total >> wf.a  # Unrelated signals, which pulling shouldn't touch
+        signals = wf._child_signal_connections
+        labels = list(wf.children.keys())
+
+        wf.scheduler = 2
+        t0 = perf_counter()
+        self.assertAlmostEqual(0.4, wf.total.pull())
+        self.assertLess(
+            perf_counter() - t0,
+            0.35,
+            msg="Independent branches should run concurrently on the scheduler"
+        )
+        self.assertListEqual(signals, wf._child_signal_connections)
+        self.assertListEqual(labels, list(wf.children.keys()))
+        self.assertTrue(
+            all(node.executor is None for node in wf),
+            msg="The scheduler should only be lent for the pull"
+        )
+
+    def test_pull_failure(self):
+        @Workflow.wrap.as_function_node("y")
+        def Fail(x):
+            if x == 0:
+                raise RuntimeError("upstream failure")
+            y = x
+            return y
+
+        wf = Workflow("pull_failure")
+        wf.bad = Fail(0)
+        wf.after = PlusOne(wf.bad)
+        wf.slow = async_five(0.1)
+        wf.last = sum(wf.after, wf.slow)
+
+        with self.assertRaises(RuntimeError, msg="The original error should surface"):
+            wf.last.pull()
+        self.assertTrue(wf.bad.failed)
+        self.assertFalse(
+            wf.after.running or wf.after.failed,
+            msg="Nodes downstream of the failure should be cancelled before running"
+        )
+        self.assertIs(NOT_DATA, wf.after.outputs.y.value)
+        self.assertEqual(
+            5,
+            wf.slow.outputs.five.value,
+            msg="Independent branches should still be allowed to finish"
+        )
 
     def test_storage_values(self):
         for backend in available_backends():
@@ -513,6 +861,82 @@ class TestWorkflow(unittest.TestCase):
             msg="Pickling should work"
         )
 
+    def test_pickle_older_state(self):
+        # Attributes that nodes and channels have gained over time, and which are thus
+        # missing from the state of anything pickled before they existed
+        newer_attributes = (
+            "_semantic_path",
+            "run_duration",
+            "_run_start_time",
+            "profile",
+            "run_profile",
+            "_run_profile_draft",
+            "_cached_input_fingerprint",
+            "_persistent_cache_key",
+            "_mapped_arrays",
+            "scheduler",
+            "_child_profiles",
+            "_topology_version",
+            "_execution_plan",
+            "_label_suffix_counters",
+            "_inputs_map_snapshot",
+            "_outputs_map_snapshot",
+            "vectorize",
+            "_chunksize",
+            "_validator",
+            "_validator_hint",
+            "_validated_value",
+            "_validated_hint",
+            "_validated_collection_check",
+        )
+
+        class OlderStatePickler(pickle.Pickler):
+            def reducer_override(self, obj):
+                if isinstance(obj, (Node, DataChannel)):
+                    constructor, args, state, *rest = obj.__reduce_ex__(pickle.DEFAULT_PROTOCOL)
+                    for attribute in newer_attributes:
+                        state.pop(attribute, None)
+                    return constructor, args, state, *rest
+                return NotImplemented
+
+        wf = Workflow("wf")
+        wf.inp = demo_nodes.AddThree(x=0)
+        wf.out = wf.inp.outputs.add_three + 1
+        wf.loop = demo_nodes.AddThree.for_node(
+            iter_on="x", x=[1, 2], output_as_dataframe=False
+        )
+        wf_out = wf()
+
+        buffer = BytesIO()
+        OlderStatePickler(buffer).dump(wf)
+        reloaded = pickle.loads(buffer.getvalue())
+
+        self.assertDictEqual(
+            wf_out,
+            reloaded.outputs.to_value_dict(),
+            msg="States from before the newer attributes existed should still load"
+        )
+        self.assertEqual("/wf/inp/one", reloaded.inp.one.semantic_path)
+        self.assertFalse(
+            reloaded.inp.cache_hit,
+            msg="Without a fingerprint to compare to, there can be no cache hit"
+        )
+        self.assertDictEqual(
+            {
+                "out__add": 1 + 3 + 1,
+                "loop__x": [2, 3],
+                "loop__add_three": [2 + 3, 3 + 3],
+            },
+            reloaded.run(inp__x=1, loop__x=[2, 3]),
+            msg="Loaded older states should be able to run again"
+        )
+        reloaded.add_child(PlusOne(), label="out", strict_naming=False)
+        self.assertIn(
+            "out0",
+            reloaded.child_labels,
+            msg="Label suffixes should be found without stored suffix counters"
+        )
+
 
 if __name__ == '__main__':
     unittest.main()